@@ -5,12 +5,42 @@ Calculates acoustic properties of the audio channel (Noise Floor, SNR)
 to allow sensors to adapt their thresholds in real-time.
 """
 
+import math
 import numpy as np
 import logging
-from typing import Dict, Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Energy-profile framing
+FRAME_SECONDS = 0.02  # 20ms
+HOP_SECONDS = 0.01    # 10ms
+
+
+def _percentiles_db(mean_squares: np.ndarray, percentiles: Sequence[float]) -> list:
+    """
+    np.percentile of 20*log10(rms + 1e-10) without converting every frame to dB.
+
+    dB is monotonic in mean-square energy, so the order statistics needed for
+    linear interpolation are selected with np.partition (O(N)) on the raw
+    mean-squares and only those few values are converted to dB.
+    """
+    n = len(mean_squares)
+    positions = [q / 100.0 * (n - 1) for q in percentiles]
+    kth = sorted({int(np.floor(p)) for p in positions} | {int(np.ceil(p)) for p in positions})
+    selected = np.partition(mean_squares, kth)
+
+    results = []
+    for pos in positions:
+        lo, hi = int(np.floor(pos)), int(np.ceil(pos))
+        # Python-scalar math avoids ufunc dispatch for these few values
+        db_lo = 20 * math.log10(math.sqrt(float(selected[lo])) + 1e-10)
+        db_hi = 20 * math.log10(math.sqrt(float(selected[hi])) + 1e-10)
+        results.append(db_lo + (db_hi - db_lo) * (pos - lo))
+    return results
+
+
 class EnvironmentAnalyzer:
     """
     Analyzes audio environment characteristics.
@@ -30,37 +60,41 @@ class EnvironmentAnalyzer:
         """
         if len(audio) == 0:
             return {"noise_floor_db": -90.0, "snr_db": 100.0, "is_noisy": False}
-            
+        
         # Calculate RMS energy profile
         # Use small frames to track energy envelope
-        frame_len = int(0.02 * sr) # 20ms
-        hop_len = int(0.01 * sr)   # 10ms
+        frame_len = int(FRAME_SECONDS * sr)
+        hop_len = int(HOP_SECONDS * sr)
         
         if len(audio) < frame_len:
              # Too short, assume clean
              return {"noise_floor_db": -90.0, "snr_db": 100.0, "is_noisy": False}
         
-        # Simple manual framing to avoid dependency on librosa if not needed
-        # But we can use np.lib.stride_tricks or simple loop
-        num_frames = (len(audio) - frame_len) // hop_len + 1
-        rms_values = []
+        # Framed view (no copy); einsum sums squares without a frames**2 temporary
+        frames = sliding_window_view(audio, frame_len)[::hop_len]
+        mean_squares = np.einsum('ij,ij->i', frames, frames) * (1.0 / frame_len)
+        return EnvironmentAnalyzer.from_mean_squares(mean_squares)
+    
+    @staticmethod
+    def from_mean_squares(mean_squares: np.ndarray) -> Dict[str, float]:
+        """
+        Calculate environmental metrics from precomputed frame energies.
         
-        for i in range(num_frames):
-            frame = audio[i*hop_len : i*hop_len + frame_len]
-            rms = np.sqrt(np.mean(frame**2))
-            rms_values.append(rms)
-            
-        rms_values = np.array(rms_values)
-        rms_db = 20 * np.log10(rms_values + 1e-10)
+        Lets callers that already framed the audio (FRAME_SECONDS frames,
+        HOP_SECONDS hop) skip a second pass over the samples.
         
+        Args:
+            mean_squares: Per-frame mean-square energy (non-empty)
+            
+        Returns:
+            Same dictionary as analyze()
+        """
         # Noise Floor Estimation
         # Assumption: The quietest 10% of frames represent the background noise
         # This works for speech which has pauses
-        noise_floor_db = np.percentile(rms_db, 10)
-        
         # Peak Signal Estimation
         # The loudest 95% represents the speech peak (ignoring outliers)
-        peak_signal_db = np.percentile(rms_db, 95)
+        noise_floor_db, peak_signal_db = _percentiles_db(mean_squares, (10, 95))
         
         # SNR
         snr_db = peak_signal_db - noise_floor_db
@@ -24,7 +24,13 @@ Usage:
     result = pipeline.detect("audio.wav", quick_mode=True)
 """
 
-from .pipeline import DetectionPipeline, DetectionJob, JobStatus, get_pipeline
+from .pipeline import (
+    DetectionPipeline,
+    DetectionJob,
+    JobStatus,
+    get_pipeline,
+    get_shared_pipeline,
+)
 from .config import DetectionConfig, get_default_config
 from .utils import convert_numpy_types, load_audio, preprocess_audio
 
@@ -33,6 +39,7 @@ __all__ = [
     "DetectionJob",
     "JobStatus",
     "get_pipeline",
+    "get_shared_pipeline",
     "DetectionConfig",
     "get_default_config",
     "convert_numpy_types",
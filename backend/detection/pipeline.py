@@ -4,6 +4,7 @@ Detection Pipeline Orchestrator
 Main orchestrator for the 6-stage audio deepfake detection pipeline.
 """
 
+import functools
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -450,3 +451,22 @@ def get_pipeline() -> DetectionPipeline:
     if _pipeline_instance is None:
         _pipeline_instance = DetectionPipeline()
     return _pipeline_instance
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_pipeline(demo_mode: bool = False) -> DetectionPipeline:
+    """
+    Get a process-wide pipeline built from the default config.
+
+    Scripts that repeatedly need a fully configured pipeline share one
+    instance per demo_mode instead of reloading models on every call.
+
+    Args:
+        demo_mode: Override for the config's demo_mode flag
+
+    Returns:
+        Cached DetectionPipeline instance
+    """
+    cfg = get_default_config()
+    cfg.demo_mode = demo_mode
+    return DetectionPipeline(config=cfg)
@@ -7,13 +7,103 @@ Implements a GMM-based classifier for audio deepfake detection.
 import numpy as np
 from sklearn.mixture import GaussianMixture
 from sklearn.preprocessing import StandardScaler
-import pickle
+import joblib
 import logging
 from pathlib import Path
 from typing import Optional
 
+# JIT-compiled GMM scoring when numba is available, vectorized numpy otherwise
+from backend.sensors.jit import NUMBA_AVAILABLE, njit, prange
+
 logger = logging.getLogger(__name__)
 
+_LOG_2PI = np.log(2.0 * np.pi)
+
+
+def _gmm_score_samples_numpy(X: np.ndarray, means: np.ndarray, prec_chol: np.ndarray,
+                             log_weights: np.ndarray) -> np.ndarray:
+    """
+    Per-frame log-likelihood of a diagonal-covariance GMM (numpy fallback).
+
+    Equivalent to sklearn's GaussianMixture.score_samples for covariance_type='diag'.
+    """
+    n_features = X.shape[1]
+    log_det = np.sum(np.log(prec_chol), axis=1)
+    precisions = prec_chol ** 2
+    # (n_frames, n_components) Mahalanobis distances without a 3-D temporary
+    dist = (np.sum(means ** 2 * precisions, axis=1)
+            - 2.0 * X @ (means * precisions).T
+            + (X ** 2) @ precisions.T)
+    log_prob = -0.5 * (n_features * _LOG_2PI + dist) + log_det
+    weighted = log_prob + log_weights
+    # Log-sum-exp over components
+    max_w = np.max(weighted, axis=1, keepdims=True)
+    return (max_w[:, 0] + np.log(np.sum(np.exp(weighted - max_w), axis=1)))
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _gmm_score_samples_numba(X, means, prec_chol, log_weights):
+        """Per-frame log-likelihood of a diagonal-covariance GMM (JIT-compiled)."""
+        n_frames, n_features = X.shape
+        n_components = means.shape[0]
+
+        log_det = np.empty(n_components)
+        for k in range(n_components):
+            acc = 0.0
+            for d in range(n_features):
+                acc += np.log(prec_chol[k, d])
+            log_det[k] = acc
+
+        const = -0.5 * n_features * np.log(2.0 * np.pi)
+        out = np.empty(n_frames)
+        for i in prange(n_frames):
+            weighted = np.empty(n_components)
+            max_w = -np.inf
+            for k in range(n_components):
+                dist = 0.0
+                for d in range(n_features):
+                    z = (X[i, d] - means[k, d]) * prec_chol[k, d]
+                    dist += z * z
+                w = const - 0.5 * dist + log_det[k] + log_weights[k]
+                weighted[k] = w
+                if w > max_w:
+                    max_w = w
+            acc = 0.0
+            for k in range(n_components):
+                acc += np.exp(weighted[k] - max_w)
+            out[i] = max_w + np.log(acc)
+        return out
+else:
+    _gmm_score_samples_numba = None
+
+
+def gmm_score_samples(gmm: GaussianMixture, X: np.ndarray) -> np.ndarray:
+    """
+    Compute per-frame log-likelihoods for a fitted diagonal GaussianMixture.
+
+    Uses the numba kernel when available, otherwise a vectorized numpy path.
+    Non-diagonal mixtures are delegated to sklearn.
+
+    Args:
+        gmm: Fitted GaussianMixture
+        X: Normalized features (frames x features)
+
+    Returns:
+        Log-likelihood per frame
+    """
+    if gmm.covariance_type != 'diag':
+        return gmm.score_samples(X)
+
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    means = np.ascontiguousarray(gmm.means_, dtype=np.float64)
+    prec_chol = np.ascontiguousarray(gmm.precisions_cholesky_, dtype=np.float64)
+    log_weights = np.log(gmm.weights_)
+
+    if NUMBA_AVAILABLE:
+        return _gmm_score_samples_numba(X, means, prec_chol, log_weights)
+    return _gmm_score_samples_numpy(X, means, prec_chol, log_weights)
+
 
 class GMMSpoofDetector:
     """GMM-based spoof detector"""
@@ -93,8 +183,8 @@ class GMMSpoofDetector:
         features_norm = self.scaler.transform(features)
 
         # Compute log-likelihoods
-        ll_genuine = self.gmm_genuine.score_samples(features_norm)
-        ll_spoof = self.gmm_spoof.score_samples(features_norm)
+        ll_genuine = gmm_score_samples(self.gmm_genuine, features_norm)
+        ll_spoof = gmm_score_samples(self.gmm_spoof, features_norm)
 
         # Average across frames
         avg_ll_genuine = np.mean(ll_genuine)
@@ -142,8 +232,8 @@ class GMMSpoofDetector:
             'is_trained': self.is_trained
         }
 
-        with open(model_path, 'wb') as f:
-            pickle.dump(model_data, f)
+        # Uncompressed so load() can memory-map the component arrays
+        joblib.dump(model_data, model_path)
 
         logger.info(f"Model saved to {model_path}")
 
@@ -151,11 +241,14 @@ class GMMSpoofDetector:
         """
         Load trained model
 
+        Numpy arrays are memory-mapped read-only, so processes loading the
+        same model share its pages. Plain pickle files from older saves are
+        still readable.
+
         Args:
             model_path: Path to model file
         """
-        with open(model_path, 'rb') as f:
-            model_data = pickle.load(f)
+        model_data = joblib.load(model_path, mmap_mode='r')
 
         self.gmm_genuine = model_data['gmm_genuine']
         self.gmm_spoof = model_data['gmm_spoof']
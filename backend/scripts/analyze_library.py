@@ -12,13 +12,13 @@ import argparse
 import logging
 import json
 from pathlib import Path
-from tqdm import tqdm
 
 # Add parent to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from backend.detection import get_pipeline, convert_numpy_types
+from backend.detection import get_shared_pipeline, convert_numpy_types
 from backend.sensors.utils import load_and_preprocess_audio
+from backend.scripts.progress_utils import make_progress
 
 # Configure logging
 logging.basicConfig(
@@ -51,25 +51,18 @@ def analyze_directory(label: str, force: bool = False):
     logger.info(f"Found {len(files)} files in {label} library.")
     
     # Initialize pipeline with explicit PROD mode (disable demo)
-    from backend.detection.config import get_default_config
-    from backend.detection.pipeline import DetectionPipeline
+    pipeline = get_shared_pipeline(demo_mode=False)  # CRITICAL: Force real analysis
     
-    cfg = get_default_config()
-    cfg.demo_mode = False  # CRITICAL: Force real analysis
-    pipeline = DetectionPipeline(config=cfg)
-    
-    for file_path in tqdm(files, desc=f"Analyzing {label}"):
+    progress = make_progress(files, desc=f"Analyzing {label}")
+    for file_path in progress:
         result_path = file_path.with_suffix(".json")
         
         if result_path.exists() and not force:
             continue
             
         try:
-            # Load and preprocess
-            with open(file_path, "rb") as f:
-                import io
-                audio_io = io.BytesIO(f.read())
-                audio_array, sr = load_and_preprocess_audio(audio_io)
+            # Load and preprocess (decoded straight from disk)
+            audio_array, sr = load_and_preprocess_audio(file_path)
             
             # Run pipeline
             result = pipeline.detect(audio_array, quick_mode=False)
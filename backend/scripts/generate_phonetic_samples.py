@@ -12,12 +12,19 @@ Usage:
 """
 
 import argparse
+import asyncio
 import logging
 import json
 import time
 from pathlib import Path
 from typing import List, Dict
-from tts_utils import load_env_file, check_tts_dependencies, generate_elevenlabs, generate_openai
+from tts_utils import (
+    load_env_file,
+    check_tts_dependencies,
+    generate_elevenlabs,
+    generate_openai,
+    generate_batch,
+)
 # Configure logging first
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("phonetic_generator")
@@ -273,6 +280,12 @@ Examples:
         default="alloy",
         help="OpenAI voice (default: alloy)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Concurrent API requests; >1 generates each service's batch asynchronously (default: 1)"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -342,6 +355,32 @@ Examples:
         # Shuffle phrases for variety
         selected_phrases = random.sample(phrases, min(needed, len(phrases)))
         
+        if args.concurrency > 1:
+            batch_stamp = int(time.time() * 1000)
+            filenames = [
+                output_dir / f"{service}_phonetic_{batch_stamp}_{i}.mp3"
+                for i in range(1, len(selected_phrases) + 1)
+            ]
+            logger.info(f"Generating {len(filenames)} samples with concurrency={args.concurrency}")
+            outcomes = asyncio.run(generate_batch(
+                selected_phrases,
+                [str(f) for f in filenames],
+                service=service,
+                concurrency=args.concurrency,
+                voice_id=args.voice_id,
+                voice=args.openai_voice,
+            ))
+            for phrase, filename, success in zip(selected_phrases, filenames, outcomes):
+                if success:
+                    save_metadata(filename, phrase, service, coverage_info)
+                    total_generated += 1
+                else:
+                    total_failed += 1
+                    logger.warning(f"  ✗ Failed: {filename.name}")
+                    if filename.exists():
+                        filename.unlink()
+            continue
+        
         for i, phrase in enumerate(selected_phrases, 1):
             timestamp = int(time.time() * 1000)  # Use milliseconds for uniqueness
             filename = output_dir / f"{service}_phonetic_{timestamp}_{i}.mp3"
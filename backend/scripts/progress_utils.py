@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Progress Utilities
+
+Shared progress-bar settings for the batch detection scripts.
+Used by analyze_library.py, run_micro_test.py and test_synthetic_batch.py.
+"""
+
+from typing import Iterable
+
+from tqdm import tqdm
+
+# Redraw at most about once a second (and at least every 5s), or every 0.5% of items
+MIN_REDRAW_INTERVAL_S = 1.0
+MAX_REDRAW_INTERVAL_S = 5.0
+REDRAW_STEPS = 200
+
+
+def make_progress(iterable: Iterable, **kwargs) -> tqdm:
+    """
+    Wrap iterable in a tqdm bar with throttled redraws.
+
+    Throttling keeps the progress bar off the detection hot path. Extra
+    keyword arguments (desc, unit, ...) are passed through to tqdm.
+    """
+    total = kwargs.get("total")
+    if total is None and hasattr(iterable, "__len__"):
+        total = len(iterable)
+    kwargs.setdefault("mininterval", MIN_REDRAW_INTERVAL_S)
+    kwargs.setdefault("maxinterval", MAX_REDRAW_INTERVAL_S)
+    kwargs.setdefault("miniters", max(1, (total or 0) // REDRAW_STEPS))
+    return tqdm(iterable, **kwargs)
@@ -9,9 +9,12 @@ Useful for quick verification of calibration changes.
 
 import sys
 import argparse
+import hashlib
 import logging
 import json
 import random
+import shelve
+from contextlib import nullcontext
 from pathlib import Path
 from tqdm import tqdm
 import numpy as np
@@ -24,8 +27,9 @@ sys.path.append(str(root_dir))
 # Load environment variables
 load_dotenv(root_dir / ".env")
 
-from backend.detection import get_pipeline, convert_numpy_types
+from backend.detection import get_shared_pipeline, convert_numpy_types
 from backend.sensors.utils import load_and_preprocess_audio
+from backend.scripts.progress_utils import make_progress
 from backend.utils.config import load_settings
 
 # Configure logging
@@ -42,6 +46,36 @@ logger = logging.getLogger("micro_test")
 logging.getLogger("backend.detection").setLevel(logging.WARNING)
 
 LIBRARY_DIR = Path("backend/data/library")
+JSON_HASH_DB = Path(".cache/json_hashes")
+
+
+# Per-run metadata that changes on every detection; ignored when comparing results
+VOLATILE_RESULT_KEYS = ("job_id", "timestamp")
+
+
+def _payload_digest(payload: dict) -> str:
+    """Digest of a canonical JSON dump, used to skip unchanged rewrites."""
+    stable = {k: v for k, v in payload.items() if k not in VOLATILE_RESULT_KEYS}
+    canonical = json.dumps(stable, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _json_record(json_path: Path, digest: str) -> tuple:
+    """Digest plus the file's mtime and size, so rewrites by other tools are noticed."""
+    stat = json_path.stat()
+    return (digest, stat.st_mtime_ns, stat.st_size)
+
+
+def _json_is_current(json_hashes, json_path: Path, digest: str) -> bool:
+    """Whether json_path is still the file this script last wrote with this digest."""
+    record = json_hashes.get(str(json_path))
+    if record is None:
+        return False
+    try:
+        return record == _json_record(json_path, digest)
+    except OSError:
+        return False
+
 
 def get_files(label: str, count: int) -> list[Path]:
     """Get random subset of files from library."""
@@ -67,6 +101,24 @@ def get_files(label: str, count: int) -> list[Path]:
     
     return random.sample(all_files, count)
 
+def debug_context(res: dict) -> dict:
+    """Extract stage breakdown, pitch velocity and explanation from a detection result."""
+    breakdown = res.get("stage_scores")
+    if breakdown is None:
+        breakdown = res.get("fusion_result", {}).get("stage_scores", {})
+    
+    sensor_results = (
+        res.get("stage_results", {}).get("physics_analysis", {}).get("sensor_results") or {}
+    )
+    pv = sensor_results.get("Pitch Velocity Sensor") or {}
+    pitch_vel = pv.get("score") or pv.get("value", 0.0)
+    
+    return {
+        "breakdown": breakdown,
+        "pitch_vel": pitch_vel,
+        "explanation": res.get("explanation", ""),
+    }
+
 def run_test(count: int, update_library: bool = False):
     """Run the micro test."""
     print(f"============================================================")
@@ -83,12 +135,7 @@ def run_test(count: int, update_library: bool = False):
     random.shuffle(test_set)
     
     # Initialize pipeline
-    from backend.detection.config import get_default_config
-    from backend.detection.pipeline import DetectionPipeline
-    
-    cfg = get_default_config()
-    cfg.demo_mode = False
-    pipeline = DetectionPipeline(config=cfg)
+    pipeline = get_shared_pipeline(demo_mode=False)
     
     results = {
         "TP": 0, "TN": 0, "FP": 0, "FN": 0,
@@ -97,65 +144,63 @@ def run_test(count: int, update_library: bool = False):
     
     details = []
     
-    print("\nRunning analysis...")
-    for file_path, is_synthetic in tqdm(test_set, unit="file"):
-        try:
-            # Detect directly from path to allow pipeline's loading fallbacks
-            res = pipeline.detect(str(file_path), quick_mode=False)
+    # Digests of previously written library JSON, so --update only rewrites changes
+    if update_library:
+        JSON_HASH_DB.parent.mkdir(parents=True, exist_ok=True)
+    json_store = shelve.open(str(JSON_HASH_DB)) if update_library else nullcontext()
+    
+    with json_store as json_hashes:
+        print("\nRunning analysis...")
+        progress = make_progress(test_set, unit="file")
+        for file_path, is_synthetic in progress:
+            try:
+                # Detect directly from path to allow pipeline's loading fallbacks
+                res = pipeline.detect(str(file_path), quick_mode=False)
             
-            # Check correctness
-            # The pipeline returns "is_spoof" (bool) and "detection_score" (float)
-            detected_spoof = res.get("is_spoof", False)
-            decision = res.get("decision", "UNKNOWN")
-            score = res.get("detection_score", 0.0)
+                # Check correctness
+                # The pipeline returns "is_spoof" (bool) and "detection_score" (float)
+                detected_spoof = res.get("is_spoof", False)
+                decision = res.get("decision", "UNKNOWN")
+                score = res.get("detection_score", 0.0)
             
-            # Extract Pitch Velocity for debug context
-            pitch_vel = 0.0
-            breakdown = {}
-            if "stage_scores" in res:
-                breakdown = res["stage_scores"]
-            elif "fusion_result" in res and "stage_scores" in res["fusion_result"]:
-                breakdown = res["fusion_result"]["stage_scores"]
-
-            if "stage_results" in res and "physics_analysis" in res["stage_results"]:
-                physics = res["stage_results"]["physics_analysis"]
-                if "sensor_results" in physics:
-                    pv = physics["sensor_results"].get("Pitch Velocity Sensor")
-                    if pv:
-                        pitch_vel = pv.get("score") or pv.get("value", 0.0)
-
-            # Record detailed stat
-            details.append({
-                "file": file_path.name,
-                "expected": "SPOOF" if is_synthetic else "REAL",
-                "predicted": "SPOOF" if detected_spoof else "REAL",
-                "decision": decision,
-                "score": score,
-                "pitch_vel": pitch_vel,
-                "breakdown": breakdown,
-                "explanation": res.get("explanation", "")
-            })
+                # Record detailed stat; debug context is extracted later,
+                # only for the entries that get printed
+                details.append({
+                    "file": file_path.name,
+                    "expected": "SPOOF" if is_synthetic else "REAL",
+                    "predicted": "SPOOF" if detected_spoof else "REAL",
+                    "decision": decision,
+                    "score": score,
+                    "result": res,
+                })
             
-            if is_synthetic:
-                if detected_spoof:
-                    results["TP"] += 1
-                else:
-                    results["FN"] += 1
-            else:
-                if detected_spoof:
-                    results["FP"] += 1
+                if is_synthetic:
+                    if detected_spoof:
+                        results["TP"] += 1
+                    else:
+                        results["FN"] += 1
                 else:
-                    results["TN"] += 1
+                    if detected_spoof:
+                        results["FP"] += 1
+                    else:
+                        results["TN"] += 1
             
-            # Optional: Update library JSON
-            if update_library:
-                json_path = file_path.with_suffix(".json")
-                with open(json_path, "w") as f:
-                    json.dump(convert_numpy_types(res), f, indent=2)
+                # Optional: Update library JSON
+                if update_library:
+                    json_path = file_path.with_suffix(".json")
+                    payload = convert_numpy_types(res)
+                    digest = _payload_digest(payload)
+                    key = str(json_path)
+                    if _json_is_current(json_hashes, json_path, digest):
+                        continue
+                    with open(json_path, "w") as f:
+                        json.dump(payload, f, indent=2)
+                    json_hashes[key] = _json_record(json_path, digest)
                     
-        except Exception as e:
-            logger.error(f"\nError processing {file_path.name}: {e}")
-            results["errors"] += 1
+            except Exception as e:
+                # tqdm.write keeps the progress bar intact
+                tqdm.write(f"Error processing {file_path.name}: {e}")
+                results["errors"] += 1
 
     # Print Report
     total_organic = results["TN"] + results["FP"]
@@ -196,15 +241,17 @@ def run_test(count: int, update_library: bool = False):
     if fps:
         print(f"False Positives (Avg Score: {np.mean([d['score'] for d in fps]):.4f})")
         for d in fps[:5]: 
+            ctx = debug_context(d["result"])
             print(f"  - {d['file']}: {d['score']:.4f}")
-            print(f"    Breakdown: {d.get('breakdown', {})}")
+            print(f"    Breakdown: {ctx['breakdown']}")
             
     if fns:
         print(f"False Negatives (Missed Fakes, Avg Score: {np.mean([d['score'] for d in fns]):.4f})")
         for d in fns[:5]: 
+            ctx = debug_context(d["result"])
             print(f"  - {d['file']}: {d['score']:.4f}")
-            print(f"    Breakdown: {d.get('breakdown', {})}")
-            print(f"    Explanation: {d.get('explanation', '')}")
+            print(f"    Breakdown: {ctx['breakdown']}")
+            print(f"    Explanation: {ctx['explanation']}")
             
     if results["FP"] > 0:
         print(f"Recalibration needed. Suggested Threshold > {max([d['score'] for d in fps]):.4f}")
@@ -5,6 +5,7 @@ Tests all components end-to-end with synthetic audio.
 """
 
 import numpy as np
+import functools
 import logging
 from pathlib import Path
 import sys
@@ -20,10 +21,13 @@ from risk_engine.factors import RiskEngine
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Seeded PCG64 generator: faster than the legacy global RNG and reproducible
+_RNG = np.random.default_rng(12345)
+
 
 def generate_test_audio(duration: float = 2.0, sr: int = 16000) -> np.ndarray:
     """Generate synthetic test audio"""
-    t = np.linspace(0, duration, int(sr * duration))
+    t = np.linspace(0, duration, int(sr * duration), dtype=np.float32)
 
     # Sine wave with some harmonics
     audio = (
@@ -33,28 +37,38 @@ def generate_test_audio(duration: float = 2.0, sr: int = 16000) -> np.ndarray:
     )
 
     # Add some noise
-    audio += 0.05 * np.random.randn(len(audio))
+    audio += 0.05 * _RNG.standard_normal(len(audio), dtype=np.float32)
 
     # Normalize
     audio = audio / np.max(np.abs(audio)) * 0.8
 
-    return audio.astype(np.float32)
+    return audio.astype(np.float32, copy=False)
+
+
+@functools.lru_cache(maxsize=1)
+def shared_test_audio() -> np.ndarray:
+    """Default test clip, generated once and shared (read-only) across tests"""
+    audio = generate_test_audio()
+    audio.setflags(write=False)
+    return audio
 
 
 def test_telephony_pipeline():
     """Test telephony codec simulation"""
     logger.info("Testing telephony pipeline...")
 
-    audio = generate_test_audio()
+    audio = shared_test_audio()
     sr = 16000
+    n_samples = len(audio)
 
-    telephony = TelephonyPipeline()
+    # Bind the codec entry point once instead of looking it up per codec
+    apply_codec = TelephonyPipeline().apply_codec_by_name
 
     # Test all codecs
-    codecs = ['landline', 'mobile', 'voip', 'clean']
+    codecs = ('landline', 'mobile', 'voip', 'clean')
     for codec in codecs:
-        audio_coded = telephony.apply_codec_by_name(audio, sr, codec)
-        assert len(audio_coded) == len(audio), f"{codec} codec changed audio length"
+        audio_coded = apply_codec(audio, sr, codec)
+        assert len(audio_coded) == n_samples, f"{codec} codec changed audio length"
         logger.info(f"✓ {codec} codec OK")
 
     logger.info("Telephony pipeline test PASSED")
@@ -64,7 +78,7 @@ def test_feature_extraction():
     """Test feature extraction"""
     logger.info("Testing feature extraction...")
 
-    audio = generate_test_audio()
+    audio = shared_test_audio()
     sr = 16000
 
     extractor = FeatureExtractor(sr=sr)
@@ -94,7 +108,7 @@ def test_spoof_detector():
     """Test spoof detector (without training)"""
     logger.info("Testing spoof detector...")
 
-    audio = generate_test_audio()
+    audio = shared_test_audio()
     sr = 16000
 
     # Extract features
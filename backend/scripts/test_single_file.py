@@ -8,10 +8,8 @@ import os
 # Add parent to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from backend.detection.pipeline import DetectionPipeline
-from backend.detection.config import get_default_config
+from backend.detection.pipeline import get_shared_pipeline
 from backend.sensors.utils import load_and_preprocess_audio
-import io
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -20,16 +18,12 @@ logger = logging.getLogger("test_single")
 def test_file(file_path):
     print(f"Testing file: {file_path}")
     
-    # Initialize pipeline
-    cfg = get_default_config()
-    cfg.demo_mode = False 
-    pipeline = DetectionPipeline(config=cfg)
+    # Initialize pipeline (shared across calls in this process)
+    pipeline = get_shared_pipeline(demo_mode=False)
     
-    # Load audio
-    with open(file_path, "rb") as f:
-        audio_io = io.BytesIO(f.read())
-        audio_array, sr = load_and_preprocess_audio(audio_io)
-        
+    # Load audio (decoded straight from disk, no BytesIO copy)
+    audio_array, sr = load_and_preprocess_audio(file_path)
+
     # Run detection
     result = pipeline.detect(audio_array, quick_mode=False)
     
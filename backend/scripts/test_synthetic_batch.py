@@ -1,4 +1,5 @@
 
+import io
 import sys
 import os
 import json
@@ -6,13 +7,14 @@ import logging
 import asyncio
 from pathlib import Path
 from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
 
 # Add parent to path
 sys.path.append(os.getcwd())
 
-from backend.detection.pipeline import DetectionPipeline
-from backend.detection.config import get_default_config
+from backend.detection.pipeline import get_shared_pipeline
 from backend.sensors.utils import load_and_preprocess_audio
+from backend.scripts.progress_utils import make_progress
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -31,16 +33,15 @@ def main():
     print(f"Loaded {len(files)} files for testing.")
     
     # Initialize Pipeline (PROD MODE)
-    cfg = get_default_config()
-    cfg.demo_mode = False 
-    pipeline = DetectionPipeline(config=cfg)
+    pipeline = get_shared_pipeline(demo_mode=False)
     
     detected_fakes = 0
     total = 0
     
     results_dir = Path("backend/data/library/synthetic")
     
-    for file_path_str in tqdm(files, desc="Testing Synthetics"):
+    progress = make_progress(files, desc="Testing Synthetics")
+    for file_path_str in progress:
         file_path = Path(file_path_str)
         if not file_path.exists():
             continue
@@ -61,34 +62,39 @@ def main():
             else:
                 # Only log valid analysis failures (score > 0.0)
                 if score > 0.0001:
-                    print(f"\n[VALID FAILURE] {file_path.name}", flush=True)
-                    print(f"  Final Score: {score:.4f}", flush=True)
-                    print(f"  Decision: {result.get('decision', 'UNKNOWN')}", flush=True)
+                    # Buffer the report so it is written in one call and
+                    # doesn't tear the progress bar
+                    buf = io.StringIO()
+                    print(f"\n[VALID FAILURE] {file_path.name}", file=buf)
+                    print(f"  Final Score: {score:.4f}", file=buf)
+                    print(f"  Decision: {result.get('decision', 'UNKNOWN')}", file=buf)
                     
                     # Print Fusion Details
                     if 'fusion_result' in result:
                         fr = result['fusion_result']
-                        print(f"  Risk Score: {fr.get('risk_score', 0.0):.4f}", flush=True)
-                        print(f"  Trust Score: {fr.get('trust_score', 0.0):.4f}", flush=True)
+                        print(f"  Risk Score: {fr.get('risk_score', 0.0):.4f}", file=buf)
+                        print(f"  Trust Score: {fr.get('trust_score', 0.0):.4f}", file=buf)
                         
                         if 'stage_scores' in fr:
-                            print("  Stage Scores:", flush=True)
+                            print("  Stage Scores:", file=buf)
                             for stage, s_score in fr['stage_scores'].items():
-                                print(f"    - {stage}: {s_score:.4f}", flush=True)
+                                print(f"    - {stage}: {s_score:.4f}", file=buf)
                     
                     # Print Physics Breakdown
                     if 'stage_results' in result and 'physics_analysis' in result['stage_results']:
                         physics = result['stage_results']['physics_analysis']
                         if 'sensor_results' in physics:
-                            print("  Physics Sensors:", flush=True)
+                            print("  Physics Sensors:", file=buf)
                             for s_name, s_res in physics['sensor_results'].items():
                                 if s_res and 'score' in s_res:
-                                    print(f"    - {s_name}: {s_res['score']:.4f}", flush=True)
+                                    print(f"    - {s_name}: {s_res['score']:.4f}", file=buf)
                                 elif s_res and 'value' in s_res:
                                     val = s_res['value']
                                     # Try to interpret value if score missing
                                     if isinstance(val, (int, float)):
-                                         print(f"    - {s_name}: {val:.4f} (Raw Value)", flush=True)
+                                         print(f"    - {s_name}: {val:.4f} (Raw Value)", file=buf)
+                    
+                    tqdm.write(buf.getvalue().rstrip("\n"))
                 else:
                     # Minimal log for load errors
                     pass
@@ -120,4 +126,6 @@ def main():
         print("No files processed.")
 
 if __name__ == "__main__":
-    main()
+    # Route log records through tqdm.write so they don't tear the progress bar
+    with logging_redirect_tqdm():
+        main()
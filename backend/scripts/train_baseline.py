@@ -5,7 +5,9 @@ Train GMM-based spoof detector on labeled audio dataset.
 """
 
 import argparse
+import hashlib
 import logging
+import os
 from pathlib import Path
 import sys
 import pandas as pd
@@ -22,23 +24,48 @@ from models.baseline import GMMSpoofDetector
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+FEATURE_TYPES = ['lfcc', 'logspec']
+FEATURE_CACHE_DIR = Path.home() / '.cache' / 'sonotheia' / 'features'
 
-def load_dataset(dataset_dir: str, metadata_file: str, codec: str = 'landline', max_samples: int = None):
+
+def feature_cache_path(file_path: Path, codec: str) -> Path:
+    """
+    Cache location for a file's features, keyed on path, mtime, codec and feature types
+
+    Args:
+        file_path: Source audio file
+        codec: Codec applied before extraction
+
+    Returns:
+        Path of the cached .npy file
+    """
+    key_src = f"{file_path}:{os.path.getmtime(file_path)}:{codec}:{','.join(FEATURE_TYPES)}"
+    key = hashlib.sha1(key_src.encode()).hexdigest()
+    return FEATURE_CACHE_DIR / codec / key[:2] / f"{key}.npy"
+
+
+def load_dataset(dataset_dir: str, metadata_file: str, codec: str = 'landline', max_samples: int = None,
+                 use_cache: bool = True, rebuild_cache: bool = False):
     """
     Load and preprocess dataset
 
+    Extracted features are cached on disk per file and codec, so repeated
+    training runs skip decoding and feature extraction.
+
     Args:
         dataset_dir: Directory containing audio files
         metadata_file: CSV file with file_path and label columns
         codec: Codec to apply
         max_samples: Maximum samples to load (None = all)
+        use_cache: Read/write the on-disk feature cache
+        rebuild_cache: Ignore cached features and re-extract them
 
     Returns:
         Tuple of (genuine_features, spoof_features)
     """
     # Load metadata
     metadata_path = Path(dataset_dir) / metadata_file
-    df = pd.read_csv(metadata_path)
+    df = pd.read_csv(metadata_path, usecols=['file_path', 'label'])
 
     if max_samples:
         df = df.sample(n=min(max_samples, len(df)), random_state=42)
@@ -51,19 +78,31 @@ def load_dataset(dataset_dir: str, metadata_file: str, codec: str = 'landline',
     genuine_features_list = []
     spoof_features_list = []
 
-    for idx, row in df.iterrows():
-        file_path = Path(dataset_dir) / row['file_path']
-        label = row['label']
+    # Iterate plain column values; iterrows() builds a Series per row
+    rows = zip(df['file_path'].to_numpy(), df['label'].to_numpy())
+    for idx, (rel_path, label) in enumerate(rows):
+        file_path = Path(dataset_dir) / rel_path
 
         try:
-            # Load audio
-            audio, sr = loader.load_wav(str(file_path))
+            cache_path = feature_cache_path(file_path, codec) if use_cache else None
+
+            if cache_path is not None and not rebuild_cache and cache_path.exists():
+                # Read fully (not memory-mapped): a memmap per cached file would
+                # keep one file descriptor open each until the final vstack
+                features = np.load(cache_path)
+            else:
+                # Load audio
+                audio, sr = loader.load_wav(str(file_path))
+
+                # Apply codec
+                audio_coded = telephony.apply_codec_by_name(audio, sr, codec)
 
-            # Apply codec
-            audio_coded = telephony.apply_codec_by_name(audio, sr, codec)
+                # Extract features
+                features = extractor.extract_feature_stack(audio_coded, feature_types=FEATURE_TYPES)
 
-            # Extract features
-            features = extractor.extract_feature_stack(audio_coded, feature_types=['lfcc', 'logspec'])
+                if cache_path is not None:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    np.save(cache_path, features)
 
             # Separate by label
             if label == 0:
@@ -124,6 +163,8 @@ def main():
                         help='Output model path')
     parser.add_argument('--n-components', type=int, default=32, help='Number of GMM components')
     parser.add_argument('--max-samples', type=int, default=None, help='Max samples to use (for testing)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the on-disk feature cache')
+    parser.add_argument('--rebuild-cache', action='store_true', help='Re-extract features and refresh the cache')
 
     args = parser.parse_args()
 
@@ -137,7 +178,9 @@ def main():
         dataset_dir=args.dataset_dir,
         metadata_file=args.metadata_file,
         codec=args.codec,
-        max_samples=args.max_samples
+        max_samples=args.max_samples,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache
     )
 
     # Train model
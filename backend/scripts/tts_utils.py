@@ -7,12 +7,46 @@ Used by generate_phonetic_samples.py and generate_red_team.py.
 """
 
 import os
+import asyncio
+import functools
 import logging
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+# Shared keep-alive session for sequential ElevenLabs calls (created on first use)
+_TTS_SESSION = None
+
+
+def _get_tts_session():
+    """
+    Get the pooled requests session used for TTS calls.
+
+    Reusing one session keeps TCP/TLS connections alive between samples,
+    and the adapter retries rate-limit and transient server errors.
+    """
+    global _TTS_SESSION
+    if _TTS_SESSION is None:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+        _TTS_SESSION = session
+    return _TTS_SESSION
+
 
 def load_env_file(script_path: Optional[Path] = None) -> bool:
     """
@@ -54,12 +88,16 @@ def load_env_file(script_path: Optional[Path] = None) -> bool:
         return False
 
 
-def check_tts_dependencies() -> dict:
+@functools.lru_cache(maxsize=1)
+def check_tts_dependencies() -> Mapping[str, bool]:
     """
     Check if required TTS dependencies are available.
 
+    The result is cached: the openai import is slow and availability
+    does not change within a process.
+
     Returns:
-        dict with 'requests' and 'openai' boolean availability
+        Read-only mapping with 'requests' and 'openai' boolean availability
     """
     deps = {'requests': False, 'openai': False}
 
@@ -75,13 +113,37 @@ def check_tts_dependencies() -> dict:
     except ImportError:
         pass
 
-    return deps
+    return MappingProxyType(deps)
+
+
+# /stream returns audio chunks while synthesis is still running
+ELEVENLABS_TTS_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
+STREAM_CHUNK_SIZE = 8192
+DEFAULT_ELEVENLABS_VOICE = "pNInz6obpgDQGcFmaJgB"
+
+
+def _elevenlabs_request(text: str, api_key: str) -> tuple:
+    """Build ElevenLabs request headers and JSON body."""
+    headers = {
+        "Accept": "audio/mpeg",
+        "Content-Type": "application/json",
+        "xi-api-key": api_key
+    }
+    data = {
+        "text": text,
+        "model_id": "eleven_monolingual_v1",
+        "voice_settings": {
+            "stability": 0.5,
+            "similarity_boost": 0.5
+        }
+    }
+    return headers, data
 
 
 def generate_elevenlabs(
     text: str,
     filename: str,
-    voice_id: str = "pNInz6obpgDQGcFmaJgB",
+    voice_id: str = DEFAULT_ELEVENLABS_VOICE,
     api_key: Optional[str] = None,
     timeout: int = 30
 ) -> bool:
@@ -103,40 +165,33 @@ def generate_elevenlabs(
         logger.warning("ELEVENLABS_API_KEY not set. Skipping.")
         return False
 
-    try:
-        import requests
-    except ImportError:
+    if requests is None:
         logger.error("'requests' module not found. Please install it: pip install requests")
         return False
 
     try:
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-        headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": api_key
-        }
-        data = {
-            "text": text,
-            "model_id": "eleven_monolingual_v1",
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.5
-            }
-        }
-
-        response = requests.post(url, json=data, headers=headers, timeout=timeout)
+        url = ELEVENLABS_TTS_URL.format(voice_id=voice_id)
+        headers, data = _elevenlabs_request(text, api_key)
 
-        if response.status_code == 200:
+        response = _get_tts_session().post(
+            url, json=data, headers=headers, timeout=timeout, stream=True
+        )
+        try:
+            if response.status_code != 200:
+                logger.error(f"ElevenLabs Error ({response.status_code}): {response.text}")
+                return False
+            # Write chunks as they arrive instead of buffering the whole MP3
             with open(filename, "wb") as f:
-                f.write(response.content)
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    f.write(chunk)
             return True
-        else:
-            logger.error(f"ElevenLabs Error ({response.status_code}): {response.text}")
-            return False
+        finally:
+            response.close()
 
     except Exception as e:
         logger.error(f"ElevenLabs Exception: {e}")
+        # Don't leave a truncated file behind if the stream broke mid-write
+        Path(filename).unlink(missing_ok=True)
         return False
 
 
@@ -184,3 +239,168 @@ def generate_openai(
     except Exception as e:
         logger.error(f"OpenAI Exception: {e}")
         return False
+
+
+async def generate_elevenlabs_async(
+    text: str,
+    filename: str,
+    client,
+    sem: asyncio.Semaphore,
+    voice_id: str = DEFAULT_ELEVENLABS_VOICE,
+    api_key: Optional[str] = None,
+    timeout: int = 30
+) -> bool:
+    """
+    Generate audio using ElevenLabs API without blocking the event loop.
+
+    Args:
+        text: Text to synthesize
+        filename: Output file path
+        client: Shared httpx.AsyncClient
+        sem: Semaphore bounding concurrent requests
+        voice_id: ElevenLabs voice ID (default: Adam)
+        api_key: API key (uses env var if not provided)
+        timeout: Request timeout in seconds
+
+    Returns:
+        True if successful, False otherwise
+    """
+    api_key = api_key or os.environ.get("ELEVENLABS_API_KEY")
+    if not api_key:
+        logger.warning("ELEVENLABS_API_KEY not set. Skipping.")
+        return False
+
+    try:
+        url = ELEVENLABS_TTS_URL.format(voice_id=voice_id)
+        headers, data = _elevenlabs_request(text, api_key)
+
+        async with sem:
+            async with client.stream(
+                "POST", url, json=data, headers=headers, timeout=timeout
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    logger.error(f"ElevenLabs Error ({response.status_code}): {response.text}")
+                    return False
+                # Writes run off the event loop so they overlap with the other streams
+                f = await asyncio.to_thread(open, filename, "wb")
+                try:
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+        return True
+
+    except Exception as e:
+        logger.error(f"ElevenLabs Exception: {e}")
+        Path(filename).unlink(missing_ok=True)
+        return False
+
+
+async def generate_openai_async(
+    text: str,
+    filename: str,
+    client,
+    sem: asyncio.Semaphore,
+    voice: str = "alloy"
+) -> bool:
+    """
+    Generate audio using OpenAI TTS API without blocking the event loop.
+
+    Args:
+        text: Text to synthesize
+        filename: Output file path
+        client: Shared openai.AsyncOpenAI client
+        sem: Semaphore bounding concurrent requests
+        voice: OpenAI voice name (alloy, echo, fable, onyx, nova, shimmer)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        async with sem:
+            response = await client.audio.speech.create(
+                model="tts-1",
+                voice=voice,
+                input=text
+            )
+            audio = await response.aread()
+
+        await asyncio.to_thread(Path(filename).write_bytes, audio)
+        return True
+
+    except Exception as e:
+        logger.error(f"OpenAI Exception: {e}")
+        return False
+
+
+async def generate_batch(
+    texts: Sequence[str],
+    filenames: Sequence[str],
+    service: str = "elevenlabs",
+    concurrency: int = 8,
+    voice_id: str = DEFAULT_ELEVENLABS_VOICE,
+    voice: str = "alloy",
+    api_key: Optional[str] = None,
+    timeout: int = 30
+) -> List[bool]:
+    """
+    Generate many samples concurrently over a shared connection pool.
+
+    Wall time drops from roughly one round-trip per sample to one
+    round-trip per `concurrency` samples, up to provider rate limits.
+
+    Args:
+        texts: Texts to synthesize
+        filenames: Output file paths (same length as texts)
+        service: 'elevenlabs' or 'openai'
+        concurrency: Maximum in-flight requests
+        voice_id: ElevenLabs voice ID
+        voice: OpenAI voice name
+        api_key: API key (uses service env var if not provided)
+        timeout: Request timeout in seconds
+
+    Returns:
+        Per-sample success flags, in input order
+    """
+    if len(texts) != len(filenames):
+        raise ValueError("texts and filenames must have the same length")
+
+    sem = asyncio.Semaphore(concurrency)
+
+    if service == "elevenlabs":
+        try:
+            import httpx
+        except ImportError:
+            logger.error("'httpx' module not found. Please install it: pip install httpx")
+            return [False] * len(texts)
+
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(limits=limits) as client:
+            return list(await asyncio.gather(*[
+                generate_elevenlabs_async(text, filename, client, sem, voice_id, api_key, timeout)
+                for text, filename in zip(texts, filenames)
+            ]))
+
+    if service == "openai":
+        api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            logger.warning("OPENAI_API_KEY not set. Skipping.")
+            return [False] * len(texts)
+
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            logger.error("'openai' module not found. Please install it: pip install openai")
+            return [False] * len(texts)
+
+        client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+        try:
+            return list(await asyncio.gather(*[
+                generate_openai_async(text, filename, client, sem, voice)
+                for text, filename in zip(texts, filenames)
+            ]))
+        finally:
+            await client.close()
+
+    raise ValueError(f"Unknown TTS service: {service}")
@@ -1,14 +1,32 @@
-import requests
+import asyncio
+import base64
+import httpx
 import logging
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 import json
 
+# HTTP/2 multiplexing needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Connection pool size; lets concurrent callers reuse keep-alive connections
+POOL_MAXSIZE = 32
+DEFAULT_TIMEOUT = 30.0
+
 class SonotheiaClient:
     """
     Python Client SDK for Sonotheia Enhanced API.
+    
+    Can be used as a context manager to release pooled connections:
+    
+        with SonotheiaClient(api_key="...") as client:
+            client.health_check()
     """
     
     def __init__(self, base_url: str = "http://localhost:8000", api_key: Optional[str] = None):
@@ -21,17 +39,30 @@ class SonotheiaClient:
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.session = requests.Session()
-        
-        if api_key:
-            self.session.headers.update({"X-API-Key": api_key})
+        self.session = httpx.Client(
+            base_url=self.base_url,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_MAXSIZE),
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+            headers={"X-API-Key": api_key} if api_key else {},
+        )
+    
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self.session.close()
+    
+    def __enter__(self) -> "SonotheiaClient":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
             
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle API response and raise errors if needed."""
         try:
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"API Request failed: {e}")
             try:
                 error_detail = response.json()
@@ -53,7 +84,7 @@ class SonotheiaClient:
             transaction_id: Unique transaction ID
             customer_id: Customer ID
             amount_usd: Transaction amount
-            voice_sample: Optional voice audio bytes
+            voice_sample: Optional voice audio bytes (sent base64-encoded)
             device_info: Optional device information dict
             **kwargs: Additional arguments for AuthenticationRequest
             
@@ -64,16 +95,13 @@ class SonotheiaClient:
             "transaction_id": transaction_id,
             "customer_id": customer_id,
             "amount_usd": amount_usd,
-            "voice_sample": list(voice_sample) if voice_sample else None, # Pydantic expects list for bytes sometimes, or base64
+            # AuthenticationRequest.voice_sample is a base64 string
+            "voice_sample": base64.b64encode(voice_sample).decode("ascii") if voice_sample else None,
             "device_info": device_info,
             **kwargs
         }
         
-        # Note: For large audio, we might need to handle base64 encoding or multipart upload
-        # The current API expects JSON body with fields.
-        
-        url = f"{self.base_url}/api/authenticate"
-        response = self.session.post(url, json=payload)
+        response = self.session.post("/api/authenticate", json=payload)
         return self._handle_response(response)
 
     def detect_voice(self, audio_file: Union[str, Path, bytes], quick_mode: bool = False) -> Dict[str, Any]:
@@ -87,21 +115,53 @@ class SonotheiaClient:
         Returns:
             Detection results
         """
-        url = f"{self.base_url}/api/detect"
         params = {"quick_mode": quick_mode}
         
-        files = {}
-        if isinstance(audio_file, (str, Path)):
-            files = {"file": open(audio_file, "rb")}
-        else:
-            files = {"file": ("audio.wav", audio_file, "audio/wav")}
+        # Read once up front: the request body can be resent without reopening the file
+        data = Path(audio_file).read_bytes() if isinstance(audio_file, (str, Path)) else audio_file
+        response = self.session.post(
+            "/api/detect", params=params, files={"file": ("audio.wav", data, "audio/wav")}
+        )
+        return self._handle_response(response)
+
+    async def detect_voice_many(self,
+                                files: List[Union[str, Path]],
+                                quick_mode: bool = False,
+                                concurrency: int = 16) -> List[Dict[str, Any]]:
+        """
+        Run deepfake detection on many audio files concurrently.
+        
+        Args:
+            files: Paths to audio files
+            quick_mode: Whether to run in quick mode
+            concurrency: Maximum number of in-flight requests
             
-        try:
-            response = self.session.post(url, params=params, files=files)
-            return self._handle_response(response)
-        finally:
-            if isinstance(audio_file, (str, Path)):
-                files["file"].close()
+        Returns:
+            Detection results, in the same order as files
+        """
+        # Only needed here; keeps the synchronous client importable without it
+        import aiofiles
+
+        sem = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency)
+        
+        async with httpx.AsyncClient(base_url=self.base_url,
+                                     headers=dict(self.session.headers),
+                                     limits=limits,
+                                     timeout=httpx.Timeout(DEFAULT_TIMEOUT)) as client:
+            
+            async def _detect_one(path: Union[str, Path]) -> Dict[str, Any]:
+                async with sem:
+                    async with aiofiles.open(path, "rb") as f:
+                        data = await f.read()
+                    response = await client.post(
+                        "/api/detect",
+                        params={"quick_mode": quick_mode},
+                        files={"file": ("audio.wav", data, "audio/wav")}
+                    )
+                return self._handle_response(response)
+            
+            return await asyncio.gather(*[_detect_one(p) for p in files])
 
     def generate_sar(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -113,12 +173,10 @@ class SonotheiaClient:
         Returns:
             Generated SAR narrative and validation
         """
-        url = f"{self.base_url}/api/sar/generate"
-        response = self.session.post(url, json=context)
+        response = self.session.post("/api/sar/generate", json=context)
         return self._handle_response(response)
         
     def health_check(self) -> Dict[str, Any]:
         """Check API health."""
-        url = f"{self.base_url}/api/v1/health"
-        response = self.session.get(url)
+        response = self.session.get("/api/v1/health")
         return self._handle_response(response)
@@ -5,8 +5,11 @@ This module provides a modular, object-oriented architecture for audio sensors.
 All sensors inherit from BaseSensor and implement the analyze() method.
 
 Optionally uses high-performance Rust implementations when available.
+Sensor classes are loaded lazily on first access.
 """
 
+import importlib
+
 # Try to import Rust accelerated functions
 # Falls back to scipy/numpy if Rust module is not available
 try:
@@ -30,37 +33,79 @@ except ImportError:
     compute_crest_factor = None
 
 from .base import BaseSensor, SensorResult
-from .breath import BreathSensor
-from .breathing_pattern import BreathingPatternSensor
-from .dynamic_range import DynamicRangeSensor
-from .bandwidth import BandwidthSensor
-from .phase_coherence import PhaseCoherenceSensor
-from .glottal_inertia import GlottalInertiaSensor
-from .digital_silence import DigitalSilenceSensor
-from .global_formants import GlobalFormantSensor
-from .coarticulation import CoarticulationSensor
-from .formant import FormantTrajectorySensor
-from .enf import ENFSensor
-from .prosodic_continuity import ProsodicContinuitySensor
-from .vad import VoiceActivityDetector, SpeechSegment, ONNX_AVAILABLE
-from .hf_ensemble import ModelConfig, ModelStatus
-from .registry import SensorRegistry, get_default_sensors
-
 
+# Sensor classes are imported on first attribute access (PEP 562) so that
+# `import sensors` stays cheap for code that only needs SensorResult.
+_LAZY_IMPORTS = {
+    "BreathSensor": ".breath",
+    "BreathingPatternSensor": ".breathing_pattern",
+    "DynamicRangeSensor": ".dynamic_range",
+    "BandwidthSensor": ".bandwidth",
+    "PhaseCoherenceSensor": ".phase_coherence",
+    "GlottalInertiaSensor": ".glottal_inertia",
+    "DigitalSilenceSensor": ".digital_silence",
+    "GlobalFormantSensor": ".global_formants",
+    "CoarticulationSensor": ".coarticulation",
+    "FormantTrajectorySensor": ".formant",
+    "ENFSensor": ".enf",
+    "ProsodicContinuitySensor": ".prosodic_continuity",
+    "VoiceActivityDetector": ".vad",
+    "SpeechSegment": ".vad",
+    "ONNX_AVAILABLE": ".vad",
+    "ModelConfig": ".hf_ensemble",
+    "ModelStatus": ".hf_ensemble",
+    "SensorRegistry": ".registry",
+    "get_default_sensors": ".registry",
+    "run_sensors_parallel": ".registry",
+}
 
 # HuggingFace-based sensors (optional - requires transformers)
-try:
-    from .huggingface_detector import (
-        HuggingFaceDetectorSensor,
-        HuggingFaceSpeakerEmbedding,
-        SUPPORTED_MODELS as HF_SUPPORTED_MODELS,
+_HF_NAMES = {
+    "HuggingFaceDetectorSensor",
+    "HuggingFaceSpeakerEmbedding",
+    "HF_SUPPORTED_MODELS",
+    "HUGGINGFACE_AVAILABLE",
+}
+
+
+def _load_huggingface() -> None:
+    """Resolve the optional HuggingFace exports, caching them in module globals."""
+    try:
+        # A missing module or name both mean the exports are unavailable
+        from .huggingface_detector import (
+            HuggingFaceDetectorSensor,
+            HuggingFaceSpeakerEmbedding,
+            SUPPORTED_MODELS as HF_SUPPORTED_MODELS,
+        )
+        available = True
+    except ImportError:
+        HuggingFaceDetectorSensor = None
+        HuggingFaceSpeakerEmbedding = None
+        HF_SUPPORTED_MODELS = {}
+        available = False
+    globals().update(
+        HuggingFaceDetectorSensor=HuggingFaceDetectorSensor,
+        HuggingFaceSpeakerEmbedding=HuggingFaceSpeakerEmbedding,
+        HF_SUPPORTED_MODELS=HF_SUPPORTED_MODELS,
+        HUGGINGFACE_AVAILABLE=available,
     )
-    HUGGINGFACE_AVAILABLE = True
-except ImportError:
-    HuggingFaceDetectorSensor = None
-    HuggingFaceSpeakerEmbedding = None
-    HF_SUPPORTED_MODELS = {}
-    HUGGINGFACE_AVAILABLE = False
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _HF_NAMES:
+        _load_huggingface()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "BaseSensor",
@@ -80,6 +125,7 @@ __all__ = [
     "ModelConfig",
     "ModelStatus",
     "SensorRegistry",
+    "run_sensors_parallel",
     "VoiceActivityDetector",
     "SpeechSegment",
     "RUST_AVAILABLE",
@@ -95,9 +141,4 @@ __all__ = [
     "HuggingFaceSpeakerEmbedding",
     "HUGGINGFACE_AVAILABLE",
     "HF_SUPPORTED_MODELS",
-
 ]
-
-
-
-
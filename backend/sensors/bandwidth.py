@@ -6,10 +6,19 @@ of telephony or AI-generated content with limited frequency range.
 """
 
 import numpy as np
-from scipy.fft import rfft
+from scipy.fft import rfft, next_fast_len
 from .base import BaseSensor, SensorResult
+from .jit import NUMBA_AVAILABLE, njit
 from backend.utils.config import get_threshold
 
+# Rust kernel computes magnitudes inline while scanning, skipping the np.abs array
+try:
+    from sonotheia_rust import compute_spectral_rolloff as _rust_spectral_rolloff
+    RUST_ROLLOFF_AVAILABLE = True
+except ImportError:
+    _rust_spectral_rolloff = None
+    RUST_ROLLOFF_AVAILABLE = False
+
 # Constants - can be overridden by config/settings.yaml
 SPECTRAL_ROLLOFF_THRESHOLD_HZ = get_threshold("bandwidth", "rolloff_threshold_hz", 4000)
 SPECTRAL_ROLLOFF_PERCENT = get_threshold("bandwidth", "rolloff_percent", 0.90)
@@ -17,6 +26,66 @@ SPECTRAL_ROLLOFF_PERCENT = get_threshold("bandwidth", "rolloff_percent", 0.90)
 CONTRIBUTE_TO_VERDICT = get_threshold("bandwidth", "contribute_to_verdict", True)
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _rolloff_index(spectrum, rolloff_percent):
+        """First bin holding rolloff_percent of the spectral sum, or -1 for a silent spectrum."""
+        total = 0.0
+        for i in range(spectrum.size):
+            total += spectrum[i]
+        if total == 0.0:
+            return -1
+        energy_threshold = total * rolloff_percent
+        running = 0.0
+        for i in range(spectrum.size):
+            running += spectrum[i]
+            if running >= energy_threshold:
+                return i
+        return spectrum.size - 1
+else:
+    def _rolloff_index(spectrum, rolloff_percent):
+        """First bin holding rolloff_percent of the spectral sum, or -1 for a silent spectrum."""
+        cumulative_energy = np.cumsum(spectrum)
+        # Last cumsum entry is the total, so no separate np.sum pass is needed
+        spectral_sum = cumulative_energy[-1]
+        if spectral_sum == 0:
+            return -1
+        # cumulative energy is sorted by definition, so searchsorted applies
+        return int(np.searchsorted(cumulative_energy, spectral_sum * rolloff_percent))
+
+
+def _rolloff_frequency(audio_data: np.ndarray, samplerate: int, rolloff_percent: float):
+    """
+    Spectral rolloff frequency in Hz, or None for silent audio.
+    
+    Runs the whole FFT -> magnitude -> running sum -> Hz chain in one call,
+    using the compiled Rust kernel when available.
+    """
+    # float32 input keeps the spectrum complex64/float32, halving memory traffic
+    if audio_data.dtype != np.float32:
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+    
+    # Use rfft for real audio signals (2x faster than fft)
+    # rfft already returns only positive frequencies.
+    # Zero-pad to a 5-smooth length for pocketfft's fast path. Single-threaded:
+    # sensors already run in parallel under run_sensors_parallel.
+    n_fft = next_fast_len(len(audio_data), real=True)
+    spectrum = rfft(audio_data, n=n_fft)
+    if RUST_ROLLOFF_AVAILABLE:
+        rolloff_idx = _rust_spectral_rolloff(spectrum, rolloff_percent)
+    else:
+        # Total energy and rolloff bin come from one cumulative pass (JIT scan or cumsum)
+        rolloff_idx = _rolloff_index(np.abs(spectrum), rolloff_percent)
+    
+    if rolloff_idx < 0:
+        return None
+    n_bins = len(spectrum)
+    # Safety clamp; the kernels never return an index past the last bin
+    rolloff_idx = min(rolloff_idx, n_bins - 1)
+    # For rfft, nyquist frequency corresponds to len(spectrum)
+    return (rolloff_idx / n_bins) * (samplerate / 2)
+
+
 class BandwidthSensor(BaseSensor):
     """
     Bandwidth sensor that detects frequency rolloff patterns.
@@ -71,12 +140,9 @@ class BandwidthSensor(BaseSensor):
                 metadata={"type": "UNKNOWN"}
             )
         
-        # Use rfft for real audio signals (2x faster than fft)
-        # rfft already returns only positive frequencies
-        spectrum = np.abs(rfft(audio_data))
-        spectral_sum = np.sum(spectrum)
+        rolloff_hz = _rolloff_frequency(audio_data, samplerate, self.rolloff_percent)
         
-        if spectral_sum == 0:
+        if rolloff_hz is None:
             return SensorResult(
                 sensor_name=self.name,
                 passed=None,
@@ -85,17 +151,6 @@ class BandwidthSensor(BaseSensor):
                 metadata={"type": "SILENCE"}
             )
         
-        energy_threshold = spectral_sum * self.rolloff_percent
-        cumulative_energy = np.cumsum(spectrum)
-        # Optimize search for rolloff index using searchsorted (O(log n) vs O(n))
-        # cumulative_energy is sorted by definition
-        rolloff_idx = np.searchsorted(cumulative_energy, energy_threshold)
-        
-        if rolloff_idx >= len(spectrum):
-            # Should not happen if logic is correct, but safety check
-            rolloff_idx = len(spectrum) - 1
-        # For rfft, nyquist frequency corresponds to len(spectrum)
-        rolloff_hz = (rolloff_idx / len(spectrum)) * (samplerate / 2)
         is_narrowband = rolloff_hz < self.rolloff_threshold_hz
         bandwidth_type = "NARROWBAND" if is_narrowband else "FULLBAND"
         
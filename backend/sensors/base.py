@@ -15,9 +15,9 @@ from typing import Optional, Dict, Any
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorResult:
-    """Standardized result structure for all sensors."""
+    """Standardized result structure for all sensors (slotted: no per-instance __dict__)."""
     sensor_name: str
     passed: Optional[bool] = None  # True/False for pass/fail sensors, None for info-only sensors
     value: float = 0.0
@@ -25,12 +25,15 @@ class SensorResult:
     reason: Optional[str] = None
     detail: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None  # Additional sensor-specific data
+    score: Optional[float] = None  # Normalized anomaly score set by some sensors (0.0 = real, 1.0 = fake)
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert result to dictionary format.
 
-        Uses shared convert_numpy_types from utils.serialization to avoid code duplication.
+        Built by hand rather than with dataclasses.asdict, which would deep-copy
+        metadata (including any numpy arrays) before conversion. Uses shared
+        convert_numpy_types from utils.serialization to avoid code duplication.
         """
         from backend.utils.serialization import convert_numpy_types
 
@@ -64,6 +67,11 @@ class BaseSensor(ABC):
     and sample rate, and returns a SensorResult.
     """
     
+    # True for sensors whose analyze() accepts a precomputed
+    # EnvironmentAnalyzer.analyze result as an env_stats keyword; the
+    # registry computes it once per clip and passes it to each of them
+    uses_env_stats: bool = False
+    
     def __init__(self, name: str, category: str = "defense"):
         """
         Initialize sensor.
@@ -12,13 +12,20 @@ airflow rates. TTS systems operate with "No biological constraints on speech dur
 and can generate run-on sentences or 30-second flows of speech with zero intake breaths.
 """
 
-from typing import Dict
+import logging
+import math
+from typing import Dict, List, Tuple
 import numpy as np
 from .base import BaseSensor, SensorResult
+from backend.calibration import environment
 from backend.calibration.environment import EnvironmentAnalyzer
-from .vad import VoiceActivityDetector
+from .jit import NUMBA_AVAILABLE, njit
+from . import vad as vad_module
+from .vad import SpeechSegment, VoiceActivityDetector, frame_mean_squares
 from backend.utils.config import get_threshold
 
+logger = logging.getLogger(__name__)
+
 # Constants - can be overridden by config/settings.yaml
 MAX_PHONATION_SECONDS = get_threshold("breath", "max_phonation_seconds", 14.0)
 # Respiration monitoring threshold: maximum continuous voiced segment without breath event
@@ -30,6 +37,34 @@ SILENCE_THRESHOLD_DB = get_threshold("breath", "silence_threshold_db", -60)
 FRAME_SIZE_SECONDS = get_threshold("breath", "frame_size_seconds", 0.02)
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _respiration_stats(bounds, total_duration, min_silence):
+        """Longest segment and breath-gap count over (N, 2) segment bounds (N >= 1)."""
+        max_voiced = 0.0
+        breath_events = 0
+        for i in range(bounds.shape[0]):
+            duration = bounds[i, 1] - bounds[i, 0]
+            if duration > max_voiced:
+                max_voiced = duration
+            # Gap before this segment
+            if i > 0 and bounds[i, 0] - bounds[i - 1, 1] >= min_silence:
+                breath_events += 1
+        # Gap after the last segment
+        if total_duration - bounds[-1, 1] >= min_silence:
+            breath_events += 1
+        return max_voiced, breath_events
+else:
+    def _respiration_stats(bounds, total_duration, min_silence):
+        """Longest segment and breath-gap count over (N, 2) segment bounds (N >= 1)."""
+        max_voiced = max(0.0, float(np.max(bounds[:, 1] - bounds[:, 0])))
+        gaps = bounds[1:, 0] - bounds[:-1, 1]
+        breath_events = int(np.count_nonzero(gaps >= min_silence))
+        # Gap after the last segment
+        breath_events += int(total_duration - bounds[-1, 1] >= min_silence)
+        return max_voiced, breath_events
+
+
 class BreathSensor(BaseSensor):
     """
     Breath sensor that checks for biologically impossible phonation patterns.
@@ -103,6 +138,10 @@ class BreathSensor(BaseSensor):
                 detail="Invalid or empty audio input."
             )
         
+        # float32 halves memory traffic for the framing passes; energy sums stay float64
+        if audio_data.dtype != np.float32:
+            audio_data = audio_data.astype(np.float32)
+        
         frame_size = int(self.frame_size_seconds * samplerate)
         if len(audio_data) < frame_size:
             return SensorResult(
@@ -113,33 +152,14 @@ class BreathSensor(BaseSensor):
                 detail="Audio too short for analysis."
             )
         
-        # Dynamic Calibration: Analyze Environment
-        env_stats = EnvironmentAnalyzer.analyze(audio_data, samplerate)
-        noise_floor = env_stats["noise_floor_db"]
-        
-        # Adapt silence threshold: Must be at least 6dB above noise floor
-        # But never lower than the configured base threshold (e.g., -60dB)
-        base_threshold = self.silence_threshold_db # Use instance attribute
-        adapted_threshold = max(base_threshold, noise_floor + 6.0)
-        
-        if adapted_threshold > base_threshold:
-            logger.debug(f"BreathSensor: Adapted silence threshold from {base_threshold}dB to {adapted_threshold:.1f}dB due to noise floor ({noise_floor:.1f}dB)")
-        
-        # Use robust VAD to find speech segments (breath groups)
-        # Create a temporary VAD instance with the tuned threshold for this specific analysis
-        # (This is lightweight)
-        vad = VoiceActivityDetector(
-            speech_threshold=0.5,
-            min_speech_duration=0.1,
-            min_silence_duration=0.2,
-            silence_threshold_db=adapted_threshold # Use adapted threshold
-        )
+        # Single VAD pass; both phonation and respiration checks use its segments
+        segments, _, _ = self._run_vad(audio_data, samplerate)
         
-        max_duration = vad.get_max_continuous_speech(audio_data, samplerate)
+        max_duration = max((seg.duration_seconds for seg in segments), default=0.0)
         max_duration = round(float(max_duration), 2)
         
         # Respiration monitoring: detect "Infinite Lung Capacity" violations
-        respiration_results = self._monitor_respiration(audio_data, samplerate)
+        respiration_results = self._monitor_respiration(segments, len(audio_data) / samplerate)
         
         # Check both max phonation duration and respiration violations
         passed_phonation = bool(max_duration <= self.max_phonation_seconds)
@@ -170,11 +190,12 @@ class BreathSensor(BaseSensor):
         # Soft sigmoid around threshold
         # If max_duration is 8s (well below 14s), score should be low.
         # If max_duration is 16s (above 14s), score should be high.
-        deviation = max_duration - self.max_phonation_seconds
+        deviation = float(max_duration - self.max_phonation_seconds)
         # Map deviation: -5s -> 0.0, 0s -> 0.5, +5s -> 1.0
-        normalized_score = 1.0 / (1.0 + np.exp(-deviation))
+        # Scalar math.exp avoids NumPy ufunc dispatch; deviation >= -max_phonation_seconds, so no overflow
+        normalized_score = 1.0 / (1.0 + math.exp(-deviation))
         
-        result.score = float(normalized_score) # Explicit score for FusionEngine
+        result.score = normalized_score # Explicit score for FusionEngine
         
         # Add respiration monitoring metadata
         result.metadata = {
@@ -188,42 +209,67 @@ class BreathSensor(BaseSensor):
         
         return result
     
-    def _calculate_noise_floor(self, audio_data: np.ndarray, frame_duration: float = 0.1) -> float:
+    def _run_vad(
+        self,
+        audio: np.ndarray,
+        sr: int,
+    ) -> Tuple[List[SpeechSegment], float, float]:
         """
-        Calculate the noise floor of the audio.
-        
-        Uses the 10th percentile of frame RMS energy as the noise floor estimate.
+        Run VAD once with a silence threshold tuned to the recording's noise floor.
         
         Args:
-            audio_data: Audio signal
-            frame_duration: Duration of analysis frames in seconds
+            audio: Audio signal
+            sr: Sample rate in Hz
             
         Returns:
-            Noise floor in dB
+            Tuple of (speech segments, tuned threshold in dB, noise floor in dB)
         """
-        # Quick RMS calculation on frames
-        frame_size = int(frame_duration * 16000)  # Assume 16k or adjust if needed
-        # Just use simple strided view for speed estimate (don't need perfect hop)
-        if len(audio_data) < frame_size:
-            rms = np.sqrt(np.mean(audio_data**2))
-            return 20 * np.log10(rms + 1e-9)
-            
-        # Reshape to roughly frame_size chunks (discard remainder for speed)
-        num_frames = len(audio_data) // frame_size
-        if num_frames == 0:
-            return -60.0 # Default
-            
-        frames = audio_data[:num_frames * frame_size].reshape(num_frames, frame_size)
-        rms_values = np.sqrt(np.mean(frames**2, axis=1))
-        db_values = 20 * np.log10(rms_values + 1e-9)
+        # One cumulative sum of squares feeds both the environment (20ms) and VAD (30ms) framings
+        cumsum_sq = np.zeros(len(audio) + 1, dtype=np.float64)
+        np.square(audio, out=cumsum_sq[1:], dtype=np.float64)
+        np.add.accumulate(cumsum_sq[1:], out=cumsum_sq[1:])
+        env_frame = int(environment.FRAME_SECONDS * sr)
+        vad_frame = int(vad_module.ENERGY_FRAME_SIZE_SECONDS * sr)
+        vad_hop = int(vad_module.ENERGY_HOP_SIZE_SECONDS * sr)
+        
+        # Dynamic Calibration: Analyze Environment
+        if len(audio) >= env_frame:
+            env_stats = EnvironmentAnalyzer.from_mean_squares(
+                frame_mean_squares(cumsum_sq, env_frame, int(environment.HOP_SECONDS * sr))
+            )
+        else:
+            env_stats = EnvironmentAnalyzer.analyze(audio, sr)
+        noise_floor_db = env_stats["noise_floor_db"]
+        
+        # Adapt silence threshold: Must be at least 6dB above noise floor
+        # But never lower than the configured base threshold (e.g., -60dB)
+        base_threshold = self.silence_threshold_db
+        tuned_threshold = max(base_threshold, noise_floor_db + 6.0)
+        
+        if tuned_threshold > base_threshold:
+            logger.debug(f"BreathSensor: Adapted silence threshold from {base_threshold}dB to {tuned_threshold:.1f}dB due to noise floor ({noise_floor_db:.1f}dB)")
         
-        # 10th percentile captures the quietest parts (background noise)
-        return np.percentile(db_values, 10)
+        # Temporary VAD instance with the tuned threshold for this analysis (lightweight)
+        vad = VoiceActivityDetector(
+            speech_threshold=0.5,
+            min_speech_duration=0.1,
+            min_silence_duration=0.2,
+            silence_threshold_db=tuned_threshold
+        )
+        
+        if len(audio) < vad_frame or vad.silero_session is not None:
+            # Shorter than one VAD frame (VAD's own whole-clip check handles it),
+            # or the Silero model is enabled and does its own framing
+            return vad.detect_speech_segments(audio, sr), tuned_threshold, noise_floor_db
+        
+        energies_db = 20 * np.log10(np.sqrt(frame_mean_squares(cumsum_sq, vad_frame, vad_hop)) + 1e-9)
+        segments = vad.segments_from_energy(energies_db, vad_hop, sr, len(audio) / sr)
+        return segments, tuned_threshold, noise_floor_db
     
     def _monitor_respiration(
         self,
-        audio: np.ndarray,
-        sr: int,
+        segments: List[SpeechSegment],
+        total_duration: float,
     ) -> Dict:
         """
         Monitor respiration to detect "Infinite Lung Capacity" violations.
@@ -240,29 +286,12 @@ class BreathSensor(BaseSensor):
         event" (inhalation noise or silence >200ms), flag as "Superhuman Phonation Duration."
         
         Args:
-            audio: Audio signal
-            sr: Sample rate in Hz
+            segments: Speech segments from _run_vad
+            total_duration: Audio duration in seconds
             
         Returns:
             Dictionary with respiration monitoring results
         """
-        # Use VAD to find speech segments
-        
-        # Similar tuning logic (could refactor to shared method, but keeping localized for now)
-        noise_floor_db = self._calculate_noise_floor(audio)
-        tuned_threshold = self.silence_threshold_db
-        if -80 < noise_floor_db < -30:
-            tuned_threshold = max(self.silence_threshold_db, noise_floor_db + 10.0)
-            
-        vad = VoiceActivityDetector(
-            speech_threshold=0.5,
-            min_speech_duration=0.1,
-            min_silence_duration=0.2,
-            silence_threshold_db=tuned_threshold
-        )
-        
-        segments = vad.detect_speech_segments(audio, sr)
-        
         if not segments:
             return {
                 "has_violation": False,
@@ -270,39 +299,15 @@ class BreathSensor(BaseSensor):
                 "breath_event_count": 0,
             }
         
-        total_duration = len(audio) / sr
-        
-        # Track continuous voiced segments without breath breaks
-        max_voiced_without_breath = 0.0
-        breath_event_count = 0
-        
-        # Process segments and gaps between them
-        for i, segment in enumerate(segments):
-            # Each segment is a speech segment
-            segment_duration = segment.duration_seconds
-            
-            # Check if this segment exceeds the limit
-            if segment_duration > max_voiced_without_breath:
-                max_voiced_without_breath = segment_duration
-            
-            # Check gap before this segment (if not first segment)
-            if i > 0:
-                prev_segment = segments[i - 1]
-                gap_start = prev_segment.end_seconds
-                gap_end = segment.start_seconds
-                gap_duration = gap_end - gap_start
-                
-                # If gap is long enough to be a breath event
-                if gap_duration >= MIN_BREATH_SILENCE_SECONDS:
-                    breath_event_count += 1
-        
-        # Check gap after last segment
-        if segments:
-            last_segment = segments[-1]
-            if last_segment.end_seconds < total_duration:
-                gap_duration = total_duration - last_segment.end_seconds
-                if gap_duration >= MIN_BREATH_SILENCE_SECONDS:
-                    breath_event_count += 1
+        # (start, end) pairs as one float64 array so the scan runs in compiled/vectorized code
+        bounds = np.array(
+            [(seg.start_seconds, seg.end_seconds) for seg in segments], dtype=np.float64
+        )
+        max_voiced_without_breath, breath_event_count = _respiration_stats(
+            bounds, float(total_duration), MIN_BREATH_SILENCE_SECONDS
+        )
+        max_voiced_without_breath = float(max_voiced_without_breath)
+        breath_event_count = int(breath_event_count)
         
         # Check if we have a violation
         has_violation = max_voiced_without_breath > MAX_VOICED_WITHOUT_BREATH_SECONDS
@@ -17,9 +17,14 @@ Output: Breathing regularity score (0-1)
 - Score close to 0: Regular breathing (synthetic/suspicious)
 """
 
+import functools
+from typing import List, Optional
+
 import numpy as np
-import librosa
+from scipy.ndimage import correlate1d
+from scipy.signal import butter, sosfiltfilt
 from .base import BaseSensor, SensorResult
+from .jit import NUMBA_AVAILABLE, njit
 from backend.utils.config import get_threshold
 
 # Constants - can be overridden by config/settings.yaml
@@ -34,6 +39,119 @@ MIN_VARIANCE_THRESHOLD = get_threshold("breathing_pattern", "min_variance", 0.3)
 SNR_THRESHOLD_DB = get_threshold("breathing_pattern", "snr_threshold_db", 10.0)
 # Minimum SNR in dB - reject analysis if background noise is too high
 
+BANDPASS_ORDER = 4  # Butterworth order for the breath-band filter
+RMS_FRAME_LENGTH = 2048  # samples per envelope frame
+RMS_HOP_LENGTH = 512  # samples between envelope frames
+
+# Gaussian smoothing kernel (sigma=2 frames), built once; same taps and
+# truncation (radius = 4 sigma) as scipy.ndimage.gaussian_filter1d
+ENVELOPE_SMOOTH_SIGMA = 2.0
+_SMOOTH_RADIUS = int(4.0 * ENVELOPE_SMOOTH_SIGMA + 0.5)
+_SMOOTH_KERNEL = np.exp(
+    -0.5 * (np.arange(-_SMOOTH_RADIUS, _SMOOTH_RADIUS + 1) / ENVELOPE_SMOOTH_SIGMA) ** 2
+)
+_SMOOTH_KERNEL /= _SMOOTH_KERNEL.sum()
+
+
+def _frame_rms(x: np.ndarray, frame_length: int = 2048, hop_length: int = 512) -> np.ndarray:
+    """
+    Per-frame RMS from one cumulative sum of squares.
+
+    Matches librosa.feature.rms(center=True): the signal is zero-padded by
+    frame_length // 2 on both sides before framing.
+    """
+    pad = frame_length // 2
+    n = len(x)
+    # Single buffer: [0, zeros for left pad, running sum, held final value for right pad]
+    cs = np.zeros(n + 2 * pad + 1, dtype=np.float64)
+    body = cs[pad + 1:pad + 1 + n]
+    np.square(x, out=body, dtype=np.float64)
+    np.add.accumulate(body, out=body)
+    cs[pad + 1 + n:] = cs[pad + n]
+    idx = np.arange(0, n + 2 * pad - frame_length + 1, hop_length)
+    # Clamp tiny negative differences from floating-point cancellation
+    power = np.maximum(cs[idx + frame_length] - cs[idx], 0.0) * (1.0 / frame_length)
+    return np.sqrt(power)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _distance_keep_mask(peaks, order, distance):
+        """Keep-mask for peaks visited in order (ascending height), highest first."""
+        n = peaks.shape[0]
+        keep = np.ones(n, dtype=np.bool_)
+        for i in range(n - 1, -1, -1):
+            j = order[i]
+            if not keep[j]:
+                continue
+            k = j - 1
+            while k >= 0 and peaks[j] - peaks[k] < distance:
+                keep[k] = False
+                k -= 1
+            k = j + 1
+            while k < n and peaks[k] - peaks[j] < distance:
+                keep[k] = False
+                k += 1
+        return keep
+
+    def _select_by_distance(peaks, heights, distance):
+        """Keep-mask for peaks, dropping lower peaks closer than distance (highest first)."""
+        # numba's argsort breaks ties differently; numpy's order matches scipy
+        return _distance_keep_mask(peaks, np.argsort(heights), distance)
+else:
+    def _select_by_distance(peaks, heights, distance):
+        """Keep-mask for peaks, dropping lower peaks closer than distance (highest first)."""
+        n = len(peaks)
+        keep = np.ones(n, dtype=bool)
+        # Peak lists are short (a few per second), so a plain loop is fine here
+        for j in np.argsort(heights)[::-1]:
+            if not keep[j]:
+                continue
+            lo = np.searchsorted(peaks, peaks[j] - distance, side='right')
+            hi = np.searchsorted(peaks, peaks[j] + distance, side='left')
+            keep[lo:j] = False
+            keep[j + 1:hi] = False
+        return keep
+
+
+def _find_peaks(x: np.ndarray, height: float, distance: int) -> np.ndarray:
+    """
+    Indices of peaks with x >= height, at least distance samples apart.
+
+    Equivalent to scipy.signal.find_peaks(x, height=height, distance=distance)[0]
+    (plateaus resolve to their middle sample, higher peaks win on conflicts)
+    without computing the peak properties find_peaks tracks.
+    """
+    if len(x) < 3:
+        return np.array([], dtype=np.intp)
+
+    # Collapse equal-valued runs so plateaus are handled like single samples
+    changes = np.flatnonzero(np.diff(x) != 0)
+    run_starts = np.concatenate(([0], changes + 1))
+    run_ends = np.concatenate((changes, [len(x) - 1]))
+    run_values = x[run_starts]
+
+    is_max = (run_values[1:-1] > run_values[:-2]) & (run_values[1:-1] > run_values[2:])
+    is_max &= run_values[1:-1] >= height
+    idx = np.flatnonzero(is_max) + 1
+    peaks = (run_starts[idx] + run_ends[idx]) // 2
+
+    if len(peaks) > 1 and distance > 1:
+        peaks = peaks[_select_by_distance(peaks, x[peaks], distance)]
+    return peaks
+
+
+@functools.lru_cache(maxsize=8)
+def _breath_bandpass_sos(sr: int, freq_min: float, freq_max: float) -> np.ndarray:
+    """Butterworth bandpass in second-order sections, cached per sample rate/band."""
+    return butter(BANDPASS_ORDER, [freq_min, freq_max], btype='band', fs=sr, output='sos')
+
+
+@functools.lru_cache(maxsize=8)
+def _min_distance_frames(sr: int) -> int:
+    """Minimum peak spacing in envelope frames (MIN_BREATH_INTERVAL), cached per sample rate."""
+    return int(MIN_BREATH_INTERVAL * sr / RMS_HOP_LENGTH)
+
 
 class BreathingPatternSensor(BaseSensor):
     """
@@ -81,8 +199,92 @@ class BreathingPatternSensor(BaseSensor):
         Returns:
             SensorResult with breathing regularity score (0-1)
         """
+        audio_data, snr_db, early_result = self._prepare(audio_data, samplerate)
+        if early_result is not None:
+            return early_result
+
+        # Extract breathing frequency content (20-300Hz)
+        breath_signal = self._extract_breath_frequencies(audio_data, samplerate)
+
+        # Identify breath events
+        breath_times = self._detect_breath_events(breath_signal, samplerate)
+
+        return self._score_breath_times(breath_times, snr_db)
+
+    def analyze_batch(
+        self,
+        audios: List[np.ndarray],
+        samplerates: List[int],
+    ) -> List[SensorResult]:
+        """
+        Analyze several clips, sharing one bandpass filter and RMS pass.
+
+        Clips that pass validation and SNR gating are concatenated with
+        zero gaps of at least MAX_BREATH_INTERVAL (aligned to the RMS hop),
+        filtered and framed once, and the envelope is split back per clip.
+        Peak thresholds are still computed per clip. Filter edge transients
+        differ slightly from per-clip filtering, so results can deviate
+        marginally from analyze() near clip boundaries.
+
+        Args:
+            audios: Audio signals as numpy arrays
+            samplerates: Sample rate of each signal in Hz
+
+        Returns:
+            One SensorResult per input clip, in order
+        """
+        if len(audios) != len(samplerates):
+            raise ValueError("audios and samplerates must have the same length")
+        if len(set(samplerates)) > 1:
+            # Concatenation needs a common sample rate
+            return [self.analyze(a, sr) for a, sr in zip(audios, samplerates)]
+        if not audios:
+            return []
+
+        # Every clip shares sr, so one cached peak distance applies to the whole batch
+        sr = samplerates[0]
+        results: List[Optional[SensorResult]] = [None] * len(audios)
+        accepted = []  # (index, audio, snr_db)
+        for i, audio in enumerate(audios):
+            audio, snr_db, early_result = self._prepare(audio, sr)
+            if early_result is not None:
+                results[i] = early_result
+            else:
+                accepted.append((i, audio, snr_db))
+
+        if accepted:
+            # Offsets are multiples of the hop so each clip's RMS frames line up exactly
+            gap = -(-int(MAX_BREATH_INTERVAL * sr) // RMS_HOP_LENGTH) * RMS_HOP_LENGTH
+            offsets = []
+            total = 0
+            for _, audio, _ in accepted:
+                offsets.append(total)
+                total += -(-(len(audio) + gap) // RMS_HOP_LENGTH) * RMS_HOP_LENGTH
+
+            super_segment = np.zeros(total, dtype=np.float32)
+            for offset, (_, audio, _) in zip(offsets, accepted):
+                super_segment[offset:offset + len(audio)] = audio
+
+            breath_signal = self._extract_breath_frequencies(super_segment, sr)
+            envelope = _frame_rms(breath_signal, RMS_FRAME_LENGTH, RMS_HOP_LENGTH)
+
+            for offset, (i, audio, snr_db) in zip(offsets, accepted):
+                start = offset // RMS_HOP_LENGTH
+                clip_envelope = envelope[start:start + 1 + len(audio) // RMS_HOP_LENGTH]
+                breath_times = self._peaks_from_envelope(clip_envelope, sr)
+                results[i] = self._score_breath_times(breath_times, snr_db)
+
+        return results
+
+    def _prepare(self, audio_data: np.ndarray, samplerate: int):
+        """
+        Validate, convert and SNR-gate one clip.
+
+        Returns:
+            Tuple of (prepared audio, snr_db, early SensorResult or None)
+        """
         if not self.validate_input(audio_data, samplerate):
-            return SensorResult(
+            return audio_data, 0.0, SensorResult(
                 sensor_name=self.name,
                 passed=None,  # Info-only sensor
                 value=0.5,  # Neutral score
@@ -90,7 +292,11 @@ class BreathingPatternSensor(BaseSensor):
                 detail="Invalid or empty audio input."
             )
 
-        # Pad audio if shorter than n_fft (2048) to avoid librosa warnings
+        # float32 halves memory traffic; energy sums and the IIR filter state stay float64
+        if audio_data.dtype != np.float32:
+            audio_data = audio_data.astype(np.float32)
+
+        # Pad audio if shorter than one 2048-sample analysis frame
         if len(audio_data) < 2048:
              padding = 2048 - len(audio_data)
              audio_data = np.pad(audio_data, (0, padding), mode='edge')
@@ -98,7 +304,7 @@ class BreathingPatternSensor(BaseSensor):
         # Check SNR - reject if too noisy
         snr_db = self._calculate_snr(audio_data)
         if snr_db < self.snr_threshold_db:
-            return SensorResult(
+            return audio_data, snr_db, SensorResult(
                 sensor_name=self.name,
                 passed=None,
                 value=0.5,  # Neutral score
@@ -108,12 +314,10 @@ class BreathingPatternSensor(BaseSensor):
                 metadata={"snr_db": round(snr_db, 2), "rejected": True}
             )
 
-        # Extract breathing frequency content (20-300Hz)
-        breath_signal = self._extract_breath_frequencies(audio_data, samplerate)
-
-        # Identify breath events
-        breath_times = self._detect_breath_events(breath_signal, samplerate)
+        return audio_data, snr_db, None
 
+    def _score_breath_times(self, breath_times: np.ndarray, snr_db: float) -> SensorResult:
+        """Score inter-breath interval variability for detected breath times."""
         if len(breath_times) < 2:
             return SensorResult(
                 sensor_name=self.name,
@@ -128,33 +332,33 @@ class BreathingPatternSensor(BaseSensor):
                 }
             )
 
-        # Calculate inter-breath intervals
+        # Inter-breath intervals, filtered to a reasonable range with one mask
         intervals = np.diff(breath_times)
-
-        # Filter intervals to reasonable range
         valid_intervals = intervals[
             (intervals >= MIN_BREATH_INTERVAL) & (intervals <= MAX_BREATH_INTERVAL)
         ]
+        valid_count = valid_intervals.size
 
-        if len(valid_intervals) < 2:
+        if valid_count < 2:
             return SensorResult(
                 sensor_name=self.name,
                 passed=None,
                 value=0.5,
                 threshold=self.min_variance_threshold,
-                detail=f"Insufficient valid breath intervals ({len(valid_intervals)}). "
+                detail=f"Insufficient valid breath intervals ({valid_count}). "
                        f"Need at least 2 for variance calculation.",
                 metadata={
                     "snr_db": round(snr_db, 2),
                     "breath_event_count": len(breath_times),
-                    "valid_interval_count": len(valid_intervals),
+                    "valid_interval_count": valid_count,
                 }
             )
 
         # Calculate coefficient of variation (CV) = std / mean
         # CV normalizes variance by mean, making it scale-invariant
-        mean_interval = np.mean(valid_intervals)
-        std_interval = np.std(valid_intervals)
+        # Array methods skip the np.mean/np.std wrapper dispatch on these tiny arrays
+        mean_interval = float(valid_intervals.mean())
+        std_interval = float(valid_intervals.std())
         cv = std_interval / mean_interval if mean_interval > 0 else 0.0
 
         # Convert CV to regularity score (0-1)
@@ -174,7 +378,7 @@ class BreathingPatternSensor(BaseSensor):
             metadata={
                 "snr_db": round(snr_db, 2),
                 "breath_event_count": len(breath_times),
-                "valid_interval_count": len(valid_intervals),
+                "valid_interval_count": valid_count,
                 "mean_interval_seconds": round(mean_interval, 2),
                 "std_interval_seconds": round(std_interval, 2),
                 "coefficient_of_variation": round(cv, 3),
@@ -210,29 +414,25 @@ class BreathingPatternSensor(BaseSensor):
             SNR in dB
         """
         # Compute frame-wise energy
-        frame_length = 2048
-        hop_length = 512
+        frame_length = RMS_FRAME_LENGTH
+        hop_length = RMS_HOP_LENGTH
 
         # Use RMS energy per frame
-        rms = librosa.feature.rms(
-            y=audio,
-            frame_length=frame_length,
-            hop_length=hop_length
-        )[0]
+        rms = _frame_rms(audio, frame_length, hop_length)
 
         if len(rms) < 10:
             return 0.0  # Too short to estimate SNR
 
-        # Sort RMS values
-        rms_sorted = np.sort(rms)
+        # Only the 20% and 50% split points matter, so partition (O(N)) instead of sorting
+        noise_count = max(1, int(len(rms) * 0.2))
+        signal_start = int(len(rms) * 0.5)
+        rms_split = np.partition(rms, (noise_count, signal_start))
 
         # Estimate noise from bottom 20% percentile
-        noise_percentile = int(len(rms_sorted) * 0.2)
-        noise_rms = np.mean(rms_sorted[:max(1, noise_percentile)])
+        noise_rms = np.mean(rms_split[:noise_count])
 
         # Estimate signal from top 50% percentile
-        signal_start = int(len(rms_sorted) * 0.5)
-        signal_rms = np.mean(rms_sorted[signal_start:])
+        signal_rms = np.mean(rms_split[signal_start:])
 
         # Calculate SNR in dB
         if noise_rms > 0:
@@ -260,29 +460,9 @@ class BreathingPatternSensor(BaseSensor):
         Returns:
             Filtered audio containing only breathing frequency content
         """
-        # Use Short-Time Fourier Transform (STFT) for frequency-domain filtering
-        stft = librosa.stft(audio, n_fft=2048, hop_length=512)
-
-        # Get frequency bins
-        freqs = librosa.fft_frequencies(sr=sr, n_fft=2048)
-
-        # Create bandpass mask for 20-300Hz
-        mask = (freqs >= self.breath_freq_min) & (freqs <= self.breath_freq_max)
-
-        # Apply mask - zero out frequencies outside breathing range
-        stft_filtered = stft.copy()
-        stft_filtered[~mask, :] = 0
-
-        # Convert back to time domain
-        breath_signal = librosa.istft(stft_filtered, hop_length=512)
-
-        # Ensure output length matches input
-        if len(breath_signal) > len(audio):
-            breath_signal = breath_signal[:len(audio)]
-        elif len(breath_signal) < len(audio):
-            breath_signal = np.pad(breath_signal, (0, len(audio) - len(breath_signal)))
-
-        return breath_signal
+        # Zero-phase time-domain IIR bandpass: O(N), and output length equals input length
+        sos = _breath_bandpass_sos(sr, self.breath_freq_min, self.breath_freq_max)
+        return sosfiltfilt(sos, audio)
 
     def _detect_breath_events(
         self,
@@ -303,37 +483,28 @@ class BreathingPatternSensor(BaseSensor):
             Array of breath event times in seconds
         """
         # Compute energy envelope
-        envelope = np.abs(librosa.feature.rms(
-            y=breath_signal,
-            frame_length=2048,
-            hop_length=512
-        )[0])
+        # RMS is non-negative already; no abs() copy needed
+        envelope = _frame_rms(breath_signal, RMS_FRAME_LENGTH, RMS_HOP_LENGTH)
+        return self._peaks_from_envelope(envelope, sr)
 
+    def _peaks_from_envelope(self, envelope: np.ndarray, sr: int) -> np.ndarray:
+        """Breath event times (seconds) from a frame RMS envelope."""
         if len(envelope) == 0:
             return np.array([])
 
         # Smooth envelope
-        from scipy.ndimage import gaussian_filter1d
-        envelope_smooth = gaussian_filter1d(envelope, sigma=2.0)
+        envelope_smooth = correlate1d(envelope, _SMOOTH_KERNEL, mode='reflect')
 
         # Find peaks in envelope (breath events)
-        from scipy.signal import find_peaks
-
         # Adaptive threshold: use median + 1.5 * MAD (Median Absolute Deviation)
         median_env = np.median(envelope_smooth)
         mad = np.median(np.abs(envelope_smooth - median_env))
         threshold = median_env + 1.5 * mad
 
         # Minimum distance between breaths: 1 second
-        min_distance_frames = int(MIN_BREATH_INTERVAL * sr / 512)
-
-        peaks, _ = find_peaks(
-            envelope_smooth,
-            height=threshold,
-            distance=min_distance_frames
-        )
+        peaks = _find_peaks(envelope_smooth, threshold, _min_distance_frames(sr))
 
         # Convert frame indices to time (seconds)
-        breath_times = peaks * 512 / sr
+        breath_times = peaks * RMS_HOP_LENGTH / sr
 
         return breath_times
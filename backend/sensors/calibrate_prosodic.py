@@ -15,15 +15,26 @@ The script will:
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import sys
 
 import numpy as np
 import yaml
 
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+    # soundfile not available - only WAV files can be decoded (via scipy)
+
 # Add parent directory to path for imports
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir.parent))
@@ -33,10 +44,48 @@ from backend.sensors.prosodic_continuity import ProsodicContinuitySensor
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+# Sensor metadata fields collected for calibration statistics
+CALIBRATION_METRICS = (
+    'breaks_per_second',
+    'total_breaks',
+    'pitch_breaks',
+    'energy_breaks',
+    'centroid_breaks',
+    'total_speech_duration',
+)
+
+AUDIO_EXTENSIONS = frozenset({'.wav', '.flac', '.mp3', '.ogg'})
+
+RESULT_CACHE_DIR = Path.home() / '.cache' / 'sonotheia' / 'prosodic_calibration'
+
+# Early stopping: re-check the P95 confidence interval every N successful analyses
+CI_CHECK_INTERVAL = 50
+CI_BOOTSTRAP_RESAMPLES = 200
+
+
+def _read_wav_scipy(filepath: Path) -> tuple[np.ndarray, int]:
+    """Decode a WAV file with scipy and normalize integer PCM to float32."""
+    from scipy.io import wavfile
+    samplerate, audio_data = wavfile.read(filepath)
+    
+    # Convert to float and normalize
+    if audio_data.dtype == np.int16:
+        audio_data = audio_data.astype(np.float32) / 32768.0
+    elif audio_data.dtype == np.int32:
+        audio_data = audio_data.astype(np.float32) / 2147483648.0
+    elif audio_data.dtype == np.uint8:
+        audio_data = (audio_data.astype(np.float32) - 128) / 128.0
+    
+    return audio_data, samplerate
+
 
 def load_audio(filepath: Path) -> tuple[np.ndarray, int]:
     """
-    Load audio file using scipy or other available backend.
+    Load audio file using soundfile, falling back to scipy for WAV.
+    
+    libsndfile decodes WAV, FLAC and OGG (and MP3 from libsndfile 1.1)
+    straight to float32, so no integer-to-float copy is made; the scipy
+    path covers WAV when soundfile is missing or rejects the file.
     
     Args:
         filepath: Path to audio file
@@ -45,16 +94,17 @@ def load_audio(filepath: Path) -> tuple[np.ndarray, int]:
         Tuple of (audio_data, samplerate)
     """
     try:
-        from scipy.io import wavfile
-        samplerate, audio_data = wavfile.read(filepath)
-        
-        # Convert to float and normalize
-        if audio_data.dtype == np.int16:
-            audio_data = audio_data.astype(np.float32) / 32768.0
-        elif audio_data.dtype == np.int32:
-            audio_data = audio_data.astype(np.float32) / 2147483648.0
-        elif audio_data.dtype == np.uint8:
-            audio_data = (audio_data.astype(np.float32) - 128) / 128.0
+        audio_data = None
+        if SOUNDFILE_AVAILABLE:
+            try:
+                audio_data, samplerate = sf.read(str(filepath), dtype='float32', always_2d=False)
+            except Exception:
+                if filepath.suffix.lower() != '.wav':
+                    raise
+        if audio_data is None:
+            if filepath.suffix.lower() != '.wav':
+                raise ValueError(f"soundfile is required to decode {filepath.suffix} files")
+            audio_data, samplerate = _read_wav_scipy(filepath)
         
         # Convert stereo to mono if needed
         if len(audio_data.shape) > 1:
@@ -66,18 +116,155 @@ def load_audio(filepath: Path) -> tuple[np.ndarray, int]:
         return None, None
 
 
-def analyze_organic_samples(organic_dir: Path) -> Dict[str, Any]:
+def p95_bootstrap_ci(
+    values: np.ndarray,
+    n_resamples: int = CI_BOOTSTRAP_RESAMPLES,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """
+    Bootstrap confidence interval for the P95 of a sample.
+    
+    All resamples are drawn as one (n_resamples, n) index matrix and reduced
+    with a single quantile call along axis 1.
+    
+    Args:
+        values: 1-D array of observations
+        n_resamples: Number of bootstrap resamples
+        confidence: Coverage of the returned interval
+        seed: RNG seed, so repeated runs stop at the same point
+        
+    Returns:
+        Tuple of (p95_lo, p95_hi)
+    """
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(values), size=(n_resamples, len(values)))
+    p95s = np.quantile(values[idx], 0.95, axis=1)
+    alpha = (1.0 - confidence) / 2.0
+    p95_lo, p95_hi = np.quantile(p95s, [alpha, 1.0 - alpha])
+    return float(p95_lo), float(p95_hi)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sensor() -> ProsodicContinuitySensor:
+    """Sensor instance shared by all files analyzed in this process."""
+    return ProsodicContinuitySensor()
+
+
+def result_cache_path(filepath: Path) -> Path:
+    """
+    Cache location for a file's analysis outcome, keyed on path, mtime, size
+    and the sensor's scalar settings (so threshold changes miss the cache)
+    
+    Args:
+        filepath: Source audio file
+        
+    Returns:
+        Path of the cached .json file
+    """
+    stat = filepath.stat()
+    settings = sorted(
+        (name, value) for name, value in vars(_get_sensor()).items()
+        if isinstance(value, (bool, int, float, str))
+    )
+    key_src = f"{filepath.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{settings}"
+    key = hashlib.sha1(key_src.encode()).hexdigest()
+    return RESULT_CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def _analyze_file(
+    filepath: Path,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+) -> Tuple[str, Optional[Dict[str, Any]], str]:
+    """
+    Load and analyze one file, or reuse its cached outcome. Runs in
+    process-pool workers.
+    
+    Args:
+        filepath: Path to audio file
+        use_cache: Read/write the on-disk result cache
+        rebuild_cache: Ignore cached outcomes and re-analyze
+        
+    Returns:
+        Tuple of (status, metrics, message) where status is 'ok', 'skipped'
+        or 'failed' and metrics holds the CALIBRATION_METRICS values
+    """
+    # Cache I/O problems (file gone mid-run, read-only or full cache
+    # directory) only cost the cache; they must not abort the pool
+    cache_path = None
+    if use_cache:
+        try:
+            cache_path = result_cache_path(filepath)
+        except OSError:
+            pass  # The load below reports the missing/unreadable file
+    
+    if cache_path is not None and not rebuild_cache:
+        try:
+            status, metrics, message = json.loads(cache_path.read_text())
+            return status, metrics, message
+        except (OSError, ValueError):
+            pass  # Missing or unreadable entry: analyze (again) and overwrite it
+    
+    outcome = _analyze_file_uncached(filepath)
+    
+    # Load/analysis failures may be transient, so only real outcomes are cached
+    if cache_path is not None and outcome[0] != 'failed':
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(outcome, default=lambda value: value.item()))
+        except OSError as e:
+            logger.warning(f"Could not cache result for {filepath.name}: {e}")
+    
+    return outcome
+
+
+def _analyze_file_uncached(filepath: Path) -> Tuple[str, Optional[Dict[str, Any]], str]:
+    """Decode and analyze one file (see _analyze_file)."""
+    audio_data, samplerate = load_audio(filepath)
+    if audio_data is None:
+        return 'failed', None, "Failed to load audio"
+    
+    try:
+        result = _get_sensor().analyze(audio_data, samplerate)
+    except Exception as e:
+        return 'failed', None, f"Failed to analyze: {e}"
+    
+    # Only collect statistics from valid analyses
+    if result.passed is not None and result.metadata:
+        return 'ok', {key: result.metadata[key] for key in CALIBRATION_METRICS}, ""
+    return 'skipped', None, f"Skipped (reason: {result.reason})"
+
+
+def analyze_organic_samples(
+    organic_dir: Path,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    p95_ci_width: Optional[float] = None,
+) -> Dict[str, Any]:
     """
     Analyze all organic samples in a directory.
     
+    Files are decoded and analyzed in a process pool; results are collected
+    in file order on the main process. Per-file outcomes are cached on disk,
+    so re-running calibration on the same directory skips unchanged files.
+    
+    If p95_ci_width is set, the bootstrap CI of the breaks/sec P95 is checked
+    every CI_CHECK_INTERVAL successful analyses and the remaining files are
+    skipped once the interval is narrower than the threshold.
+    
     Args:
         organic_dir: Directory containing organic speech samples
+        workers: Worker processes (default: CPU count; 1 analyzes in-process)
+        use_cache: Read/write the on-disk result cache
+        rebuild_cache: Ignore cached outcomes and re-analyze every file
+        p95_ci_width: Stop early once the P95 CI width (breaks/sec) falls
+            below this value (default: analyze every file)
         
     Returns:
         Dictionary of statistics
     """
-    sensor = ProsodicContinuitySensor()
-    
     # Collect metrics from all samples
     all_breaks_per_second = []
     all_total_breaks = []
@@ -88,47 +275,63 @@ def analyze_organic_samples(organic_dir: Path) -> Dict[str, Any]:
     
     successful_analyses = 0
     failed_analyses = 0
+    stopped_early = False
     
-    # Find all audio files
-    audio_extensions = ['.wav', '.flac', '.mp3', '.ogg']
-    audio_files = []
-    for ext in audio_extensions:
-        audio_files.extend(organic_dir.glob(f'**/*{ext}'))
+    # Find all audio files in a single walk of the tree
+    audio_files = sorted(
+        path for path in organic_dir.rglob('*')
+        if path.suffix.lower() in AUDIO_EXTENSIONS and path.is_file()
+    )
     
     logger.info(f"Found {len(audio_files)} audio files in {organic_dir}")
     
-    for filepath in audio_files:
-        logger.info(f"Analyzing: {filepath.name}")
-        
-        audio_data, samplerate = load_audio(filepath)
-        if audio_data is None:
-            failed_analyses += 1
-            continue
-        
-        try:
-            result = sensor.analyze(audio_data, samplerate)
+    analyze_file = functools.partial(
+        _analyze_file, use_cache=use_cache, rebuild_cache=rebuild_cache
+    )
+    workers = workers or os.cpu_count() or 1
+    executor = None
+    if workers > 1 and len(audio_files) > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        outcomes = executor.map(analyze_file, audio_files, chunksize=4)
+    else:
+        outcomes = map(analyze_file, audio_files)
+    
+    try:
+        for filepath, (status, metrics, message) in zip(audio_files, outcomes):
+            logger.info(f"Analyzing: {filepath.name}")
             
-            # Only collect statistics from valid analyses
-            if result.passed is not None and result.metadata:
-                all_breaks_per_second.append(result.metadata['breaks_per_second'])
-                all_total_breaks.append(result.metadata['total_breaks'])
-                all_pitch_breaks.append(result.metadata['pitch_breaks'])
-                all_energy_breaks.append(result.metadata['energy_breaks'])
-                all_centroid_breaks.append(result.metadata['centroid_breaks'])
-                all_durations.append(result.metadata['total_speech_duration'])
+            if status == 'ok':
+                all_breaks_per_second.append(metrics['breaks_per_second'])
+                all_total_breaks.append(metrics['total_breaks'])
+                all_pitch_breaks.append(metrics['pitch_breaks'])
+                all_energy_breaks.append(metrics['energy_breaks'])
+                all_centroid_breaks.append(metrics['centroid_breaks'])
+                all_durations.append(metrics['total_speech_duration'])
                 successful_analyses += 1
                 
                 logger.info(
-                    f"  Breaks/sec: {result.metadata['breaks_per_second']:.2f}, "
-                    f"Total: {result.metadata['total_breaks']}, "
-                    f"Duration: {result.metadata['total_speech_duration']:.1f}s"
+                    f"  Breaks/sec: {metrics['breaks_per_second']:.2f}, "
+                    f"Total: {metrics['total_breaks']}, "
+                    f"Duration: {metrics['total_speech_duration']:.1f}s"
                 )
-            else:
-                logger.warning(f"  Skipped (reason: {result.reason})")
                 
-        except Exception as e:
-            logger.error(f"  Failed to analyze: {e}")
-            failed_analyses += 1
+                if p95_ci_width is not None and successful_analyses % CI_CHECK_INTERVAL == 0:
+                    p95_lo, p95_hi = p95_bootstrap_ci(np.array(all_breaks_per_second))
+                    if p95_hi - p95_lo < p95_ci_width:
+                        logger.info(
+                            f"P95 CI [{p95_lo:.3f}, {p95_hi:.3f}] narrower than "
+                            f"{p95_ci_width}; stopping after {successful_analyses} samples"
+                        )
+                        stopped_early = True
+                        break
+            elif status == 'skipped':
+                logger.warning(f"  {message}")
+            else:
+                logger.error(f"  {message}")
+                failed_analyses += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
     
     if successful_analyses == 0:
         logger.error("No samples could be analyzed successfully!")
@@ -142,24 +345,31 @@ def analyze_organic_samples(organic_dir: Path) -> Dict[str, Any]:
     centroid_breaks = np.array(all_centroid_breaks)
     durations = np.array(all_durations)
     
+    # One quantile call per array (a single partition pass) instead of
+    # separate median/percentile calls; the median is the q=0.5 entry
+    bps_p50, bps_p90, bps_p95, bps_p99 = np.quantile(breaks_per_second, [0.5, 0.9, 0.95, 0.99])
+    total_breaks_median = np.quantile(total_breaks, 0.5)
+    duration_median = np.quantile(durations, 0.5)
+    
     # Compute statistics
     stats = {
         'num_samples': successful_analyses,
         'failed_samples': failed_analyses,
+        'stopped_early': stopped_early,
         'breaks_per_second': {
             'mean': float(np.mean(breaks_per_second)),
             'std': float(np.std(breaks_per_second)),
-            'median': float(np.median(breaks_per_second)),
-            'p50': float(np.percentile(breaks_per_second, 50)),
-            'p90': float(np.percentile(breaks_per_second, 90)),
-            'p95': float(np.percentile(breaks_per_second, 95)),
-            'p99': float(np.percentile(breaks_per_second, 99)),
+            'median': float(bps_p50),
+            'p50': float(bps_p50),
+            'p90': float(bps_p90),
+            'p95': float(bps_p95),
+            'p99': float(bps_p99),
             'max': float(np.max(breaks_per_second)),
         },
         'total_breaks': {
             'mean': float(np.mean(total_breaks)),
             'std': float(np.std(total_breaks)),
-            'median': float(np.median(total_breaks)),
+            'median': float(total_breaks_median),
         },
         'pitch_breaks': {
             'mean': float(np.mean(pitch_breaks)),
@@ -175,7 +385,7 @@ def analyze_organic_samples(organic_dir: Path) -> Dict[str, Any]:
         },
         'speech_duration': {
             'mean': float(np.mean(durations)),
-            'median': float(np.median(durations)),
+            'median': float(duration_median),
         }
     }
     
@@ -240,6 +450,20 @@ def main():
         action='store_true',
         help='Output statistics in JSON format'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for analysis (default: CPU count; 1 disables the pool)'
+    )
+    parser.add_argument('--no-cache', action='store_true', help='Disable the on-disk result cache')
+    parser.add_argument('--rebuild-cache', action='store_true', help='Re-analyze files and refresh the cache')
+    parser.add_argument(
+        '--p95-ci-width',
+        type=float,
+        default=None,
+        help='Stop once the bootstrap 95%% CI of breaks/sec P95 is narrower than this (e.g. 0.02)'
+    )
     
     args = parser.parse_args()
     
@@ -254,7 +478,13 @@ def main():
     logger.info("")
     
     # Analyze samples
-    stats = analyze_organic_samples(args.organic_dir)
+    stats = analyze_organic_samples(
+        args.organic_dir,
+        workers=args.workers,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache,
+        p95_ci_width=args.p95_ci_width,
+    )
     
     if stats is None:
         return 1
@@ -265,6 +495,8 @@ def main():
     logger.info("=" * 60)
     logger.info(f"Samples analyzed: {stats['num_samples']}")
     logger.info(f"Failed samples: {stats['failed_samples']}")
+    if stats['stopped_early']:
+        logger.info("Stopped early: P95 confidence interval reached target width")
     logger.info("")
     logger.info("Breaks per second:")
     logger.info(f"  Mean:   {stats['breaks_per_second']['mean']:.2f}")
@@ -6,15 +6,22 @@ Analyzes formant transition patterns to detect physically impossible or
 unnatural phoneme blending that indicates synthetic speech.
 """
 
+import functools
+
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import irfft, next_fast_len, rfft
 from typing import Optional
 from .base import BaseSensor, SensorResult
+from .jit import NUMBA_AVAILABLE, njit, prange
 
 # Detection thresholds
 MIN_VOWEL_DURATION_MS = 50.0  # Minimum duration for a stable vowel
 MAX_TRANSITION_SPEED_HZ_MS = 30.0  # Maximum formant transition speed (Hz/ms)
 MIN_COARTICULATION_OVERLAP_MS = 20.0  # Minimum overlap between phonemes
 FORMANT_STABILITY_THRESHOLD = 50.0  # Hz variance for stable vowel
+SILENT_FRAME_PEAK = 0.01  # Windowed frames with a lower peak amplitude are skipped
+DEFAULT_FORMANTS_HZ = (500.0, 1500.0, 2500.0)  # Fill-ins when a frame has too few poles
 
 TRANSITION_CONSTRAINTS = {
     "max_formant_velocity_hz_ms": 30.0,
@@ -23,6 +30,171 @@ TRANSITION_CONSTRAINTS = {
 }
 
 
+def _transition_durations(
+    f1_diff: np.ndarray,
+    transition_indices: np.ndarray,
+    quiet_threshold: float,
+) -> np.ndarray:
+    """
+    Frames from each transition back to the nearest quiet frame.
+
+    A quiet frame has f1_diff below quiet_threshold and must lie within
+    max(1, idx - 9)..idx - 1; transitions without one get duration 0. A
+    running maximum of quiet-frame indices answers every transition at
+    once instead of scanning back up to 10 frames per transition.
+    """
+    quiet = f1_diff < quiet_threshold
+    last_quiet = np.maximum.accumulate(np.where(quiet, np.arange(len(f1_diff)), -1))
+    start_idx = np.where(
+        transition_indices > 0, last_quiet[np.maximum(transition_indices - 1, 0)], -1
+    )
+    found = start_idx >= np.maximum(1, transition_indices - 9)
+    return np.where(found, transition_indices - start_idx, 0)
+
+
+@functools.lru_cache(maxsize=8)
+def _hamming(frame_length: int) -> np.ndarray:
+    """Hamming window, built once per frame length and shared read-only."""
+    window = np.hamming(frame_length)
+    window.flags.writeable = False
+    return window
+
+
+def _autocorr_batch(frames: np.ndarray, n_lags: int) -> np.ndarray:
+    """
+    First n_lags autocorrelation lags of every row of frames.
+
+    One real FFT over the whole (N, L) matrix; an FFT length of at least 2L
+    keeps the circular correlation equal to the linear one for these lags.
+    The power spectrum is re**2 + im**2, which skips the sqrt in np.abs.
+    The FFTs stay single-threaded since sensors already run in parallel.
+    """
+    nfft = next_fast_len(2 * frames.shape[1], real=True)
+    spectrum = rfft(frames, n=nfft, axis=1)
+    power = spectrum.real * spectrum.real
+    power += spectrum.imag * spectrum.imag
+    return irfft(power, n=nfft, axis=1)[:, :n_lags]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _gate_and_window(frames, window, threshold):
+        """
+        Windowed copies of the frames whose windowed peak reaches threshold.
+
+        The first pass only reads each frame to find its windowed peak; the
+        second writes the kept frames straight into the compacted output, so
+        no full-size windowed temporary or mask-indexing copy is made.
+        """
+        n_frames, frame_length = frames.shape
+        keep = np.zeros(n_frames, dtype=np.bool_)
+        for i in prange(n_frames):
+            peak = frames.dtype.type(0.0)
+            for k in range(frame_length):
+                peak = max(peak, abs(frames[i, k] * window[k]))
+            keep[i] = peak >= threshold
+        rows = np.cumsum(keep) - 1
+        out = np.empty((rows[-1] + 1 if n_frames else 0, frame_length), dtype=frames.dtype)
+        for i in prange(n_frames):
+            if keep[i]:
+                for k in range(frame_length):
+                    out[rows[i], k] = frames[i, k] * window[k]
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _levinson_durbin_row(autocorr, order):
+        """Levinson-Durbin recursion for one autocorrelation vector."""
+        lpc = np.zeros(order + 1)  # a zero tail is the result if the recursion stops early
+        lpc[0] = 1.0
+        error = autocorr[0]
+        for i in range(order):
+            if error == 0:
+                break
+            reflection = autocorr[i + 1]
+            for j in range(1, i + 1):
+                reflection -= lpc[j] * autocorr[i + 1 - j]
+            reflection /= error
+            lpc[i + 1] = reflection
+            for j in range(1, (i + 2) // 2 + 1):
+                temp = lpc[j]
+                lpc[j] = temp - reflection * lpc[i + 1 - j]
+                if j != i + 1 - j:
+                    lpc[i + 1 - j] -= reflection * temp
+            error *= 1 - reflection * reflection
+        return lpc
+
+    @njit(cache=True, parallel=True)
+    def _levinson_durbin_batch(autocorr, order):
+        """LPC coefficients (N, order + 1) for each row of autocorr, rows in parallel."""
+        lpc = np.empty((autocorr.shape[0], order + 1))
+        for n in prange(autocorr.shape[0]):
+            lpc[n] = _levinson_durbin_row(autocorr[n], order)
+        return lpc
+else:
+    def _gate_and_window(frames, window, threshold):
+        """Windowed copies of the frames whose windowed peak reaches threshold."""
+        # The window never exceeds 1, so frames that are already quiet before
+        # windowing are dropped without being windowed; the exact check on
+        # the windowed peak then runs on the rest only.
+        frames = frames[np.max(np.abs(frames), axis=1) >= threshold]
+        windowed = frames * window
+        return windowed[np.max(np.abs(windowed), axis=1) >= threshold]
+
+    def _levinson_durbin_batch(autocorr, order):
+        """LPC coefficients (N, order + 1) for each row of autocorr, rows in parallel."""
+        # Same recursion as the JIT kernel, vectorized across rows. A row whose
+        # prediction error reaches zero gets zero reflections from then on,
+        # which leaves its coefficients unchanged (the scalar loop's break).
+        lpc = np.zeros((autocorr.shape[0], order + 1))
+        lpc[:, 0] = 1.0
+        error = autocorr[:, 0].astype(np.float64)
+        for i in range(order):
+            reflection = autocorr[:, i + 1] - np.sum(lpc[:, 1:i + 1] * autocorr[:, i:0:-1], axis=1)
+            reflection = np.divide(
+                reflection, error, out=np.zeros_like(reflection), where=error != 0
+            )
+            lpc[:, i + 1] = reflection
+            for j in range(1, (i + 2) // 2 + 1):
+                temp = lpc[:, j].copy()
+                lpc[:, j] = temp - reflection * lpc[:, i + 1 - j]
+                if j != i + 1 - j:
+                    lpc[:, i + 1 - j] -= reflection * temp
+            error *= 1 - reflection * reflection
+        return lpc
+
+
+def _formants_from_lpc(lpc: np.ndarray, sr: int, n_formants: int) -> np.ndarray:
+    """
+    Lowest n_formants formant frequencies (Hz) for each row of LPC coefficients.
+
+    np.roots builds a companion matrix and calls eigvals once per polynomial;
+    here all companion matrices are stacked into one (N, p, p) tensor so
+    LAPACK is entered once for the whole batch. Rows with fewer usable poles
+    than n_formants are padded with DEFAULT_FORMANTS_HZ.
+    """
+    n_rows, order = lpc.shape[0], lpc.shape[1] - 1
+    companion = np.zeros((n_rows, order, order), dtype=lpc.dtype)
+    companion[:, 0, :] = -lpc[:, 1:] / lpc[:, :1]
+    idx = np.arange(order - 1)
+    companion[:, idx + 1, idx] = 1.0
+    roots = np.linalg.eigvals(companion)
+
+    # Stable poles with positive angle, converted to Hz and limited to the formant range
+    angles = np.angle(roots)
+    formants = angles * (sr / (2 * np.pi))
+    usable = (np.abs(roots) < 1.0) & (angles > 0) & (formants > 50) & (formants < 5000)
+    formants[~usable] = np.inf
+    formants.sort(axis=1)
+
+    # Preallocated output starts as the defaults; found formants overwrite them in place
+    out = np.empty((n_rows, n_formants))
+    out[:] = [DEFAULT_FORMANTS_HZ[min(i, len(DEFAULT_FORMANTS_HZ) - 1)] for i in range(n_formants)]
+    n_found = min(n_formants, formants.shape[1])
+    lowest = formants[:, :n_found]
+    np.copyto(out[:, :n_found], lowest, where=np.isfinite(lowest))
+    return out
+
+
 class CoarticulationSensor(BaseSensor):
     """
     Coarticulation sensor that detects unnatural phoneme transitions.
@@ -54,6 +226,7 @@ class CoarticulationSensor(BaseSensor):
         self.hop_length_ms = hop_length_ms
         self.sample_rate = None # Will be set during analyze
         self.hop_length = None # Will be set during analyze
+        self.hop_ms = None # Frame hop in ms, set during analyze
     
     def analyze(self, audio_data: np.ndarray, samplerate: int) -> SensorResult:
         """
@@ -78,6 +251,7 @@ class CoarticulationSensor(BaseSensor):
         # Set runtime parameters
         self.sample_rate = samplerate
         self.hop_length = int(self.hop_length_ms * samplerate / 1000)
+        self.hop_ms = self.hop_length * 1000 / samplerate
         
         try:
             # Extract formant trajectories
@@ -177,73 +351,28 @@ class CoarticulationSensor(BaseSensor):
         if len(audio) < frame_length:
             return None
         
-        trajectories = []
-        
-        for i in range(0, len(audio) - frame_length + 1, hop_length):
-            frame = audio[i:i + frame_length]
-            
-            # Apply window
-            windowed = frame * np.hamming(len(frame))
-            
-            # Skip silent frames
-            if np.max(np.abs(windowed)) < 0.01:
-                continue
-            
-            # Extract formants using LPC (simplified version)
-            try:
-                formants = self._extract_formants_frame(windowed, sr, self.n_formants)
-                if formants and len(formants) == self.n_formants:
-                    trajectories.append(formants)
-            except Exception:
-                continue
-        
-        if len(trajectories) < 3:
-            return None
-        
-        return np.array(trajectories)
-    
-    def _extract_formants_frame(
-        self,
-        frame: np.ndarray,
-        sr: int,
-        n_formants: int,
-    ) -> list[float]:
-        """Extract formants from a single frame using LPC."""
-        # Reuse vocal tract sensor's LPC method
-        lpc_order = sr // 1000 + 2
-        
-        # FFT-based autocorrelation
-        autocorr = self._autocorr_fft(frame)
-        autocorr = autocorr[:lpc_order + 1]
-        
-        # Levinson-Durbin
-        lpc_coeffs = self._levinson_durbin(autocorr, lpc_order)
+        # Everything runs in float64: at the LPC orders used here (~18 at
+        # 16kHz, ~50 at 48kHz) float32 framing error moves the formants
+        audio = np.asarray(audio, dtype=np.float64)
         
-        # Find roots
-        roots = np.roots(lpc_coeffs)
+        # Frame the whole signal as a strided view
+        frames = sliding_window_view(audio, frame_length)[::hop_length]
         
-        # Filter stable poles
-        stable_mask = np.abs(roots) < 1.0
-        stable_roots = roots[stable_mask]
-        angles = np.angle(stable_roots)
+        # Skip silent frames and window the rest
+        voiced = _gate_and_window(frames, _hamming(frame_length), SILENT_FRAME_PEAK)
         
-        # Convert to Hz
-        positive_mask = angles > 0
-        positive_angles = angles[positive_mask]
-        formants = (positive_angles * sr) / (2 * np.pi)
+        # LPC coefficients per voiced frame (FFT autocorrelation + Levinson-Durbin)
+        lpc_order = sr // 1000 + 2
+        autocorr = _autocorr_batch(voiced, lpc_order + 1)
+        lpc = _levinson_durbin_batch(np.ascontiguousarray(autocorr, dtype=np.float64), lpc_order)
         
-        # Sort and filter
-        formants = np.sort(formants)
-        formants = formants[(formants > 50) & (formants < 5000)]
+        # Drop degenerate frames (np.roots would have failed on them)
+        lpc = lpc[np.isfinite(lpc).all(axis=1) & (lpc[:, 0] != 0)]
         
-        if len(formants) < n_formants:
-            defaults = [500.0, 1500.0, 2500.0]
-            formants_list = formants.tolist()
-            for i in range(len(formants), n_formants):
-                formants_list.append(defaults[i] if i < len(defaults) else defaults[-1])
-            return formants_list[:n_formants]
+        if len(lpc) < 3 or self.n_formants < 1:
+            return None
         
-        return formants[:n_formants].tolist()
+        return _formants_from_lpc(lpc, sr, self.n_formants)
     
     def _analyze_formant_velocities(
         self,
@@ -258,9 +387,8 @@ class CoarticulationSensor(BaseSensor):
         f2_velocity = np.abs(np.diff(f2_trajectory))
         
         # Convert to Hz/ms
-        hop_ms = self.hop_length * 1000 / self.sample_rate
-        f1_velocity_hz_ms = f1_velocity / hop_ms
-        f2_velocity_hz_ms = f2_velocity / hop_ms
+        f1_velocity_hz_ms = f1_velocity / self.hop_ms
+        f2_velocity_hz_ms = f2_velocity / self.hop_ms
         
         mean_f1_vel = float(np.mean(f1_velocity_hz_ms))
         mean_f2_vel = float(np.mean(f2_velocity_hz_ms))
@@ -299,19 +427,22 @@ class CoarticulationSensor(BaseSensor):
         
         # Rolling correlation between adjacent windows
         window_size = 5
-        correlations = []
+        if len(f1_trajectory) <= window_size:
+            return 0.5, 0.5
         
-        for i in range(len(f1_trajectory) - window_size):
-            window1 = f1_trajectory[i:i + window_size]
-            window2 = f1_trajectory[i + 1:i + window_size + 1]
-            
-            if np.std(window1) > 0 and np.std(window2) > 0:
-                corr = np.corrcoef(window1, window2)[0, 1]
-                correlations.append(corr)
+        # Pearson correlation of every window with its one-frame shift, all rows at once
+        windows = sliding_window_view(f1_trajectory, window_size)
+        centered = windows - windows.mean(axis=1, keepdims=True)
+        ss = np.einsum('ij,ij->i', centered, centered)
+        cross = np.einsum('ij,ij->i', centered[:-1], centered[1:])
+        ss1, ss2 = ss[:-1], ss[1:]
         
-        if len(correlations) == 0:
+        # Constant windows have no defined correlation and are skipped
+        defined = (ss1 > 0) & (ss2 > 0)
+        if not defined.any():
             return 0.5, 0.5
         
+        correlations = np.clip(cross[defined] / np.sqrt(ss1[defined] * ss2[defined]), -1.0, 1.0)
         mean_continuity = float(np.mean(correlations))
         min_continuity = TRANSITION_CONSTRAINTS["min_formant_continuity"]
         
@@ -343,22 +474,11 @@ class CoarticulationSensor(BaseSensor):
             return 0.5
         
         # Measure transition duration
-        transition_durations = []
-        
-        for idx in transition_indices:
-            start_idx = idx
-            for i in range(idx - 1, max(0, idx - 10), -1):
-                if f1_diff[i] < threshold * 0.3:
-                    start_idx = i
-                    break
-            
-            duration = idx - start_idx
-            transition_durations.append(duration)
+        transition_durations = _transition_durations(f1_diff, transition_indices, threshold * 0.3)
         
         mean_duration = np.mean(transition_durations)
         min_duration = TRANSITION_CONSTRAINTS["min_transition_duration_ms"]
-        hop_ms = self.hop_length * 1000 / self.sample_rate
-        min_frames = min_duration / hop_ms
+        min_frames = min_duration / self.hop_ms
         
         if mean_duration < min_frames:
             anomaly_score = 0.7
@@ -374,9 +494,12 @@ class CoarticulationSensor(BaseSensor):
         """Analyze carryover coarticulation patterns."""
         f1_trajectory = formants[:, 0]
         
-        # Calculate acceleration (second derivative)
-        f1_accel = np.diff(np.diff(f1_trajectory))
-        mean_abs_accel = np.mean(np.abs(f1_accel))
+        # Calculate acceleration (second derivative) as f[n+2] - 2 f[n+1] + f[n],
+        # built and rectified in one buffer instead of two np.diff temporaries
+        f1_accel = np.subtract(f1_trajectory[2:], f1_trajectory[1:-1])
+        f1_accel -= f1_trajectory[1:-1]
+        f1_accel += f1_trajectory[:-2]
+        mean_abs_accel = np.abs(f1_accel, out=f1_accel).mean()
         
         # Threshold based on typical values
         if mean_abs_accel < 5.0:
@@ -409,43 +532,3 @@ class CoarticulationSensor(BaseSensor):
         )
         
         return float(np.clip(overall, 0.0, 1.0))
-    
-    def _autocorr_fft(self, x: np.ndarray) -> np.ndarray:
-        """Compute autocorrelation using FFT."""
-        n = len(x)
-        padded = np.pad(x, (0, n), mode='constant')
-        fft_x = np.fft.fft(padded)
-        autocorr = np.fft.ifft(fft_x * np.conj(fft_x))
-        return np.real(autocorr[:n])
-    
-    def _levinson_durbin(
-        self,
-        autocorr: np.ndarray,
-        order: int,
-    ):
-        """Levinson-Durbin recursion for LPC coefficient calculation."""
-        lpc = np.zeros(order + 1)
-        lpc[0] = 1.0
-        
-        error = autocorr[0]
-        
-        for i in range(order):
-            if error == 0:
-                break
-            
-            reflection = autocorr[i + 1]
-            for j in range(1, i + 1):
-                reflection -= lpc[j] * autocorr[i + 1 - j]
-            reflection /= error
-            
-            lpc[i + 1] = reflection
-            for j in range(1, (i + 2) // 2 + 1):
-                temp = lpc[j]
-                lpc[j] = temp - reflection * lpc[i + 1 - j]
-                if j != i + 1 - j:
-                    lpc[i + 1 - j] -= reflection * temp
-            
-            error *= 1 - reflection * reflection
-        
-        return lpc
-
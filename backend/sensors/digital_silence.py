@@ -14,9 +14,13 @@ Design-Around Strategy: Uses spectral flux and noise floor analysis (NOT Linear
 analysis) to detect perfect mathematical silence and instant texture changes.
 """
 
+import functools
+
 import numpy as np
-from typing import Dict
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Optional, Tuple
 from scipy import signal
+from scipy.fft import rfft
 try:
     import librosa
     HAS_LIBROSA = True
@@ -24,6 +28,7 @@ except ImportError:
     HAS_LIBROSA = False
 
 from .base import BaseSensor, SensorResult
+from .jit import NUMBA_AVAILABLE, njit
 from backend.calibration.environment import EnvironmentAnalyzer
 
 # Detection thresholds
@@ -32,6 +37,103 @@ PERFECT_SILENCE_THRESHOLD_DB = -120.0  # Below this is effectively perfect silen
 SPECTRAL_FLUX_CHANGE_THRESHOLD = 0.5  # Instant spectral flux change indicates splicing
 MIN_BACKGROUND_ENERGY_DB = -80.0  # Natural recordings have background energy above this
 ROOM_TONE_DISTANCE_THRESHOLD = 0.5 # Distance threshold for room tone inconsistency
+QUIET_RMS_FRAME_LENGTH = 2048  # Frame length of the RMS used to find quiet regions
+
+# Clips longer than this are processed in blocks of this many seconds, so no
+# full-clip spectrogram or RMS frame matrix is held in memory
+STREAM_BLOCK_SECONDS = 30.0
+
+
+def _room_tone_signature(magnitude: np.ndarray, freqs: np.ndarray) -> tuple[float, float]:
+    """
+    Mean spectral centroid and flatness over the frames (rows) of magnitude.
+
+    Same per-frame formulas as librosa.feature.spectral_centroid and
+    spectral_flatness (power 2, amin 1e-10), computed directly on the slice
+    instead of re-normalizing through librosa.
+    """
+    total = magnitude.sum(axis=1)
+    centroids = np.divide(magnitude @ freqs, total, out=np.zeros_like(total), where=total > 0)
+    power = np.maximum(np.square(magnitude), 1e-10)
+    gmean = np.exp(np.mean(np.log(power), axis=1))
+    flatness = gmean / np.mean(power, axis=1)
+    return float(np.mean(centroids)), float(np.mean(flatness))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _frame_mean_square(audio, frame_length, hop_length):
+        """Mean square of each frame starting at 0, hop, ... before len(audio) - frame_length."""
+        n_frames = (len(audio) - frame_length - 1) // hop_length + 1
+        out = np.empty(n_frames)
+        for k in range(n_frames):
+            base = k * hop_length
+            total = 0.0
+            for j in range(frame_length):
+                v = audio[base + j]
+                total += v * v
+            out[k] = total / frame_length
+        return out
+else:
+    def _frame_mean_square(audio, frame_length, hop_length):
+        """Mean square of each frame starting at 0, hop, ... before len(audio) - frame_length."""
+        # Square once and frame the squares as a strided view; dropping the
+        # last sample keeps the frame starts above
+        squared = np.square(audio[:-1])
+        return np.mean(sliding_window_view(squared, frame_length)[::hop_length], axis=1)
+
+
+@functools.lru_cache(maxsize=8)
+def _hann(nperseg: int, dtype: np.dtype = np.dtype(np.float64)) -> np.ndarray:
+    """Periodic Hann window (scipy.signal.stft's default), built once per dtype and shared read-only."""
+    window = signal.get_window("hann", nperseg).astype(dtype)
+    window.flags.writeable = False
+    return window
+
+
+def _stft_frames(audio: np.ndarray, nperseg: int, hop_length: int) -> np.ndarray:
+    """
+    Strided (frames x nperseg) view of the samples scipy.signal.stft frames.
+    
+    The audio gets nperseg // 2 zeros on each side and is zero-padded to a
+    whole number of hops; only that padded copy is allocated.
+    """
+    half = nperseg // 2
+    tail = (-(len(audio) + 2 * half - nperseg) % hop_length) % nperseg
+    padded = np.pad(audio, (half, half + tail))
+    return sliding_window_view(padded, nperseg)[::hop_length]
+
+
+def _frames_magnitude(frames: np.ndarray) -> np.ndarray:
+    """
+    Hann-windowed rfft magnitude of each frame (row).
+    
+    scipy's 1 / sum(window) scaling is left out: callers only use
+    magnitudes relative to each other.
+    """
+    # A window in the audio's dtype keeps float32 input in float32/complex64
+    spectrum = rfft(frames * _hann(frames.shape[1], frames.dtype), axis=1)
+    # |z| = sqrt(re**2 + im**2), accumulated in one real buffer
+    magnitude = np.square(spectrum.real)
+    magnitude += np.square(spectrum.imag)
+    return np.sqrt(magnitude, out=magnitude)
+
+
+def _frame_flux(magnitude: np.ndarray) -> np.ndarray:
+    """Sum of squared differences between consecutive frames (rows)."""
+    # The einsum squares and sums without a second frame-sized temporary
+    frame_diff = np.diff(magnitude, axis=0)
+    return np.einsum('ij,ij->i', frame_diff, frame_diff)
+
+
+def _stft_magnitude(audio: np.ndarray, nperseg: int, hop_length: int) -> np.ndarray:
+    """
+    STFT magnitude, frames along axis 0.
+    
+    Same frames as scipy.signal.stft, transformed with one rfft over the
+    strided frame matrix.
+    """
+    return _frames_magnitude(_stft_frames(audio, nperseg, hop_length))
 
 
 class DigitalSilenceSensor(BaseSensor):
@@ -48,6 +150,8 @@ class DigitalSilenceSensor(BaseSensor):
       source-filter theory error signals
     """
     
+    uses_env_stats = True
+    
     def __init__(
         self,
         frame_length_ms: float = 25.0,
@@ -65,20 +169,118 @@ class DigitalSilenceSensor(BaseSensor):
         super().__init__("Digital Silence Sensor", category=category)
         self.frame_length_ms = frame_length_ms
         self.hop_length_ms = hop_length_ms
+        # Sample-rate-dependent framing, filled in by _frame_params
+        self._frame_params_by_sr: Dict[int, Tuple[int, int, int, np.ndarray]] = {}
     
-    def analyze(self, audio_data: np.ndarray, samplerate: int) -> SensorResult:
+    def analyze(
+        self,
+        audio_data: np.ndarray,
+        samplerate: int,
+        env_stats: Optional[Dict[str, float]] = None,
+    ) -> SensorResult:
         """
         Analyze audio for digital silence artifacts.
         
         Args:
             audio_data: Audio signal as numpy array
             samplerate: Sample rate in Hz
+            env_stats: Precomputed EnvironmentAnalyzer.analyze(audio_data, samplerate)
             
         Returns:
             SensorResult with digital silence analysis
         """
+        audio_data, early_result = self._prepare(audio_data, samplerate, env_stats)
+        if early_result is not None:
+            return early_result
+        return self._analyze_prepared(audio_data, samplerate)
+    
+    def analyze_batch(
+        self,
+        audios: List[np.ndarray],
+        samplerates: List[int],
+    ) -> List[SensorResult]:
+        """
+        Analyze several clips, sharing one spectrogram pass.
+        
+        Clips that pass validation and environment gating are concatenated
+        with zero gaps covering the STFT edge padding (aligned to the hop),
+        transformed with one rfft, and each clip reads back its own frames.
+        Those frames are identical to the clip's own spectrogram, so results
+        match analyze(); the noise floor and quiet-region search stay per clip.
+        Clips longer than STREAM_BLOCK_SECONDS are analyzed on their own,
+        block-wise, rather than joining the shared spectrogram.
+        
+        Args:
+            audios: Audio signals as numpy arrays
+            samplerates: Sample rate of each signal in Hz
+            
+        Returns:
+            One SensorResult per input clip, in order
+        """
+        if len(audios) != len(samplerates):
+            raise ValueError("audios and samplerates must have the same length")
+        if len(set(samplerates)) > 1:
+            # Concatenation needs a common sample rate
+            return [self.analyze(a, sr) for a, sr in zip(audios, samplerates)]
+        if not audios:
+            return []
+        
+        sr = samplerates[0]
+        results: List[Optional[SensorResult]] = [None] * len(audios)
+        accepted = []  # (index, audio)
+        for i, audio in enumerate(audios):
+            audio, early_result = self._prepare(audio, sr)
+            if early_result is not None:
+                results[i] = early_result
+            elif self._is_streamed(audio, sr):
+                results[i] = self._analyze_prepared(audio, sr)
+            else:
+                accepted.append((i, audio))
+        
+        if accepted:
+            _, hop_length, nperseg, _ = self._frame_params(sr)
+            # Each clip is followed by at least the nperseg // 2 + tail zeros
+            # its own STFT would pad with; offsets stay multiples of the hop
+            pad = nperseg // 2 + nperseg
+            offsets = []
+            total = 0
+            for _, audio in accepted:
+                offsets.append(total)
+                total += -(-(len(audio) + pad) // hop_length) * hop_length
+            
+            super_segment = np.zeros(total, dtype=np.float32)
+            for offset, (_, audio) in zip(offsets, accepted):
+                super_segment[offset:offset + len(audio)] = audio
+            
+            magnitude = self._spectrogram(super_segment, sr)
+            
+            for offset, (i, audio) in zip(offsets, accepted):
+                half = nperseg // 2
+                tail = (-(len(audio) + 2 * half - nperseg) % hop_length) % nperseg
+                n_frames = (len(audio) + 2 * half + tail - nperseg) // hop_length + 1
+                start = offset // hop_length
+                results[i] = self._analyze_prepared(audio, sr, magnitude[start:start + n_frames])
+        
+        return results
+    
+    def _prepare(
+        self,
+        audio_data: np.ndarray,
+        samplerate: int,
+        env_stats: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Validate, convert and environment-gate one clip.
+        
+        The environment is measured on the caller's buffer, before the
+        float32 conversion, unless the registry passes in env_stats it
+        already computed for this clip.
+        
+        Returns:
+            Tuple of (prepared audio, early SensorResult or None)
+        """
         if not self.validate_input(audio_data, samplerate):
-            return SensorResult(
+            return audio_data, SensorResult(
                 sensor_name=self.name,
                 passed=None,  # Info-only sensor
                 value=0.0,
@@ -88,7 +290,7 @@ class DigitalSilenceSensor(BaseSensor):
         
         # Skip analysis for very short audio (avoids false positives from zero-padding)
         if len(audio_data) < 2048:
-             return SensorResult(
+             return audio_data, SensorResult(
                 sensor_name=self.name,
                 passed=None, # Abstain/Neutral
                 value=0.0,
@@ -98,23 +300,45 @@ class DigitalSilenceSensor(BaseSensor):
         
         try:
             # Dynamic Calibration: Check environment first
-            env_stats = EnvironmentAnalyzer.analyze(audio_data, samplerate)
-            
-            # If noise floor is too high (> -40dB), digital silence detection is unreliable
-            # because the noise masks the artifacts.
-            if env_stats["is_noisy"] and env_stats["noise_floor_db"] > -40.0:
-                 return SensorResult(
-                    sensor_name=self.name,
-                    passed=True, # Trust defense
-                    value=0.0,
-                    threshold=0.5,
-                    detail=f"Skipped due to high noise floor ({env_stats['noise_floor_db']:.1f}dB). Environment too noisy for silence analysis."
-                )
-
-            # Analyze noise floor and spectral flux
+            if env_stats is None:
+                env_stats = EnvironmentAnalyzer.analyze(audio_data, samplerate)
+        except Exception as e:
+            return audio_data, self._error_result(e)
+        
+        # All analyses run in float32: decoders deliver float32 or int16, and
+        # the thresholds (dB levels, relative flux jumps) are far coarser than
+        # float32 rounding
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        
+        # If noise floor is too high (> -40dB), digital silence detection is unreliable
+        # because the noise masks the artifacts.
+        if env_stats["is_noisy"] and env_stats["noise_floor_db"] > -40.0:
+             return audio_data, SensorResult(
+                sensor_name=self.name,
+                passed=True, # Trust defense
+                value=0.0,
+                threshold=0.5,
+                detail=f"Skipped due to high noise floor ({env_stats['noise_floor_db']:.1f}dB). Environment too noisy for silence analysis."
+            )
+        
+        return audio_data, None
+    
+    def _analyze_prepared(
+        self,
+        audio_data: np.ndarray,
+        samplerate: int,
+        magnitude: Optional[np.ndarray] = None,
+    ) -> SensorResult:
+        """Run the sub-analyses on a prepared clip and score them."""
+        try:
+            # Analyze noise floor and spectral flux; the flux and room tone
+            # analyses share one spectrogram unless the clip is long enough
+            # to be processed block-wise
+            if magnitude is None and not self._is_streamed(audio_data, samplerate):
+                magnitude = self._spectrogram(audio_data, samplerate)
             noise_floor_results = self._analyze_noise_floor(audio_data, samplerate)
-            spectral_flux_results = self._analyze_spectral_flux(audio_data, samplerate)
-            room_tone_results = self._detect_room_tone_changes(audio_data, samplerate)
+            spectral_flux_results = self._analyze_spectral_flux(audio_data, samplerate, magnitude)
+            room_tone_results = self._detect_room_tone_changes(audio_data, samplerate, magnitude)
             
             # Calculate suspicion score (0-1, higher = more suspicious)
             suspicion_score = 0.0
@@ -179,14 +403,18 @@ class DigitalSilenceSensor(BaseSensor):
             return result
             
         except Exception as e:
-            return SensorResult(
-                sensor_name=self.name,
-                passed=None,
-                value=0.0,
-                threshold=0.5,
-                reason="ERROR",
-                detail=f"Digital silence analysis failed: {str(e)}"
-            )
+            return self._error_result(e)
+    
+    def _error_result(self, error: Exception) -> SensorResult:
+        """Result reported when the analysis raises."""
+        return SensorResult(
+            sensor_name=self.name,
+            passed=None,
+            value=0.0,
+            threshold=0.5,
+            reason="ERROR",
+            detail=f"Digital silence analysis failed: {str(error)}"
+        )
     
     def _analyze_noise_floor(
         self,
@@ -203,10 +431,10 @@ class DigitalSilenceSensor(BaseSensor):
         Returns:
             Dictionary with noise floor analysis results
         """
-        frame_length = int(self.frame_length_ms * sr / 1000.0)
-        hop_length = int(self.hop_length_ms * sr / 1000.0)
+        frame_length, hop_length, _, _ = self._frame_params(sr)
         
-        if len(audio) < frame_length:
+        # Frames start at 0, hop, ... strictly before len(audio) - frame_length
+        if len(audio) <= frame_length:
             return {
                 "has_perfect_silence": False,
                 "perfect_silence_count": 0,
@@ -216,25 +444,9 @@ class DigitalSilenceSensor(BaseSensor):
             }
         
         # Compute RMS energy in sliding windows
-        rms_values = []
-        
-        for i in range(0, len(audio) - frame_length, hop_length):
-            frame = audio[i:i + frame_length]
-            rms = float(np.sqrt(np.mean(frame ** 2)))
-            # Convert to dB (avoid log(0))
-            rms_db = 20 * np.log10(max(rms, 1e-10))
-            rms_values.append(rms_db)
-        
-        if len(rms_values) == 0:
-            return {
-                "has_perfect_silence": False,
-                "perfect_silence_count": 0,
-                "has_zero_variance": False,
-                "noise_floor_variance": 0.0,
-                "min_noise_floor_db": 0.0,
-            }
-        
-        rms_values = np.array(rms_values)
+        rms = np.sqrt(_frame_mean_square(audio, frame_length, hop_length))
+        # Convert to dB (avoid log(0))
+        rms_values = 20 * np.log10(np.maximum(rms, 1e-10))
         
         # Check for perfect silence (below threshold)
         perfect_silence_mask = rms_values < PERFECT_SILENCE_THRESHOLD_DB
@@ -257,10 +469,50 @@ class DigitalSilenceSensor(BaseSensor):
             "min_noise_floor_db": min_noise_floor_db,
         }
     
+    def _frame_params(self, sr: int) -> Tuple[int, int, int, np.ndarray]:
+        """
+        Framing for a sample rate, computed once per rate and reused.
+        
+        Returns:
+            Tuple of (frame_length, hop_length, nperseg, freqs) where nperseg
+            is the spectrogram segment length and freqs its bin frequencies
+        """
+        params = self._frame_params_by_sr.get(sr)
+        if params is None:
+            frame_length = int(self.frame_length_ms * sr / 1000.0)
+            hop_length = int(self.hop_length_ms * sr / 1000.0)
+            # ENHANCEMENT: Use 2048 for consistency and avoid warnings
+            nperseg = min(frame_length, 2048)
+            freqs = np.fft.rfftfreq(nperseg, d=1.0 / sr)
+            freqs.flags.writeable = False
+            params = (frame_length, hop_length, nperseg, freqs)
+            self._frame_params_by_sr[sr] = params
+        return params
+    
+    def _is_streamed(self, audio: np.ndarray, sr: int) -> bool:
+        """Whether the clip is long enough to be processed block-wise."""
+        return len(audio) > STREAM_BLOCK_SECONDS * sr
+    
+    def _block_frames(self, sr: int) -> int:
+        """Number of hop-spaced frames in one STREAM_BLOCK_SECONDS block."""
+        _, hop_length, _, _ = self._frame_params(sr)
+        return max(int(STREAM_BLOCK_SECONDS * sr) // hop_length, 1)
+    
+    def _spectrogram(self, audio: np.ndarray, sr: int) -> np.ndarray:
+        """
+        STFT magnitude (frames x bins) shared by the spectral analyses.
+        
+        Frame t is centred on sample t * hop_length, the same grid as the
+        frame RMS used to find quiet regions.
+        """
+        _, hop_length, nperseg, _ = self._frame_params(sr)
+        return _stft_magnitude(audio, nperseg, hop_length)
+    
     def _analyze_spectral_flux(
         self,
         audio: np.ndarray,
         sr: int,
+        magnitude: Optional[np.ndarray] = None,
     ) -> Dict:
         """
         Analyze spectral flux for instant texture changes (splicing artifacts).
@@ -268,15 +520,11 @@ class DigitalSilenceSensor(BaseSensor):
         Args:
             audio: Audio signal
             sr: Sample rate in Hz
+            magnitude: Precomputed _spectrogram(audio, sr), if available
             
         Returns:
             Dictionary with spectral flux analysis results
         """
-        frame_length = int(self.frame_length_ms * sr / 1000.0)
-        hop_length = int(self.hop_length_ms * sr / 1000.0)
-        # ENHANCEMENT: Use 2048 for consistency and avoid warnings
-        nperseg = min(frame_length, 2048)
-        
         # Require minimum 2048 samples for reliable spectral analysis
         if len(audio) < 2048:
             # logger.debug(f"Audio too short for spectral flux: {len(audio)} samples < 2048")
@@ -285,15 +533,15 @@ class DigitalSilenceSensor(BaseSensor):
                 "instant_change_count": 0,
             }
         
-        # Compute STFT
-        f, t, Zxx = signal.stft(audio, sr, nperseg=nperseg, noverlap=nperseg - hop_length)
-        
-        # Compute spectral magnitude
-        magnitude = np.abs(Zxx)
-        
         # Compute spectral flux (rate of change of spectral magnitude)
-        # Flux = sum of differences between consecutive frames
-        spectral_flux = np.sum(np.diff(magnitude, axis=1) ** 2, axis=0)
+        # Flux = sum of squared differences between consecutive frames
+        if magnitude is None and self._is_streamed(audio, sr):
+            spectral_flux = self._blocked_spectral_flux(audio, sr)
+        else:
+            # Compute spectral magnitude (frames x bins)
+            if magnitude is None:
+                magnitude = self._spectrogram(audio, sr)
+            spectral_flux = _frame_flux(magnitude)
         
         # Normalize flux
         if np.max(spectral_flux) > 0:
@@ -310,57 +558,103 @@ class DigitalSilenceSensor(BaseSensor):
             "instant_change_count": instant_change_count,
         }
 
-    def _detect_room_tone_changes(self, audio: np.ndarray, sr: int) -> Dict:
+    def _blocked_spectral_flux(self, audio: np.ndarray, sr: int) -> np.ndarray:
+        """
+        Spectral flux of _spectrogram(audio, sr), one block of frames at a time.
+        
+        Each block repeats the previous block's last frame so the frame
+        differences run on across block edges; only one block's spectrum is
+        held at a time.
+        """
+        _, hop_length, nperseg, _ = self._frame_params(sr)
+        frames = _stft_frames(audio, nperseg, hop_length)
+        block_frames = self._block_frames(sr)
+        
+        flux_blocks = [
+            _frame_flux(_frames_magnitude(frames[start:start + block_frames + 1]))
+            for start in range(0, len(frames) - 1, block_frames)
+        ]
+        return np.concatenate(flux_blocks)
+    
+    def _quiet_frame_rms(self, audio: np.ndarray, sr: int) -> np.ndarray:
+        """
+        Centred frame RMS (librosa.feature.rms) used to find quiet regions.
+        
+        librosa builds the whole (frame_length x frames) matrix at once, so
+        long clips are padded the way the centred call pads them and passed
+        through in blocks of frames instead; the frames are the same.
+        """
+        _, hop_length, _, _ = self._frame_params(sr)
+        if not self._is_streamed(audio, sr):
+            return librosa.feature.rms(
+                y=audio, frame_length=QUIET_RMS_FRAME_LENGTH, hop_length=hop_length
+            )[0]
+        
+        padded = np.pad(audio, QUIET_RMS_FRAME_LENGTH // 2)
+        n_frames = 1 + (len(padded) - QUIET_RMS_FRAME_LENGTH) // hop_length
+        block_frames = self._block_frames(sr)
+        rms_blocks = []
+        for start in range(0, n_frames, block_frames):
+            stop = min(start + block_frames, n_frames)
+            block = padded[start * hop_length:(stop - 1) * hop_length + QUIET_RMS_FRAME_LENGTH]
+            rms_blocks.append(librosa.feature.rms(
+                y=block, frame_length=QUIET_RMS_FRAME_LENGTH, hop_length=hop_length, center=False
+            )[0])
+        return np.concatenate(rms_blocks)
+    
+    def _detect_room_tone_changes(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        magnitude: Optional[np.ndarray] = None,
+    ) -> Dict:
         """
         Detect inconsistent room tone between segments.
         
         Natural recordings have consistent background noise;
         spliced/generated audio often has room tone discontinuities.
+        Region signatures are read from the shared spectrogram, or computed
+        from just each region's frames if magnitude is not given.
         """
         if not HAS_LIBROSA:
             return {"has_inconsistency": False, "inconsistency_count": 0}
 
-        hop_length = int(self.hop_length_ms * sr / 1000.0)
+        _, hop_length, nperseg, freqs = self._frame_params(sr)
         
         # Find quiet regions (between speech)
-        frame_rms = librosa.feature.rms(y=audio, hop_length=hop_length)[0]
+        frame_rms = self._quiet_frame_rms(audio, sr)
         quiet_threshold = np.percentile(frame_rms, 30)
         quiet_mask = frame_rms < quiet_threshold
         
-        # Find contiguous quiet regions
-        # Simple run-length encoding style
-        quiet_regions = []
-        is_quiet = False
-        start = 0
-        for i, val in enumerate(quiet_mask):
-            if val and not is_quiet:
-                start = i
-                is_quiet = True
-            elif not val and is_quiet:
-                quiet_regions.append((start, i))
-                is_quiet = False
-        if is_quiet:
-            quiet_regions.append((start, len(quiet_mask)))
+        # Find contiguous quiet regions as (start, end) frame pairs: with
+        # False padded on both sides, rising edges are starts, falling edges ends
+        edges = np.diff(np.concatenate(([False], quiet_mask, [False])).astype(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        
+        # Keep regions long enough for a room tone signature: at least 10
+        # frames and 2048 samples (128ms at 16kHz) for a stable signature
+        region_samples = np.minimum(ends * hop_length, len(audio)) - starts * hop_length
+        usable = (ends - starts >= 10) & (region_samples >= 2048)
+        quiet_regions = list(zip(starts[usable].tolist(), ends[usable].tolist()))
+        
+        # Inconsistencies compare adjacent regions, so fewer than two means
+        # there is nothing to compare (and no spectrogram is needed)
+        if len(quiet_regions) < 2:
+            return {"has_inconsistency": False, "inconsistency_count": 0}
+        
+        frames = _stft_frames(audio, nperseg, hop_length) if magnitude is None else None
 
         # Analyze spectral characteristics of each quiet region
         room_tones = []
         for start_frame, end_frame in quiet_regions:
-            if end_frame - start_frame < 10:  # Skip very short regions
-                continue
-                
-            start_sample = start_frame * hop_length
-            end_sample = end_frame * hop_length
-            region = audio[start_sample:end_sample]
-            
-            # ENHANCEMENT: Use 2048 samples minimum to avoid n_fft warnings
-            # At 16kHz, 2048 samples = 128ms
-            if len(region) < 2048:
-                # logger.debug(f"Skipping short silence region: {len(region)} samples < 2048 (128ms)")
-                continue
-
-            # Compute room tone signature (spectral centroid, flatness)
-            centroid = np.mean(librosa.feature.spectral_centroid(y=region, sr=sr))
-            flatness = np.mean(librosa.feature.spectral_flatness(y=region))
+            # Compute room tone signature (spectral centroid, flatness); the
+            # spectrogram and RMS frames share the same hop grid
+            if magnitude is None:
+                region = _frames_magnitude(frames[start_frame:end_frame])
+            else:
+                region = magnitude[start_frame:end_frame]
+            centroid, flatness = _room_tone_signature(region, freqs)
             
             room_tones.append({
                 'start_frame': start_frame,
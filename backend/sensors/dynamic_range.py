@@ -5,8 +5,12 @@ Measures crest factor to identify unnaturally compressed audio typical
 of synthetic speech generation systems.
 """
 
+import math
+
 import numpy as np
+from typing import Dict, Optional
 from .base import BaseSensor, SensorResult
+from .jit import NUMBA_AVAILABLE, njit
 from backend.calibration.environment import EnvironmentAnalyzer
 from backend.utils.config import get_threshold
 
@@ -15,6 +19,27 @@ from backend.utils.config import get_threshold
 CREST_FACTOR_THRESHOLD = get_threshold("dynamic_range", "crest_factor_threshold", 5.0)
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _peak_and_sum_squares(x):
+        """Peak absolute amplitude and sum of squares of x in a single pass."""
+        peak = 0.0
+        sum_squares = 0.0
+        for i in range(x.size):
+            v = float(x[i])
+            a = abs(v)
+            if a > peak:
+                peak = a
+            sum_squares += v * v
+        return peak, sum_squares
+else:
+    def _peak_and_sum_squares(x):
+        """Peak absolute amplitude and sum of squares of x."""
+        # max/min and dot reduce in place, without the abs/square temporaries
+        x = np.asarray(x, dtype=np.float64) if x.dtype.kind != 'f' else x
+        return max(float(np.max(x)), -float(np.min(x))), float(np.dot(x, x))
+
+
 class DynamicRangeSensor(BaseSensor):
     """
     Dynamic range sensor that detects compression artifacts.
@@ -24,6 +49,8 @@ class DynamicRangeSensor(BaseSensor):
     often shows unnaturally low crest factors due to compression artifacts.
     """
     
+    uses_env_stats = True
+    
     def __init__(self, crest_factor_threshold: float = CREST_FACTOR_THRESHOLD, category: str = "defense"):
         """
         Initialize dynamic range sensor.
@@ -35,13 +62,19 @@ class DynamicRangeSensor(BaseSensor):
         super().__init__("Dynamic Range Sensor (Crest Factor)", category=category)
         self.crest_factor_threshold = crest_factor_threshold
     
-    def analyze(self, audio_data: np.ndarray, samplerate: int) -> SensorResult:
+    def analyze(
+        self,
+        audio_data: np.ndarray,
+        samplerate: int,
+        env_stats: Optional[Dict[str, float]] = None,
+    ) -> SensorResult:
         """
         Analyze audio for dynamic range compression.
         
         Args:
             audio_data: Audio signal as numpy array
             samplerate: Sample rate in Hz (unused but kept for API consistency)
+            env_stats: Precomputed EnvironmentAnalyzer.analyze(audio_data, samplerate)
             
         Returns:
             SensorResult with crest factor analysis
@@ -55,11 +88,12 @@ class DynamicRangeSensor(BaseSensor):
                 detail="Invalid or empty audio input."
             )
         
-        peak_amplitude = np.max(np.abs(audio_data))
-        rms_amplitude = np.sqrt(np.mean(np.square(audio_data)))
+        peak_amplitude, sum_squares = _peak_and_sum_squares(np.ravel(audio_data))
+        rms_amplitude = math.sqrt(sum_squares / audio_data.size)
         
         # Dynamic Calibration: Adapt threshold based on SNR
-        env_stats = EnvironmentAnalyzer.analyze(audio_data, samplerate)
+        if env_stats is None:
+            env_stats = EnvironmentAnalyzer.analyze(audio_data, samplerate)
         snr_db = env_stats["snr_db"]
         
         # Base threshold from config/class
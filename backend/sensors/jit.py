@@ -0,0 +1,18 @@
+"""
+Optional numba support for sensor kernels.
+
+Sensors define a JIT-compiled kernel when NUMBA_AVAILABLE is True and a
+vectorized numpy equivalent otherwise, mirroring the RUST_AVAILABLE
+fallback pattern in the package __init__.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    # numba not available - sensors will use numpy fallbacks
+    njit = None
+    prange = range
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
@@ -5,10 +5,15 @@ Provides a centralized way to register, configure, and run sensors.
 Supports both synchronous and asynchronous sensors.
 """
 
+import asyncio
 import inspect
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext
-from typing import Dict, List, Optional, Any
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Any, Sequence
 try:
     import numpy as np
 except ImportError:
@@ -78,6 +83,173 @@ def get_default_sensors() -> List[BaseSensor]:
     ]
 
 
+def _shared_env_stats(
+    sensors: Sequence[BaseSensor],
+    audio_data: np.ndarray,
+    samplerate: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    EnvironmentAnalyzer result for a clip, computed once for every sensor
+    that accepts env_stats (None if none does or the input is unusable;
+    the sensors then validate and calibrate on their own).
+    """
+    if not any(getattr(sensor, "uses_env_stats", False) for sensor in sensors):
+        return None
+    from backend.calibration.environment import EnvironmentAnalyzer
+    try:
+        return EnvironmentAnalyzer.analyze(audio_data, samplerate)
+    except Exception:
+        return None
+
+
+def _sensor_kwargs(sensor: BaseSensor, env_stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Extra analyze() keywords for a sensor."""
+    if env_stats is not None and getattr(sensor, "uses_env_stats", False):
+        return {"env_stats": env_stats}
+    return {}
+
+
+def _run_sensor_safely(
+    sensor: BaseSensor,
+    audio_data: np.ndarray,
+    samplerate: int,
+    env_stats: Optional[Dict[str, Any]] = None,
+) -> SensorResult:
+    """Run one sensor, converting exceptions into an ERROR result like analyze_all."""
+    try:
+        kwargs = _sensor_kwargs(sensor, env_stats)
+        if inspect.iscoroutinefunction(sensor.analyze):
+            # Worker threads have no running event loop
+            return asyncio.run(sensor.analyze(audio_data, samplerate, **kwargs))
+        return sensor.analyze(audio_data, samplerate, **kwargs)
+    except Exception as e:
+        return SensorResult(
+            sensor_name=sensor.name,
+            passed=None,
+            value=0.0,
+            threshold=0.0,
+            reason="ERROR",
+            detail=f"Sensor analysis failed: {str(e)}"
+        )
+
+
+# Sensor instances of a process-pool worker, installed by _init_sensor_worker
+_worker_sensors: List[BaseSensor] = []
+
+
+def _init_sensor_worker(sensors: List[BaseSensor]) -> None:
+    """Process-pool initializer: unpickle the sensors once per worker."""
+    global _worker_sensors
+    _worker_sensors = sensors
+
+
+def _run_shared_sensor(
+    sensor_index: int,
+    shm_name: str,
+    shape: tuple,
+    dtype: str,
+    samplerate: int,
+    env_stats: Optional[Dict[str, Any]],
+) -> SensorResult:
+    """Process-pool task: run one worker sensor on a clip in shared memory."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        audio = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        audio.flags.writeable = False
+        result = _run_sensor_safely(_worker_sensors[sensor_index], audio, samplerate, env_stats)
+        # The mapping can only be closed once no array views it
+        del audio
+        return result
+    finally:
+        shm.close()
+
+
+def _run_sensors_in_processes(
+    sensors: Sequence[BaseSensor],
+    audios: Sequence[np.ndarray],
+    samplerate: int,
+    max_workers: Optional[int],
+) -> List[List[SensorResult]]:
+    """Process-pool backend of run_sensors_parallel."""
+    blocks = []
+    try:
+        # Spawned rather than forked workers: the pool is started while
+        # numba/BLAS thread pools may already be running in this process
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_sensor_worker,
+            initargs=(list(sensors),),
+        ) as executor:
+            futures = []
+            for audio in audios:
+                audio = np.ascontiguousarray(audio)
+                env_stats = _shared_env_stats(sensors, audio, samplerate)
+                # Workers map the clip by name instead of unpickling a copy per task
+                shm = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+                blocks.append(shm)
+                np.ndarray(audio.shape, dtype=audio.dtype, buffer=shm.buf)[...] = audio
+                futures.append([
+                    executor.submit(
+                        _run_shared_sensor, j, shm.name, audio.shape, audio.dtype.str,
+                        samplerate, env_stats,
+                    )
+                    for j in range(len(sensors))
+                ])
+            return [[f.result() for f in row] for row in futures]
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def run_sensors_parallel(
+    sensors: Sequence[BaseSensor],
+    audios: Sequence[np.ndarray],
+    samplerate: int,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+) -> List[List[SensorResult]]:
+    """
+    Run every sensor on every audio clip in a thread or process pool.
+    
+    The heavy NumPy/SciPy kernels inside the sensors release the GIL, so
+    threads overlap their work across cores without process start-up or
+    pickling costs. Sensors must not mutate shared state in analyze().
+    
+    With use_processes=True the fan-out runs in a process pool instead, for
+    sensors whose pure-Python parts hold the GIL or whose backends are not
+    thread-safe. Sensors are pickled once per worker, and each clip is put
+    in shared memory once and handed to them as a read-only view. They must
+    be picklable, must not keep references to the audio after analyze()
+    returns, and any state they set on self stays in the worker. Workers
+    are spawned, so scripts calling this need the usual
+    ``if __name__ == "__main__":`` guard.
+    
+    Args:
+        sensors: Sensor instances to run
+        audios: Audio signals (all at the same sample rate)
+        samplerate: Sample rate in Hz
+        max_workers: Thread or process count (defaults to os.cpu_count())
+        use_processes: Use a process pool instead of threads
+        
+    Returns:
+        results[i][j] is the result of sensors[j] on audios[i]
+    """
+    if use_processes:
+        return _run_sensors_in_processes(sensors, audios, samplerate, max_workers)
+    
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = []
+        for audio in audios:
+            env_stats = _shared_env_stats(sensors, audio, samplerate)
+            futures.append([
+                executor.submit(_run_sensor_safely, sensor, audio, samplerate, env_stats)
+                for sensor in sensors
+            ])
+        return [[f.result() for f in row] for row in futures]
+
+
 class SensorRegistry:
     """
     Registry for managing audio sensors.
@@ -162,21 +334,27 @@ class SensorRegistry:
         """
         sensors_to_run = sensor_names or self._sensor_order
         results = {}
+        env_stats = _shared_env_stats(
+            [self._sensors[name] for name in sensors_to_run if name in self._sensors],
+            audio_data,
+            samplerate,
+        )
 
         for name in sensors_to_run:
             if name in self._sensors:
                 try:
                     sensor = self._sensors[name]
+                    kwargs = _sensor_kwargs(sensor, env_stats)
                     # Time sensor execution if metrics provided
                     timing_context = time_sensor(name, metrics) if metrics else nullcontext()
                     with timing_context:
                         # Check if the analyze method is async
                         if inspect.iscoroutinefunction(sensor.analyze):
                             # Await async sensors
-                            result = await sensor.analyze(audio_data, samplerate)
+                            result = await sensor.analyze(audio_data, samplerate, **kwargs)
                         else:
                             # Call sync sensors normally
-                            result = sensor.analyze(audio_data, samplerate)
+                            result = sensor.analyze(audio_data, samplerate, **kwargs)
                     results[name] = result
                 except Exception as e:
                     # Create error result
@@ -3,16 +3,22 @@ import logging
 import numpy as np
 import soundfile as sf
 import librosa
-from typing import Tuple
+from pathlib import Path
+from typing import BinaryIO, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
-def load_and_preprocess_audio(file_obj: io.BytesIO, target_sr: int = 16000) -> Tuple[np.ndarray, int]:
+def load_and_preprocess_audio(
+    file_obj: Union[io.BytesIO, BinaryIO, str, Path], target_sr: int = 16000
+) -> Tuple[np.ndarray, int]:
     """
-    Load audio from a file object, convert to mono float32, and resample if necessary.
+    Load audio from a file object or path, convert to mono float32, and resample if necessary.
+    
+    Paths are decoded directly by libsndfile, avoiding an in-memory copy of the
+    encoded file.
     
     Args:
-        file_obj: BytesIO object containing audio data
+        file_obj: BytesIO/open binary file containing audio data, or a file path
         target_sr: Target sample rate in Hz (default 16000)
         
     Returns:
@@ -20,9 +26,11 @@ def load_and_preprocess_audio(file_obj: io.BytesIO, target_sr: int = 16000) -> T
         audio_data is a float32 mono numpy array
     """
     # Try soundfile first (faster, better for most formats)
+    is_path = isinstance(file_obj, (str, Path))
     try:
-        file_obj.seek(0)
-        audio, sr = sf.read(file_obj)
+        if not is_path:
+            file_obj.seek(0)
+        audio, sr = sf.read(file_obj, dtype="float32")
         
         # Convert to float32 if not already
         if audio.dtype != np.float32:
@@ -47,7 +55,8 @@ def load_and_preprocess_audio(file_obj: io.BytesIO, target_sr: int = 16000) -> T
         
         # Fallback to librosa (handles corrupted files better in some cases)
         try:
-            file_obj.seek(0)
+            if not is_path:
+                file_obj.seek(0)
             audio, sr = librosa.load(file_obj, sr=target_sr, mono=True, dtype=np.float32)
             logger.info(f"Successfully loaded audio using librosa fallback (sr={sr})")
             return audio, sr
@@ -9,12 +9,17 @@ The Silero VAD strategy measures actual breath groups (speech segments)
 rather than just file duration, providing more accurate phonation analysis.
 """
 
+import functools
 import logging
+import os
 from dataclasses import dataclass
-from typing import List
+from math import gcd
+from typing import List, Sequence
 
 import numpy as np
-from scipy.signal import medfilt
+from scipy.signal import medfilt, resample_poly
+
+from backend.utils.config import get_threshold
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,14 @@ logger = logging.getLogger(__name__)
 SILERO_SAMPLE_RATE = 16000
 SILERO_CHUNK_SIZE = 512  # 32ms at 16kHz
 SILERO_THRESHOLD = 0.5  # Default speech probability threshold
+SILERO_STATE_SIZE = 64  # LSTM state width of the Silero V4 ONNX model
+# Opt-in: the energy-based detector stays the default until the model is bundled
+USE_SILERO_VAD = get_threshold("vad", "use_silero", False)
+# Relative model paths are resolved against the backend directory
+SILERO_MODEL_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    get_threshold("vad", "silero_model_path", "models/silero_vad.onnx"),
+)
 
 # Energy-based VAD constants (fallback)
 ENERGY_FRAME_SIZE_SECONDS = 0.03  # 30ms frames
@@ -32,7 +45,7 @@ MIN_SPEECH_DURATION_SECONDS = 0.1  # Minimum speech segment duration
 # Using 200ms ensures we only split on actual breathing pauses
 MIN_SILENCE_DURATION_SECONDS = 0.2  # Minimum silence to consider a breath break
 
-# Try to import ONNX runtime for future Silero VAD model support
+# Try to import ONNX runtime for Silero VAD model support
 # TODO: Bundle Silero VAD ONNX model for enhanced speech detection accuracy
 # For now, the enhanced energy-based detection provides robust results
 ONNX_AVAILABLE = False
@@ -44,6 +57,67 @@ except ImportError:
     logger.debug("onnxruntime not available - using energy-based VAD")
 
 
+@functools.lru_cache(maxsize=2)
+def _get_silero_session(model_path: str):
+    """Load the Silero ONNX model once per process (None if unavailable)."""
+    if not ONNX_AVAILABLE or not os.path.exists(model_path):
+        logger.warning(f"Silero VAD requested but unavailable ({model_path}); using energy-based VAD")
+        return None
+    options = ort.SessionOptions()
+    # One thread per op; batching across files provides the parallelism
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = os.cpu_count() or 1
+    return ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def _to_silero_rate(audio_data: np.ndarray, samplerate: int) -> np.ndarray:
+    """Resample to the 16 kHz rate the Silero model expects (float32)."""
+    audio = np.asarray(audio_data, dtype=np.float32)
+    if samplerate == SILERO_SAMPLE_RATE:
+        return audio
+    g = gcd(SILERO_SAMPLE_RATE, samplerate)
+    return resample_poly(audio, SILERO_SAMPLE_RATE // g, samplerate // g).astype(np.float32)
+
+
+def _silero_probabilities(session, audios: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Per-chunk speech probabilities for a batch of 16 kHz clips.
+
+    Clips are zero-padded to a common number of SILERO_CHUNK_SIZE chunks and
+    run as one (B, chunk) tensor per step, carrying the LSTM state.
+
+    Returns:
+        Array of shape (B, num_chunks)
+    """
+    num_chunks = max(-(-len(a) // SILERO_CHUNK_SIZE) for a in audios)
+    batch = np.zeros((len(audios), num_chunks * SILERO_CHUNK_SIZE), dtype=np.float32)
+    for i, a in enumerate(audios):
+        batch[i, :len(a)] = a
+
+    h = np.zeros((2, len(audios), SILERO_STATE_SIZE), dtype=np.float32)
+    c = np.zeros_like(h)
+    sr = np.array(SILERO_SAMPLE_RATE, dtype=np.int64)
+    probs = np.empty((len(audios), num_chunks), dtype=np.float32)
+    for k in range(num_chunks):
+        chunk = batch[:, k * SILERO_CHUNK_SIZE:(k + 1) * SILERO_CHUNK_SIZE]
+        out, h, c = session.run(None, {"input": chunk, "sr": sr, "h": h, "c": c})
+        probs[:, k] = out[:, 0]
+    return probs
+
+
+def frame_mean_squares(cumsum_sq: np.ndarray, frame_size: int, hop_size: int) -> np.ndarray:
+    """
+    Per-frame mean-square energy from a cumulative sum of squared samples.
+    
+    cumsum_sq must be zero-prefixed (cumsum_sq[0] == 0, length N + 1) so that
+    one cumulative pass can serve several frame sizes.
+    """
+    n = len(cumsum_sq) - 1
+    starts = np.arange(0, n - frame_size + 1, hop_size)
+    # Clamp tiny negative differences from floating-point cancellation
+    return np.maximum(cumsum_sq[starts + frame_size] - cumsum_sq[starts], 0.0) * (1.0 / frame_size)
+
+
 @dataclass
 class SpeechSegment:
     """Represents a detected speech segment."""
@@ -77,6 +151,7 @@ class VoiceActivityDetector:
         min_speech_duration: float = MIN_SPEECH_DURATION_SECONDS,
         min_silence_duration: float = MIN_SILENCE_DURATION_SECONDS,
         silence_threshold_db: float = ENERGY_SILENCE_THRESHOLD_DB,
+        use_silero: bool = USE_SILERO_VAD,
     ):
         """
         Initialize Voice Activity Detector.
@@ -87,11 +162,21 @@ class VoiceActivityDetector:
             min_speech_duration: Minimum duration in seconds for valid speech segment
             min_silence_duration: Minimum silence duration to split segments
             silence_threshold_db: Energy threshold in dB for speech (default: -50)
+            use_silero: Use the Silero ONNX model when it can be loaded
+                        (default from settings: sensors.vad.use_silero)
         """
         self.speech_threshold = speech_threshold
         self.min_speech_duration = min_speech_duration
         self.min_silence_duration = min_silence_duration
         self.silence_threshold_db = silence_threshold_db
+        self.use_silero = use_silero
+    
+    @property
+    def silero_session(self):
+        """Cached Silero session when enabled and loadable, else None."""
+        if not self.use_silero:
+            return None
+        return _get_silero_session(SILERO_MODEL_PATH)
     
     def detect_speech_segments(
         self,
@@ -111,10 +196,53 @@ class VoiceActivityDetector:
         if len(audio_data) == 0:
             return []
         
+        if self.silero_session is not None:
+            return self.detect_speech_segments_batch([audio_data], samplerate)[0]
+        
         # Use enhanced energy-based detection (always available, works well)
-        # Note: ONNX-based Silero VAD can be added later if model is bundled
         return self._detect_energy_based(audio_data, samplerate)
     
+    def detect_speech_segments_batch(
+        self,
+        audios: Sequence[np.ndarray],
+        samplerate: int,
+    ) -> List[List[SpeechSegment]]:
+        """
+        Detect speech segments in several clips.
+        
+        With Silero enabled, all clips go through the model together as one
+        batched tensor per chunk step; otherwise each clip uses the
+        energy-based detector.
+        
+        Args:
+            audios: Audio signals as numpy arrays (mono, same sample rate)
+            samplerate: Sample rate in Hz
+            
+        Returns:
+            One list of SpeechSegment objects per clip
+        """
+        session = self.silero_session
+        if session is None:
+            return [self.detect_speech_segments(a, samplerate) for a in audios]
+        
+        results: List[List[SpeechSegment]] = [[] for _ in audios]
+        active = [i for i, a in enumerate(audios) if len(a) > 0]
+        if not active:
+            return results
+        
+        resampled = [_to_silero_rate(audios[i], samplerate) for i in active]
+        probs = _silero_probabilities(session, resampled)
+        for row, i in enumerate(active):
+            num_chunks = -(-len(resampled[row]) // SILERO_CHUNK_SIZE)
+            is_speech = (probs[row, :num_chunks] >= self.speech_threshold).astype(np.int8)
+            results[i] = self._frames_to_segments(
+                is_speech,
+                SILERO_CHUNK_SIZE,
+                SILERO_SAMPLE_RATE,
+                len(audios[i]) / samplerate
+            )
+        return results
+    
     def get_max_continuous_speech(
         self,
         audio_data: np.ndarray,
@@ -196,6 +324,36 @@ class VoiceActivityDetector:
         # Convert to dB
         energies_db = 20 * np.log10(rms_values + 1e-9)
         
+        return self.segments_from_energy(
+            energies_db,
+            hop_size,
+            samplerate,
+            len(audio_data) / samplerate
+        )
+    
+    def segments_from_energy(
+        self,
+        energies_db: np.ndarray,
+        hop_size: int,
+        samplerate: int,
+        audio_duration: float,
+    ) -> List[SpeechSegment]:
+        """
+        Detect speech segments from precomputed frame energies.
+        
+        Frames must use ENERGY_FRAME_SIZE_SECONDS windows at ENERGY_HOP_SIZE_SECONDS
+        hops, as in _detect_energy_based; callers that already have the energy
+        profile avoid re-framing the audio.
+        
+        Args:
+            energies_db: Per-frame RMS energy in dB
+            hop_size: Hop size in samples
+            samplerate: Sample rate in Hz
+            audio_duration: Total audio duration in seconds
+            
+        Returns:
+            List of SpeechSegment objects
+        """
         # Adaptive threshold: use a combination of fixed and relative thresholds
         # This handles varying recording levels better
         noise_floor = np.percentile(energies_db, 10)  # Estimate noise floor
@@ -229,7 +387,7 @@ class VoiceActivityDetector:
             is_speech,
             hop_size,
             samplerate,
-            len(audio_data) / samplerate
+            audio_duration
         )
     
     def _frames_to_segments(
@@ -12,6 +12,7 @@
 mod sensors;
 mod utils;
 
+use numpy::{Complex32, PyReadonlyArray1};
 use pyo3::prelude::*;
 
 pub use sensors::{
@@ -22,6 +23,18 @@ pub use sensors::{
 };
 pub use utils::errors::SensorError;
 
+/// Spectral rolloff bin of a complex64 rfft spectrum
+///
+/// Returns -1 for an empty or silent spectrum.
+#[pyfunction]
+fn compute_spectral_rolloff(
+    spectrum: PyReadonlyArray1<'_, Complex32>,
+    rolloff_percent: f64,
+) -> PyResult<i64> {
+    let bins = spectrum.as_slice()?;
+    Ok(utils::fft::complex_spectral_rolloff(bins, rolloff_percent).map_or(-1, |i| i as i64))
+}
+
 /// Initialize the sonotheia_rust Python module
 #[pymodule]
 fn sonotheia_rust(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
@@ -31,6 +44,9 @@ fn sonotheia_rust(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<ArticulationSensor>()?;
     m.add_class::<SensorResult>()?;
 
+    // Register standalone kernels
+    m.add_function(wrap_pyfunction!(compute_spectral_rolloff, m)?)?;
+
     // Add version info
     m.add("__version__", "0.1.0")?;
     m.add("__author__", "Sonotheia Team")?;
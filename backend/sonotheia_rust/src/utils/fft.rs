@@ -215,6 +215,41 @@ pub fn spectral_rolloff(magnitudes: &[f64], rolloff_percent: f64) -> usize {
     magnitudes.len() - 1
 }
 
+/// Find spectral rolloff point directly from a complex (rfft) spectrum
+///
+/// Magnitudes are computed inline, so no magnitude array is allocated.
+/// Uses |X| (not |X|^2) so the result matches `spectral_rolloff` on the
+/// magnitude spectrum.
+///
+/// # Arguments
+/// * `bins` - Complex single-precision spectrum
+/// * `rolloff_percent` - Percentage of total energy (e.g., 0.85 for 85%)
+///
+/// # Returns
+/// Index of rolloff frequency bin, or `None` for an empty or silent spectrum
+pub fn complex_spectral_rolloff(bins: &[Complex<f32>], rolloff_percent: f64) -> Option<usize> {
+    let magnitude = |c: &Complex<f32>| {
+        let (re, im) = (f64::from(c.re), f64::from(c.im));
+        (re * re + im * im).sqrt()
+    };
+
+    let total_energy: f64 = bins.iter().map(magnitude).sum();
+    if total_energy == 0.0 || !total_energy.is_finite() {
+        return None;
+    }
+    let target_energy = total_energy * rolloff_percent.clamp(0.0, 1.0);
+
+    let mut cumulative = 0.0;
+    for (i, c) in bins.iter().enumerate() {
+        cumulative += magnitude(c);
+        if cumulative >= target_energy {
+            return Some(i);
+        }
+    }
+
+    Some(bins.len() - 1)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -276,4 +311,18 @@ mod tests {
         let rolloff = spectral_rolloff(&magnitudes, 0.6); // 60% at index 2
         assert_eq!(rolloff, 2);
     }
+
+    #[test]
+    fn test_complex_spectral_rolloff() {
+        // Magnitudes 0.1, 0.2, 0.3, 0.4 -> same rolloff as test_spectral_rolloff
+        let bins = vec![
+            Complex::new(0.1f32, 0.0),
+            Complex::new(0.0f32, 0.2),
+            Complex::new(-0.3f32, 0.0),
+            Complex::new(0.0f32, -0.4),
+        ];
+        assert_eq!(complex_spectral_rolloff(&bins, 0.6), Some(2));
+        assert_eq!(complex_spectral_rolloff(&[Complex::new(0.0f32, 0.0)], 0.9), None);
+        assert_eq!(complex_spectral_rolloff(&[], 0.9), None);
+    }
 }
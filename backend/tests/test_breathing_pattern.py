@@ -0,0 +1,91 @@
+"""
+Tests for Breathing Pattern Sensor helpers and batch analysis.
+"""
+
+import numpy as np
+import pytest
+from scipy.ndimage import correlate1d, gaussian_filter1d
+from scipy.signal import find_peaks
+from backend.sensors.breathing_pattern import (
+    BreathingPatternSensor,
+    _SMOOTH_KERNEL,
+    _find_peaks,
+    _frame_rms,
+)
+
+
+def _breathy_clip(sr: int, duration: float, breath_times, seed: int) -> np.ndarray:
+    """Quiet noise floor with low-frequency bursts at the given times."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(sr * duration)) / sr
+    audio = 0.001 * rng.standard_normal(len(t))
+    for bt in breath_times:
+        burst = np.exp(-((t - bt) ** 2) / (2 * 0.1 ** 2))
+        audio += 0.3 * burst * np.sin(2 * np.pi * 120 * t)
+    return audio.astype(np.float32)
+
+
+class TestBreathingPatternBatch:
+    """Test suite for BreathingPatternSensor.analyze_batch."""
+
+    def test_frame_rms_matches_direct_framing(self):
+        """Cumulative-sum RMS equals RMS over zero-padded frames."""
+        x = np.random.default_rng(0).standard_normal(5000)
+        padded = np.pad(x, 1024)
+        expected = [
+            np.sqrt(np.mean(padded[i:i + 2048] ** 2))
+            for i in range(0, len(padded) - 2048 + 1, 512)
+        ]
+        np.testing.assert_allclose(_frame_rms(x, 2048, 512), expected, rtol=1e-9, atol=1e-12)
+
+    def test_smoothing_kernel_matches_gaussian_filter(self):
+        """Precomputed kernel reproduces gaussian_filter1d(sigma=2)."""
+        x = np.random.default_rng(0).random(300)
+        np.testing.assert_allclose(
+            correlate1d(x, _SMOOTH_KERNEL, mode='reflect'),
+            gaussian_filter1d(x, sigma=2.0),
+            rtol=1e-12,
+        )
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_find_peaks_matches_scipy(self, seed):
+        """Vectorized peak picking reproduces scipy.signal.find_peaks."""
+        rng = np.random.default_rng(seed)
+        x = np.round(rng.random(2000), 2)  # rounding creates plateaus
+        height = 0.4
+        for distance in (1, 5, 31):
+            expected, _ = find_peaks(x, height=height, distance=distance)
+            np.testing.assert_array_equal(_find_peaks(x, height, distance), expected)
+
+    def test_batch_matches_single_clip_analysis(self):
+        """Batched breath detection agrees with per-clip analysis."""
+        sensor = BreathingPatternSensor()
+        sr = 16000
+        clips = [
+            _breathy_clip(sr, 12.0, [1.0, 3.2, 4.9, 8.1, 10.5], seed=1),
+            _breathy_clip(sr, 10.0, [1.5, 3.5, 5.5, 7.5], seed=2),
+        ]
+
+        batch = sensor.analyze_batch(clips, [sr, sr])
+        single = [sensor.analyze(c, sr) for c in clips]
+
+        assert len(batch) == len(clips)
+        for b, s in zip(batch, single):
+            assert b.passed == s.passed
+            assert b.metadata.get("breath_event_count") == s.metadata.get("breath_event_count")
+
+    def test_batch_keeps_early_results_in_order(self):
+        """Invalid clips get their early result without breaking alignment."""
+        sensor = BreathingPatternSensor()
+        sr = 16000
+        clip = _breathy_clip(sr, 10.0, [1.5, 3.5, 5.5, 7.5], seed=3)
+
+        results = sensor.analyze_batch([np.array([]), clip], [sr, sr])
+
+        assert results[0].detail == "Invalid or empty audio input."
+        assert results[1].metadata is not None
+
+    def test_batch_length_mismatch(self):
+        """Mismatched audios and samplerates are rejected."""
+        with pytest.raises(ValueError):
+            BreathingPatternSensor().analyze_batch([np.zeros(100)], [16000, 16000])
@@ -0,0 +1,207 @@
+"""
+Tests for the ProsodicContinuitySensor calibration utility.
+"""
+
+import numpy as np
+import pytest
+
+sf = pytest.importorskip("soundfile")
+
+from backend.sensors import calibrate_prosodic
+from backend.sensors.calibrate_prosodic import (
+    _analyze_file,
+    analyze_organic_samples,
+    load_audio,
+    p95_bootstrap_ci,
+)
+
+
+def _voiced_clip(sr: int, duration: float, seed: int) -> np.ndarray:
+    """Amplitude-modulated pitch glide with light noise."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(sr * duration)) / sr
+    f0 = 140 + 10 * seed + 20 * np.sin(2 * np.pi * 0.5 * t)
+    audio = 0.3 * np.sin(2 * np.pi * np.cumsum(f0) / sr) * (1 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    return (audio + 0.01 * rng.standard_normal(len(t))).astype(np.float32)
+
+
+def _fake_metrics(value: float) -> dict:
+    """CALIBRATION_METRICS values for a stubbed analysis."""
+    return {
+        'breaks_per_second': value,
+        'total_breaks': 3,
+        'pitch_breaks': 1,
+        'energy_breaks': 1,
+        'centroid_breaks': 1,
+        'total_speech_duration': 2.0,
+    }
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the result cache at a temporary directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setattr(calibrate_prosodic, "RESULT_CACHE_DIR", path)
+    return path
+
+
+class TestLoadAudio:
+    """Test suite for load_audio."""
+
+    def test_flac_decodes_to_float32(self, tmp_path):
+        """soundfile decodes non-WAV formats straight to float32."""
+        audio = _voiced_clip(16000, 0.5, seed=0)
+        path = tmp_path / "clip.flac"
+        sf.write(path, audio, 16000, subtype="PCM_16")
+
+        loaded, sr = load_audio(path)
+
+        assert sr == 16000
+        assert loaded.dtype == np.float32
+        np.testing.assert_allclose(loaded, audio, atol=1 / 32768)
+
+    def test_stereo_is_mixed_to_mono(self, tmp_path):
+        """Multi-channel files are averaged to one channel."""
+        left = _voiced_clip(16000, 0.5, seed=0)
+        right = _voiced_clip(16000, 0.5, seed=1)
+        path = tmp_path / "stereo.wav"
+        sf.write(path, np.column_stack([left, right]), 16000, subtype="FLOAT")
+
+        loaded, _ = load_audio(path)
+
+        np.testing.assert_allclose(loaded, (left + right) / 2, rtol=1e-6)
+
+    def test_scipy_fallback_matches_soundfile(self, tmp_path, monkeypatch):
+        """Without soundfile, 16-bit WAV decodes to the same samples via scipy."""
+        path = tmp_path / "clip.wav"
+        sf.write(path, _voiced_clip(16000, 0.5, seed=2), 16000, subtype="PCM_16")
+        expected, _ = load_audio(path)
+
+        monkeypatch.setattr(calibrate_prosodic, "SOUNDFILE_AVAILABLE", False)
+        loaded, sr = load_audio(path)
+
+        assert sr == 16000
+        np.testing.assert_array_equal(loaded, expected)
+
+    def test_non_wav_without_soundfile_fails(self, tmp_path, monkeypatch):
+        """Only WAV can be decoded without soundfile."""
+        path = tmp_path / "clip.flac"
+        sf.write(path, _voiced_clip(16000, 0.5, seed=0), 16000)
+        monkeypatch.setattr(calibrate_prosodic, "SOUNDFILE_AVAILABLE", False)
+
+        assert load_audio(path) == (None, None)
+
+
+class TestResultCache:
+    """Test suite for the per-file result cache."""
+
+    def test_second_run_reads_cache(self, tmp_path, cache_dir, monkeypatch):
+        """A cached outcome is returned without analyzing the file again."""
+        path = tmp_path / "clip.wav"
+        sf.write(path, _voiced_clip(16000, 2.0, seed=0), 16000)
+        first = _analyze_file(path)
+
+        def fail(_):
+            raise AssertionError("file analyzed despite a cached outcome")
+
+        monkeypatch.setattr(calibrate_prosodic, "_analyze_file_uncached", fail)
+
+        assert tuple(_analyze_file(path)) == tuple(first)
+        assert len(list(cache_dir.rglob("*.json"))) == 1
+
+    def test_changed_file_misses_cache(self, tmp_path, cache_dir, monkeypatch):
+        """Rewriting the audio changes the cache key."""
+        path = tmp_path / "clip.wav"
+        sf.write(path, _voiced_clip(16000, 2.0, seed=0), 16000)
+        _analyze_file(path)
+        sf.write(path, _voiced_clip(16000, 3.0, seed=1), 16000)
+        calls = []
+
+        def record(filepath):
+            calls.append(filepath)
+            return 'skipped', None, "stub"
+
+        monkeypatch.setattr(calibrate_prosodic, "_analyze_file_uncached", record)
+        _analyze_file(path)
+
+        assert calls == [path]
+
+    def test_unwritable_cache_is_skipped(self, tmp_path, monkeypatch):
+        """A cache directory that cannot be created does not fail the analysis."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        monkeypatch.setattr(calibrate_prosodic, "RESULT_CACHE_DIR", blocker / "cache")
+        monkeypatch.setattr(
+            calibrate_prosodic, "_analyze_file_uncached", lambda _: ('ok', _fake_metrics(1.0), "")
+        )
+        path = tmp_path / "clip.wav"
+        sf.write(path, _voiced_clip(16000, 0.5, seed=0), 16000)
+
+        assert _analyze_file(path) == ('ok', _fake_metrics(1.0), "")
+
+    def test_missing_file_reports_failure(self, tmp_path, cache_dir):
+        """A file deleted before analysis is a failed sample, not an exception."""
+        status, metrics, _ = _analyze_file(tmp_path / "gone.wav")
+
+        assert status == 'failed'
+        assert metrics is None
+
+
+class TestAnalyzeOrganicSamples:
+    """Test suite for analyze_organic_samples."""
+
+    def test_walk_finds_audio_files_in_order(self, tmp_path, monkeypatch):
+        """One recursive walk picks up audio files by extension, case-insensitively."""
+        (tmp_path / "b" / "deep").mkdir(parents=True)
+        (tmp_path / "dir.wav").mkdir()
+        for name in ["b/deep/z.WAV", "a.flac", "b/c.ogg", "notes.txt", "b/m.mp3"]:
+            (tmp_path / name).write_bytes(b"")
+        seen = []
+
+        def record(filepath, use_cache=True, rebuild_cache=False):
+            seen.append(filepath.relative_to(tmp_path).as_posix())
+            return 'ok', _fake_metrics(1.0), ""
+
+        monkeypatch.setattr(calibrate_prosodic, "_analyze_file", record)
+        stats = analyze_organic_samples(tmp_path, workers=1)
+
+        assert seen == ["a.flac", "b/c.ogg", "b/deep/z.WAV", "b/m.mp3"]
+        assert stats['num_samples'] == 4
+
+    def test_process_pool_matches_in_process(self, tmp_path):
+        """Pool workers produce the same statistics as in-process analysis."""
+        for seed in range(3):
+            sf.write(tmp_path / f"clip{seed}.wav", _voiced_clip(16000, 3.0, seed), 16000)
+
+        pooled = analyze_organic_samples(tmp_path, workers=2, use_cache=False)
+        serial = analyze_organic_samples(tmp_path, workers=1, use_cache=False)
+
+        assert pooled is not None
+        assert pooled == serial
+
+    def test_early_stop_once_ci_is_narrow(self, tmp_path, monkeypatch):
+        """The scan stops at a CI check once the P95 interval is narrow enough."""
+        for i in range(10):
+            (tmp_path / f"clip{i}.wav").write_bytes(b"")
+        monkeypatch.setattr(calibrate_prosodic, "CI_CHECK_INTERVAL", 4)
+        monkeypatch.setattr(
+            calibrate_prosodic, "_analyze_file",
+            lambda filepath, **_: ('ok', _fake_metrics(1.0), ""),
+        )
+
+        stopped = analyze_organic_samples(tmp_path, workers=1, p95_ci_width=0.5)
+        full = analyze_organic_samples(tmp_path, workers=1)
+
+        assert stopped['stopped_early'] is True
+        assert stopped['num_samples'] == 4
+        assert full['stopped_early'] is False
+        assert full['num_samples'] == 10
+
+    def test_p95_bootstrap_ci(self):
+        """The bootstrap interval brackets the sample P95 and is reproducible."""
+        values = np.random.default_rng(0).gamma(2.0, 1.0, 500)
+
+        lo, hi = p95_bootstrap_ci(values)
+
+        assert lo <= np.quantile(values, 0.95) <= hi
+        assert (lo, hi) == p95_bootstrap_ci(values)
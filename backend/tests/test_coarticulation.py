@@ -0,0 +1,154 @@
+"""
+Tests for CoarticulationSensor formant extraction and transition analysis.
+"""
+
+import numpy as np
+import pytest
+from backend.sensors.coarticulation import (
+    CoarticulationSensor,
+    _levinson_durbin_batch,
+    _transition_durations,
+)
+
+
+def _vowel_clip(sr: int, duration: float, seed: int) -> np.ndarray:
+    """Gliding two-formant vowel-like signal with silent gaps and light noise."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(sr * duration)) / sr
+    f1 = 500 + 200 * np.sin(2 * np.pi * 1.5 * t)
+    f2 = 1500 + 400 * np.sin(2 * np.pi * 0.7 * t + 1.0)
+    audio = (
+        0.3 * np.sin(2 * np.pi * np.cumsum(f1) / sr)
+        + 0.2 * np.sin(2 * np.pi * np.cumsum(f2) / sr)
+        + 0.01 * rng.standard_normal(len(t))
+    )
+    audio[int(0.4 * sr):int(0.6 * sr)] = 0.0  # silent gap
+    return audio
+
+
+def _reference_levinson(autocorr: np.ndarray, order: int) -> np.ndarray:
+    """Original scalar Levinson-Durbin recursion."""
+    lpc = np.zeros(order + 1)
+    lpc[0] = 1.0
+    error = autocorr[0]
+    for k in range(order):
+        if error == 0:
+            break
+        reflection = autocorr[k + 1]
+        for j in range(1, k + 1):
+            reflection -= lpc[j] * autocorr[k + 1 - j]
+        reflection /= error
+        lpc[k + 1] = reflection
+        for j in range(1, (k + 2) // 2 + 1):
+            temp = lpc[j]
+            lpc[j] = temp - reflection * lpc[k + 1 - j]
+            if j != k + 1 - j:
+                lpc[k + 1 - j] -= reflection * temp
+        error *= 1 - reflection * reflection
+    return lpc
+
+
+def _reference_trajectories(sensor: CoarticulationSensor, audio: np.ndarray, sr: int):
+    """Original per-frame implementation (np.roots, scalar Levinson-Durbin)."""
+    frame_length = int(sensor.frame_length_ms * sr / 1000)
+    hop_length = int(sensor.hop_length_ms * sr / 1000)
+    lpc_order = sr // 1000 + 2
+    trajectories = []
+    for i in range(0, len(audio) - frame_length + 1, hop_length):
+        windowed = audio[i:i + frame_length] * np.hamming(frame_length)
+        if np.max(np.abs(windowed)) < 0.01:
+            continue
+        n = len(windowed)
+        spectrum = np.fft.fft(np.pad(windowed, (0, n)))
+        autocorr = np.real(np.fft.ifft(spectrum * np.conj(spectrum)))[:lpc_order + 1]
+        roots = np.roots(_reference_levinson(autocorr, lpc_order))
+        angles = np.angle(roots[np.abs(roots) < 1.0])
+        formants = np.sort(angles[angles > 0] * sr / (2 * np.pi))
+        formants = formants[(formants > 50) & (formants < 5000)].tolist()
+        defaults = [500.0, 1500.0, 2500.0]
+        while len(formants) < sensor.n_formants:
+            formants.append(defaults[min(len(formants), len(defaults) - 1)])
+        trajectories.append(formants[:sensor.n_formants])
+    return np.array(trajectories)
+
+
+class TestCoarticulationSensor:
+    """Test suite for CoarticulationSensor."""
+
+    @pytest.mark.parametrize("sr", [16000, 44100, 48000])
+    @pytest.mark.parametrize("seed", range(3))
+    def test_trajectories_match_reference(self, seed, sr):
+        """Framed formant extraction matches a per-frame reference implementation."""
+        sensor = CoarticulationSensor()
+        audio = _vowel_clip(sr, 1.5, seed)
+
+        trajectories = sensor._extract_formant_trajectories(audio, sr)
+        expected = _reference_trajectories(sensor, audio, sr)
+
+        assert trajectories.shape == expected.shape
+        # At 44.1/48kHz the LPC order is ~50 and pole angles are ill-conditioned:
+        # batched float64 LPC differs by a few Hz (float32 framing by kHz)
+        rtol = 1e-3 if sr <= 22050 else 5e-3
+        np.testing.assert_allclose(trajectories, expected, rtol=rtol, atol=0.5)
+
+    def test_levinson_batch_matches_scalar(self):
+        """Batched Levinson-Durbin matches the scalar recursion row by row."""
+        rng = np.random.default_rng(0)
+        frames = rng.standard_normal((20, 400))
+        autocorr = np.array([np.correlate(f, f, mode='full')[399:399 + 19] for f in frames])
+        autocorr[3] = 0.0  # zero prediction error: recursion stops immediately
+
+        lpc = _levinson_durbin_batch(autocorr, 18)
+
+        expected = np.array([_reference_levinson(a, 18) for a in autocorr])
+        np.testing.assert_allclose(lpc, expected, rtol=1e-9, atol=1e-12)
+
+    def test_transition_smoothness_matches_corrcoef_loop(self):
+        """Vectorized rolling correlation matches per-window np.corrcoef."""
+        sensor = CoarticulationSensor()
+        f1 = np.round(np.random.default_rng(1).normal(600, 80, 60))
+        f1[10:17] = 550.0  # constant stretch: windows without a defined correlation
+        formants = np.column_stack([f1, f1 + 900])
+
+        expected = []
+        for i in range(len(f1) - 5):
+            w1, w2 = f1[i:i + 5], f1[i + 1:i + 6]
+            if np.std(w1) > 0 and np.std(w2) > 0:
+                expected.append(np.corrcoef(w1, w2)[0, 1])
+
+        _, continuity = sensor._analyze_transition_smoothness(formants)
+        assert continuity == pytest.approx(np.mean(expected), abs=1e-12)
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_transition_durations_match_lookback_loop(self, seed):
+        """Vectorized transition-duration search matches the per-transition scan."""
+        f1 = np.cumsum(np.random.default_rng(seed).normal(0, 40, 80)) + 600
+        f1_diff = np.abs(np.diff(f1))
+        threshold = np.percentile(f1_diff, 75)
+        transition_indices = np.where(f1_diff > threshold)[0]
+
+        expected = []
+        for idx in transition_indices:
+            start_idx = idx
+            for i in range(idx - 1, max(0, idx - 10), -1):
+                if f1_diff[i] < threshold * 0.3:
+                    start_idx = i
+                    break
+            expected.append(idx - start_idx)
+
+        durations = _transition_durations(f1_diff, transition_indices, threshold * 0.3)
+        np.testing.assert_array_equal(durations, expected)
+
+    def test_silent_audio_has_no_trajectories(self):
+        """All-silent input yields no formant trajectory."""
+        sensor = CoarticulationSensor()
+        assert sensor._extract_formant_trajectories(np.zeros(16000), 16000) is None
+
+    def test_analyze_returns_scored_result(self):
+        """analyze() produces a bounded score with formant metadata."""
+        sensor = CoarticulationSensor()
+        result = sensor.analyze(_vowel_clip(16000, 1.5, seed=0), 16000)
+
+        assert result.reason != "ERROR"
+        assert 0.0 <= result.value <= 1.0
+        assert "formant_continuity" in result.metadata
@@ -12,7 +12,7 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from detection import DetectionPipeline, get_pipeline, convert_numpy_types
+from detection import DetectionPipeline, get_pipeline, get_shared_pipeline, convert_numpy_types
 from detection.config import DetectionConfig
 
 
@@ -390,6 +390,16 @@ class TestGetPipeline:
         pipeline2 = get_pipeline()
         assert pipeline1 is pipeline2
 
+    def test_get_shared_pipeline_cached_per_mode(self):
+        """Test get_shared_pipeline caches one instance per demo_mode."""
+        prod1 = get_shared_pipeline(demo_mode=False)
+        prod2 = get_shared_pipeline(demo_mode=False)
+        demo = get_shared_pipeline(demo_mode=True)
+        assert prod1 is prod2
+        assert prod1 is not demo
+        assert prod1.config.demo_mode is False
+        assert demo.config.demo_mode is True
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
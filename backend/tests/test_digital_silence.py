@@ -0,0 +1,164 @@
+"""
+Tests for DigitalSilenceSensor noise-floor, spectral-flux and room-tone analysis.
+"""
+
+import numpy as np
+import pytest
+from scipy import signal
+from backend.sensors import digital_silence
+from backend.sensors.digital_silence import (
+    DigitalSilenceSensor,
+    _hann,
+    _room_tone_signature,
+    _stft_magnitude,
+)
+
+
+def _reference_rms_db(sensor: DigitalSilenceSensor, audio: np.ndarray, sr: int) -> np.ndarray:
+    """Original per-hop RMS loop."""
+    frame_length = int(sensor.frame_length_ms * sr / 1000.0)
+    hop_length = int(sensor.hop_length_ms * sr / 1000.0)
+    rms_values = []
+    for i in range(0, len(audio) - frame_length, hop_length):
+        rms = float(np.sqrt(np.mean(audio[i:i + frame_length] ** 2)))
+        rms_values.append(20 * np.log10(max(rms, 1e-10)))
+    return np.array(rms_values)
+
+
+class TestDigitalSilenceSensor:
+    """Test suite for DigitalSilenceSensor."""
+
+    @pytest.mark.parametrize("n_samples", [16000, 16400, 16401, 12345])
+    def test_noise_floor_matches_loop(self, n_samples):
+        """Strided noise-floor RMS matches the per-hop loop, including the frame count."""
+        sensor = DigitalSilenceSensor()
+        sr = 16000
+        audio = 0.05 * np.random.default_rng(n_samples).standard_normal(n_samples)
+        audio[4000:6000] = 0.0  # digital silence
+
+        expected = _reference_rms_db(sensor, audio, sr)
+        result = sensor._analyze_noise_floor(audio, sr)
+
+        assert result["perfect_silence_count"] == int(np.sum(expected < -120.0))
+        assert result["noise_floor_variance"] == pytest.approx(np.var(expected), rel=1e-9)
+        assert result["min_noise_floor_db"] == pytest.approx(np.min(expected))
+
+    def test_noise_floor_single_frame_input(self):
+        """Input no longer than one frame yields the empty result."""
+        sensor = DigitalSilenceSensor()
+        result = sensor._analyze_noise_floor(np.ones(400), 16000)
+
+        assert result["perfect_silence_count"] == 0
+        assert result["has_zero_variance"] is False
+
+    @pytest.mark.parametrize("n_samples", [2048, 16000, 16001, 12345])
+    @pytest.mark.parametrize("nperseg, hop_length", [(400, 160), (2048, 160), (400, 400)])
+    def test_stft_magnitude_matches_scipy(self, n_samples, nperseg, hop_length):
+        """Strided rfft magnitude matches scipy.signal.stft up to its window-sum scaling."""
+        audio = np.random.default_rng(n_samples).standard_normal(n_samples)
+        _, _, zxx = signal.stft(audio, 16000, nperseg=nperseg, noverlap=nperseg - hop_length)
+
+        magnitude = _stft_magnitude(audio, nperseg, hop_length) / np.sum(_hann(nperseg))
+
+        np.testing.assert_allclose(magnitude, np.abs(zxx).T, rtol=1e-9, atol=1e-12)
+
+    def test_room_tone_signature_matches_librosa(self):
+        """Direct centroid/flatness match librosa's features on the same frames."""
+        librosa = pytest.importorskip("librosa")
+        audio = 0.01 * np.random.default_rng(0).standard_normal(20000)
+        audio[5000:12000] = 0.0  # includes all-zero frames
+        magnitude = np.abs(librosa.stft(y=audio, n_fft=2048, hop_length=512))
+        freqs = librosa.fft_frequencies(sr=16000, n_fft=2048)
+
+        centroid, flatness = _room_tone_signature(magnitude.T, freqs)
+
+        assert centroid == pytest.approx(
+            np.mean(librosa.feature.spectral_centroid(S=magnitude, sr=16000)), rel=1e-9
+        )
+        assert flatness == pytest.approx(np.mean(librosa.feature.spectral_flatness(S=magnitude)), rel=1e-9)
+
+
+def _spliced_clip(sr: int, duration: float, seed: int) -> np.ndarray:
+    """Tone bursts separated by gaps of alternating room tone and digital silence."""
+    rng = np.random.default_rng(seed)
+    audio = np.zeros(int(sr * duration))
+    for i in range(int(duration)):
+        burst = slice(i * sr, i * sr + sr // 2)
+        gap = slice(i * sr + sr // 2, (i + 1) * sr)
+        audio[burst] = 0.3 * np.sin(2 * np.pi * (150 + 30 * i) * np.arange(sr // 2) / sr)
+        audio[gap] = (0.002 if i % 3 else 0.0) * rng.standard_normal(sr // 2)
+    return audio
+
+
+class TestDigitalSilenceBatch:
+    """Test suite for DigitalSilenceSensor.analyze_batch."""
+
+    def test_batch_matches_single_clip_analysis(self):
+        """Shared-spectrogram batch analysis reproduces per-clip results."""
+        sensor = DigitalSilenceSensor()
+        sr = 16000
+        clips = [
+            _spliced_clip(sr, 6.0, seed=1),
+            _spliced_clip(sr, 4.0, seed=2)[:-37],  # length off the hop grid
+            0.01 * np.random.default_rng(3).standard_normal(3 * sr),
+        ]
+
+        batch = sensor.analyze_batch(clips, [sr] * len(clips))
+        single = [sensor.analyze(c, sr) for c in clips]
+
+        assert len(batch) == len(clips)
+        for b, s in zip(batch, single):
+            assert b.value == s.value
+            assert b.metadata == s.metadata
+
+    def test_batch_keeps_early_results_in_order(self):
+        """Invalid and too-short clips get their early result without breaking alignment."""
+        sensor = DigitalSilenceSensor()
+        sr = 16000
+
+        results = sensor.analyze_batch(
+            [np.array([]), np.ones(1000), _spliced_clip(sr, 3.0, seed=4)], [sr, sr, sr]
+        )
+
+        assert results[0].detail == "Invalid or empty audio input."
+        assert "too short" in results[1].detail
+        assert results[2].metadata is not None
+
+    def test_batch_length_mismatch(self):
+        """Mismatched audios and samplerates are rejected."""
+        with pytest.raises(ValueError):
+            DigitalSilenceSensor().analyze_batch([np.zeros(4096)], [16000, 16000])
+
+
+class TestDigitalSilenceStreaming:
+    """Test suite for block-wise processing of long clips."""
+
+    @pytest.mark.parametrize("block_seconds", [1.0, 0.37])
+    def test_streamed_matches_in_memory(self, monkeypatch, block_seconds):
+        """Block-wise flux, quiet-region RMS and room tone reproduce the full-clip results."""
+        pytest.importorskip("librosa")
+        sensor = DigitalSilenceSensor()
+        sr = 16000
+        audio = _spliced_clip(sr, 6.3, seed=5).astype(np.float32)
+
+        expected = sensor._analyze_prepared(audio, sr)
+        expected_rms = sensor._quiet_frame_rms(audio, sr)
+        monkeypatch.setattr(digital_silence, "STREAM_BLOCK_SECONDS", block_seconds)
+        assert sensor._is_streamed(audio, sr)
+        result = sensor._analyze_prepared(audio, sr)
+
+        np.testing.assert_array_equal(sensor._quiet_frame_rms(audio, sr), expected_rms)
+        assert result.value == expected.value
+        assert result.metadata == expected.metadata
+
+    def test_batch_analyzes_long_clips_on_their_own(self, monkeypatch):
+        """Long clips in a batch take the block-wise path and keep their position."""
+        sensor = DigitalSilenceSensor()
+        sr = 16000
+        clips = [_spliced_clip(sr, 3.0, seed=6), _spliced_clip(sr, 5.0, seed=7)]
+        monkeypatch.setattr(digital_silence, "STREAM_BLOCK_SECONDS", 4.0)
+
+        batch = sensor.analyze_batch(clips, [sr, sr])
+
+        for b, clip in zip(batch, clips):
+            assert b.metadata == sensor.analyze(clip, sr).metadata
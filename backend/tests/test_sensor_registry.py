@@ -0,0 +1,118 @@
+"""
+Tests for parallel sensor execution in the sensor registry.
+"""
+
+import asyncio
+
+import numpy as np
+from backend.calibration.environment import EnvironmentAnalyzer
+from backend.sensors.base import BaseSensor, SensorResult
+from backend.sensors.registry import SensorRegistry, run_sensors_parallel
+
+
+class _PeakSensor(BaseSensor):
+    """Reports the peak absolute amplitude."""
+
+    def __init__(self):
+        super().__init__("Peak")
+
+    def analyze(self, audio_data, samplerate):
+        return SensorResult(sensor_name=self.name, value=float(np.max(np.abs(audio_data))))
+
+
+class _FailingSensor(BaseSensor):
+    """Always raises."""
+
+    def __init__(self):
+        super().__init__("Failing")
+
+    def analyze(self, audio_data, samplerate):
+        raise RuntimeError("boom")
+
+
+class _EnvSensor(BaseSensor):
+    """Reports the SNR it was handed (or computed itself)."""
+
+    uses_env_stats = True
+
+    def __init__(self, name="Env"):
+        super().__init__(name)
+        self.received = []
+
+    def analyze(self, audio_data, samplerate, env_stats=None):
+        self.received.append(env_stats)
+        if env_stats is None:
+            env_stats = EnvironmentAnalyzer.analyze(audio_data, samplerate)
+        return SensorResult(sensor_name=self.name, value=env_stats["snr_db"])
+
+
+def test_run_sensors_parallel_preserves_order():
+    """results[i][j] belongs to audios[i] and sensors[j]."""
+    audios = [np.full(100, 0.1 * (i + 1), dtype=np.float32) for i in range(4)]
+    results = run_sensors_parallel([_PeakSensor(), _PeakSensor()], audios, 16000, max_workers=3)
+
+    assert len(results) == 4
+    for i, row in enumerate(results):
+        assert [r.value for r in row] == [
+            np.float32(0.1 * (i + 1)),
+            np.float32(0.1 * (i + 1)),
+        ]
+
+
+def test_run_sensors_parallel_converts_exceptions():
+    """A failing sensor yields an ERROR result instead of aborting the batch."""
+    results = run_sensors_parallel([_FailingSensor(), _PeakSensor()], [np.ones(10)], 16000)
+
+    assert results[0][0].reason == "ERROR"
+    assert "boom" in results[0][0].detail
+    assert results[0][1].value == 1.0
+
+
+def test_env_stats_computed_once_per_clip(monkeypatch):
+    """Sensors that accept env_stats share one EnvironmentAnalyzer result per clip."""
+    calls = []
+    analyze = EnvironmentAnalyzer.analyze
+
+    def counting_analyze(audio, sr):
+        calls.append(len(audio))
+        return analyze(audio, sr)
+
+    monkeypatch.setattr(EnvironmentAnalyzer, "analyze", staticmethod(counting_analyze))
+    audios = [np.random.default_rng(i).standard_normal(8000) for i in range(2)]
+    first, second = _EnvSensor("A"), _EnvSensor("B")
+
+    results = run_sensors_parallel([first, _PeakSensor(), second], audios, 16000, max_workers=2)
+
+    assert calls == [8000, 8000]
+    assert all(env is not None for env in first.received + second.received)
+    for row in results:
+        assert row[0].value == row[2].value
+
+
+def test_analyze_all_passes_env_stats():
+    """analyze_all hands env_stats only to sensors that declare support."""
+    registry = SensorRegistry()
+    env_sensor = _EnvSensor()
+    registry.register(env_sensor)
+    registry.register(_PeakSensor())
+
+    results = asyncio.run(registry.analyze_all(np.random.default_rng(0).standard_normal(8000), 16000))
+
+    assert env_sensor.received[0] is not None
+    assert results["Peak"].reason is None
+
+
+def test_run_sensors_parallel_in_processes():
+    """The process pool reads clips from shared memory and keeps the result layout."""
+    audios = [np.full(100, 0.1 * (i + 1), dtype=np.float32) for i in range(3)]
+    audios.append(np.random.default_rng(0).standard_normal(8000))
+
+    results = run_sensors_parallel(
+        [_PeakSensor(), _FailingSensor(), _EnvSensor()], audios, 16000, max_workers=2, use_processes=True
+    )
+    expected = run_sensors_parallel([_PeakSensor(), _FailingSensor(), _EnvSensor()], audios, 16000)
+
+    assert len(results) == 4
+    for row, expected_row in zip(results, expected):
+        assert [r.value for r in row] == [r.value for r in expected_row]
+        assert row[1].reason == "ERROR"
@@ -0,0 +1,22 @@
+"""
+Tests for the lazy exports of the backend.sensors package.
+"""
+
+import backend.sensors as sensors
+
+
+def test_huggingface_availability_flag():
+    """HUGGINGFACE_AVAILABLE resolves, with the exports set to None when unavailable."""
+    assert isinstance(sensors.HUGGINGFACE_AVAILABLE, bool)
+    assert hasattr(sensors, "HuggingFaceDetectorSensor")
+    if not sensors.HUGGINGFACE_AVAILABLE:
+        assert sensors.HuggingFaceSpeakerEmbedding is None
+        assert sensors.HF_SUPPORTED_MODELS == {}
+
+
+def test_star_import_resolves_all_exports():
+    """Every name in __all__ is importable through a star-import."""
+    namespace = {}
+    exec("from backend.sensors import *", namespace)
+
+    assert set(sensors.__all__) <= set(namespace)
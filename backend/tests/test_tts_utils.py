@@ -5,8 +5,9 @@ Tests for TTS utilities API key handling and error recovery.
 import pytest
 import sys
 import os
+import asyncio
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,7 +16,9 @@ from scripts.tts_utils import (
     load_env_file,
     check_tts_dependencies,
     generate_elevenlabs,
-    generate_openai
+    generate_openai,
+    generate_elevenlabs_async,
+    generate_batch
 )
 
 
@@ -64,6 +67,20 @@ class TestLoadEnvFile:
 class TestCheckTtsDependencies:
     """Test TTS dependency checking."""
     
+    @pytest.fixture(autouse=True)
+    def clear_dependency_cache(self):
+        """Results are cached per process; reset around each test."""
+        check_tts_dependencies.cache_clear()
+        yield
+        check_tts_dependencies.cache_clear()
+    
+    def test_check_dependencies_cached(self):
+        """Repeated calls return the same read-only result."""
+        first = check_tts_dependencies()
+        assert check_tts_dependencies() is first
+        with pytest.raises(TypeError):
+            first['openai'] = True
+    
     def test_check_dependencies_all_available(self):
         """Test when all dependencies are available."""
         with patch('scripts.tts_utils.requests'):
@@ -110,7 +127,7 @@ class TestGenerateElevenlabs:
         filename = str(tmp_path / "test.mp3")
         
         with patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"}):
-            with patch('builtins.__import__', side_effect=ImportError):
+            with patch('scripts.tts_utils.requests', None):
                 result = generate_elevenlabs("test text", filename)
                 assert result is False
     
@@ -124,8 +141,8 @@ class TestGenerateElevenlabs:
         mock_response.text = "Unauthorized"
         
         with patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"}):
-            with patch('scripts.tts_utils.requests') as mock_requests:
-                mock_requests.post.return_value = mock_response
+            with patch('scripts.tts_utils._get_tts_session') as mock_session:
+                mock_session.return_value.post.return_value = mock_response
                 result = generate_elevenlabs("test text", filename)
                 assert result is False
     
@@ -134,8 +151,8 @@ class TestGenerateElevenlabs:
         filename = str(tmp_path / "test.mp3")
         
         with patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"}):
-            with patch('scripts.tts_utils.requests') as mock_requests:
-                mock_requests.post.side_effect = TimeoutError("Request timed out")
+            with patch('scripts.tts_utils._get_tts_session') as mock_session:
+                mock_session.return_value.post.side_effect = TimeoutError("Request timed out")
                 result = generate_elevenlabs("test text", filename, timeout=1)
                 assert result is False
     
@@ -145,14 +162,16 @@ class TestGenerateElevenlabs:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b"fake audio content"
+        mock_response.iter_content.return_value = [b"fake audio ", b"content"]
         
         with patch.dict(os.environ, {"ELEVENLABS_API_KEY": "test_key"}):
-            with patch('scripts.tts_utils.requests') as mock_requests:
-                mock_requests.post.return_value = mock_response
+            with patch('scripts.tts_utils._get_tts_session') as mock_session:
+                mock_session.return_value.post.return_value = mock_response
                 result = generate_elevenlabs("test text", filename)
                 assert result is True
-                assert os.path.exists(filename)
+                with open(filename, "rb") as f:
+                    assert f.read() == b"fake audio content"
+                mock_response.close.assert_called_once()
     
     def test_generate_elevenlabs_custom_api_key(self, tmp_path):
         """Test using custom API key parameter."""
@@ -160,10 +179,10 @@ class TestGenerateElevenlabs:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b"fake audio content"
+        mock_response.iter_content.return_value = [b"fake audio content"]
         
-        with patch('scripts.tts_utils.requests') as mock_requests:
-            mock_requests.post.return_value = mock_response
+        with patch('scripts.tts_utils._get_tts_session') as mock_session:
+            mock_session.return_value.post.return_value = mock_response
             result = generate_elevenlabs("test text", filename, api_key="custom_key")
             assert result is True
 
@@ -233,5 +252,66 @@ class TestGenerateOpenai:
             mock_openai.assert_called_once_with(api_key="custom_key")
 
 
+class _FakeStream:
+    """Minimal stand-in for the httpx streaming response context manager."""
+    
+    def __init__(self, status_code, chunks=(), text=""):
+        self.status_code = status_code
+        self.text = text
+        self._chunks = chunks
+        self.aread = AsyncMock()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def aiter_bytes(self, chunk_size=None):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class TestAsyncGeneration:
+    """Test async batch TTS generation."""
+    
+    def test_generate_elevenlabs_async_success(self, tmp_path):
+        """Test successful async ElevenLabs call streams chunks to the file."""
+        filename = tmp_path / "test.mp3"
+        
+        client = Mock()
+        client.stream = Mock(return_value=_FakeStream(200, [b"fake audio ", b"content"]))
+        
+        async def run():
+            return await generate_elevenlabs_async(
+                "test text", str(filename), client, asyncio.Semaphore(2), api_key="key"
+            )
+        
+        assert asyncio.run(run()) is True
+        assert filename.read_bytes() == b"fake audio content"
+    
+    def test_generate_elevenlabs_async_api_error(self, tmp_path):
+        """Test async ElevenLabs API error returns False."""
+        client = Mock()
+        client.stream = Mock(return_value=_FakeStream(429, text="Too Many Requests"))
+        
+        async def run():
+            return await generate_elevenlabs_async(
+                "test text", str(tmp_path / "test.mp3"), client, asyncio.Semaphore(2), api_key="key"
+            )
+        
+        assert asyncio.run(run()) is False
+    
+    def test_generate_batch_length_mismatch(self):
+        """Test batch rejects mismatched texts and filenames."""
+        with pytest.raises(ValueError):
+            asyncio.run(generate_batch(["a", "b"], ["a.mp3"]))
+    
+    def test_generate_batch_unknown_service(self):
+        """Test batch rejects unknown services."""
+        with pytest.raises(ValueError):
+            asyncio.run(generate_batch(["a"], ["a.mp3"], service="unknown"))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""
+Tests for the Silero path of the VoiceActivityDetector.
+"""
+
+import numpy as np
+import pytest
+
+from backend.sensors import vad
+from backend.sensors.vad import (
+    SILERO_CHUNK_SIZE,
+    SILERO_SAMPLE_RATE,
+    SILERO_STATE_SIZE,
+    SpeechSegment,
+    VoiceActivityDetector,
+    _silero_probabilities,
+)
+
+
+class RecordingSession:
+    """
+    Stand-in for the Silero ONNX session.
+
+    Speech probability is 1.0 for chunks with audible signal and 0.0 for
+    silence. Each call adds 1 to the LSTM state, so the state fed at step k
+    shows how many chunks were carried over.
+    """
+
+    def __init__(self):
+        self.feeds = []
+
+    def run(self, output_names, feeds):
+        self.feeds.append({name: np.array(value, copy=True) for name, value in feeds.items()})
+        chunk = feeds["input"]
+        out = (np.abs(chunk).max(axis=1, keepdims=True) > 0.01).astype(np.float32)
+        return out, feeds["h"] + 1, feeds["c"] + 1
+
+
+def _clip(num_chunks: int, speech_chunks) -> np.ndarray:
+    """Silence with a tone over the given [start, stop) chunk ranges."""
+    audio = np.zeros(num_chunks * SILERO_CHUNK_SIZE, dtype=np.float32)
+    for start, stop in speech_chunks:
+        n = (stop - start) * SILERO_CHUNK_SIZE
+        t = np.arange(n) / SILERO_SAMPLE_RATE
+        audio[start * SILERO_CHUNK_SIZE:stop * SILERO_CHUNK_SIZE] = 0.3 * np.sin(2 * np.pi * 220 * t)
+    return audio
+
+
+def _chunk_time(k: int) -> float:
+    return k * SILERO_CHUNK_SIZE / SILERO_SAMPLE_RATE
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Serve a RecordingSession in place of the ONNX model."""
+    stub = RecordingSession()
+    monkeypatch.setattr(vad, "_get_silero_session", lambda model_path: stub)
+    return stub
+
+
+class TestSileroProbabilities:
+    """Test suite for _silero_probabilities."""
+
+    def test_state_carries_across_chunks(self):
+        """Each chunk step is fed the state returned by the previous one."""
+        stub = RecordingSession()
+        clips = [_clip(5, [(1, 3)]), _clip(3, [(0, 3)])]
+
+        probs = _silero_probabilities(stub, clips)
+
+        assert len(stub.feeds) == 5
+        for k, feed in enumerate(stub.feeds):
+            assert feed["input"].shape == (2, SILERO_CHUNK_SIZE)
+            assert feed["h"].shape == (2, 2, SILERO_STATE_SIZE)
+            np.testing.assert_array_equal(feed["h"], k)
+            np.testing.assert_array_equal(feed["c"], k)
+            assert int(feed["sr"]) == SILERO_SAMPLE_RATE
+        np.testing.assert_array_equal(probs, [[0, 1, 1, 0, 0], [1, 1, 1, 0, 0]])
+
+    def test_state_resets_between_calls(self):
+        """A new batch of clips starts from a zero state."""
+        stub = RecordingSession()
+        _silero_probabilities(stub, [_clip(4, [(0, 4)])])
+        first_run = len(stub.feeds)
+
+        _silero_probabilities(stub, [_clip(2, [(0, 2)])])
+
+        np.testing.assert_array_equal(stub.feeds[first_run]["h"], 0)
+        np.testing.assert_array_equal(stub.feeds[first_run]["c"], 0)
+
+    def test_short_clips_are_zero_padded(self):
+        """Clips shorter than the longest one see silence after their end."""
+        stub = RecordingSession()
+        partial = _clip(3, [(0, 3)])[:SILERO_CHUNK_SIZE * 2 + 100]
+
+        _silero_probabilities(stub, [_clip(4, [(0, 4)]), partial])
+
+        last = stub.feeds[2]["input"][1]
+        assert np.any(last[:100])
+        np.testing.assert_array_equal(last[100:], 0)
+        np.testing.assert_array_equal(stub.feeds[3]["input"][1], 0)
+
+
+class TestDetectSpeechSegmentsBatch:
+    """Test suite for VoiceActivityDetector.detect_speech_segments_batch."""
+
+    def test_segments_per_clip_in_order(self, session):
+        """Each clip gets its own segments, in input order, empty clips included."""
+        clips = [
+            _clip(64, [(16, 48)]),
+            np.zeros(0, dtype=np.float32),
+            _clip(20, [(0, 10)]),
+            _clip(40, [(0, 10), (25, 40)]),
+        ]
+        detector = VoiceActivityDetector(use_silero=True)
+
+        results = detector.detect_speech_segments_batch(clips, SILERO_SAMPLE_RATE)
+
+        assert results == [
+            [SpeechSegment(_chunk_time(16), _chunk_time(48))],
+            [],
+            [SpeechSegment(0.0, _chunk_time(10))],
+            [SpeechSegment(0.0, _chunk_time(10)), SpeechSegment(_chunk_time(25), _chunk_time(40))],
+        ]
+        # Empty clips are not sent to the model; the rest share one batch
+        assert len(session.feeds) == 64
+        assert session.feeds[0]["input"].shape == (3, SILERO_CHUNK_SIZE)
+
+    def test_batch_matches_single_clip_calls(self, session):
+        """Batching clips gives the same segments as detecting them one at a time."""
+        clips = [_clip(30, [(5, 20)]), _clip(50, [(0, 12), (30, 45)])]
+        detector = VoiceActivityDetector(use_silero=True)
+
+        batched = detector.detect_speech_segments_batch(clips, SILERO_SAMPLE_RATE)
+        single = [detector.detect_speech_segments(clip, SILERO_SAMPLE_RATE) for clip in clips]
+
+        assert batched == single
+
+    def test_energy_fallback_without_session(self, monkeypatch):
+        """Without a loadable model each clip uses the energy-based detector."""
+        monkeypatch.setattr(vad, "_get_silero_session", lambda model_path: None)
+        clips = [_clip(30, [(5, 20)]), _clip(20, [(0, 10)])]
+        detector = VoiceActivityDetector(use_silero=True)
+
+        results = detector.detect_speech_segments_batch(clips, SILERO_SAMPLE_RATE)
+
+        assert results == [detector._detect_energy_based(clip, SILERO_SAMPLE_RATE) for clip in clips]
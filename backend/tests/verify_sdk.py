@@ -14,7 +14,7 @@ def test_sdk_initialization():
     assert client.session.headers["X-API-Key"] == "test-key"
     print("SDK Initialization Passed.")
 
-@patch('requests.Session.post')
+@patch('httpx.Client.post')
 def test_sdk_authentication(mock_post):
     print("Testing SDK Authentication...")
     client = SonotheiaClient(base_url="http://test.com", api_key="test-key")
@@ -34,10 +34,18 @@ def test_sdk_authentication(mock_post):
     mock_post.assert_called_once()
     print("SDK Authentication Passed.")
 
+def test_sdk_context_manager_closes_session():
+    print("Testing SDK context manager...")
+    with SonotheiaClient(base_url="http://test.com") as client:
+        assert not client.session.is_closed
+    assert client.session.is_closed
+    print("SDK context manager Passed.")
+
 if __name__ == "__main__":
     try:
         test_sdk_initialization()
         test_sdk_authentication()
+        test_sdk_context_manager_closes_session()
         print("\nAll SDK tests passed!")
     except Exception as e:
         print(f"\nSDK Verification Failed: {e}")
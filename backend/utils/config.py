@@ -5,6 +5,8 @@ Loads sensor thresholds and other settings from config/settings.yaml.
 Provides default values if config file is not found or values are missing.
 """
 
+import copy
+import functools
 import logging
 import threading
 from pathlib import Path
@@ -42,6 +44,9 @@ def load_settings(reload: bool = False) -> Dict[str, Any]:
         if _settings_cache is not None and not reload:
             return _settings_cache
 
+        # Merged thresholds are derived from the settings being replaced
+        _merged_sensor_thresholds.cache_clear()
+
         settings: Dict[str, Any] = {}
 
         if SETTINGS_FILE.exists():
@@ -67,6 +72,17 @@ def get_sensor_thresholds() -> Dict[str, Any]:
     Returns:
         Dictionary of sensor thresholds with defaults.
     """
+    return copy.deepcopy(_merged_sensor_thresholds())
+
+
+@functools.lru_cache(maxsize=1)
+def _merged_sensor_thresholds() -> Dict[str, Any]:
+    """
+    Build the defaults-merged threshold table once per loaded settings.
+
+    Sensor modules call get_threshold() for every constant at import, so the
+    merge is memoized and cleared whenever settings are reloaded.
+    """
     settings = load_settings()
     # Support both "sensors" (new standard) and "sensor_thresholds" (legacy)
     sensor_config = settings.get("sensors", {}) or settings.get("sensor_thresholds", {})
@@ -150,7 +166,7 @@ def get_threshold(sensor_name: str, threshold_name: str, default: Any = None) ->
     Returns:
         Threshold value or default.
     """
-    thresholds = get_sensor_thresholds()
+    thresholds = _merged_sensor_thresholds()
     sensor_thresholds = thresholds.get(sensor_name, {})
 
     if isinstance(sensor_thresholds, dict):